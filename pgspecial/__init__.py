@@ -1,6 +1,3 @@
-import importlib.metadata
-
-__version__ = importlib.metadata.version("pgspecial")
 __all__ = []
 
 
@@ -11,4 +8,20 @@ def export(defn):
     return defn
 
 
-from . import dbcommands, iocommands  # noqa
+def __getattr__(name):
+    # Imported on first use: importlib.metadata and asyncio take longer to
+    # import than the rest of pgspecial.
+    if name == "__version__":
+        import importlib.metadata
+
+        global __version__
+        __version__ = importlib.metadata.version("pgspecial")
+        return __version__
+    if name == "AsyncPGSpecial":
+        from . import aio
+
+        return aio.AsyncPGSpecial
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+from . import catalogcache, dbcommands, instrumentation, iocommands  # noqa
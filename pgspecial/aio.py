@@ -0,0 +1,169 @@
+import asyncio
+import inspect
+import sys
+import time
+from contextlib import contextmanager
+
+from . import export
+from .instrumentation import _command_stats, _InstrumentedAsyncCursor
+from .main import PGSpecial, _call_handler, _current_special, _materialize
+
+
+@export
+class AsyncPGSpecial(PGSpecial):
+    """PGSpecial for psycopg.AsyncCursor.
+
+    `execute` is a coroutine with the same (title, rows, headers, status)
+    results as PGSpecial.execute.
+
+    Handlers registered as coroutine functions are awaited with the
+    AsyncCursor itself, and their results are returned as they are: rows
+    may be the AsyncCursor, to be read with `async for`. The regular
+    handlers run in a worker thread with asyncio.to_thread(), talking to the
+    server through the event loop, so they never block it and many sessions
+    can share one process. Their rows are always lists, fetched in that
+    thread.
+
+    Cancelling `execute` while a regular handler runs doesn't stop the
+    thread: it goes on using the connection until the handler returns, so
+    the connection must not be used, or closed, before then. Use
+    command_timeout to bound how long that takes.
+    """
+
+    async def execute(self, cur, sql):
+        special_cmd, command, verbose, pattern = self._find_command(sql)
+
+        if inspect.iscoroutinefunction(special_cmd.handler):
+            token = _current_special.set(self)
+            try:
+                if self.command_hook is not None:
+                    return await self._run_instrumented_coroutine(special_cmd, command, cur, sql, verbose, pattern)
+                return await _call_handler(special_cmd, cur, sql, verbose, pattern)
+            finally:
+                _current_special.reset(token)
+
+        sync_cur = None if cur is None else _SyncCursor(cur, asyncio.get_running_loop())
+        return await asyncio.to_thread(self._execute_sync, sync_cur, special_cmd, command, sql, verbose, pattern)
+
+    async def _run_instrumented_coroutine(self, special_cmd, command, cur, sql, verbose, pattern):
+        counter = None if cur is None else _InstrumentedAsyncCursor(cur)
+        start = time.perf_counter()
+        try:
+            results = await _call_handler(special_cmd, cur if counter is None else counter, sql, verbose, pattern)
+            # Hand back the cursor itself rather than the counting one.
+            if counter is not None:
+                results = [(title, cur if rows is counter else rows, headers, status) for title, rows, headers, status in results or ()]
+            return results
+        finally:
+            self.command_hook(_command_stats(command, pattern, verbose, time.perf_counter() - start, counter))
+
+    def _execute_sync(self, cur, special_cmd, command, sql, verbose, pattern):
+        results = self._run_command(special_cmd, command, cur, sql, verbose, pattern)
+        # Rows may be lazy, and fetching them has to happen in this thread.
+        return _materialize(results)
+
+
+class _SyncCursor(object):
+    """Blocking view of an AsyncCursor, for handlers running outside the
+    event loop thread."""
+
+    def __init__(self, cur, loop):
+        self._cur = cur
+        self._loop = loop
+
+    def __getattr__(self, name):
+        # description, rowcount, statusmessage, ...
+        return getattr(self._cur, name)
+
+    def _wait(self, coro):
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    @property
+    def connection(self):
+        return _SyncConnection(self._cur.connection, self._wait)
+
+    def execute(self, query, params=None, **kwargs):
+        self._wait(self._cur.execute(query, params, **kwargs))
+        return self
+
+    def fetchone(self):
+        return self._wait(self._cur.fetchone())
+
+    def fetchmany(self, size=0):
+        return self._wait(self._cur.fetchmany(size))
+
+    def fetchall(self):
+        return self._wait(self._cur.fetchall())
+
+    def __iter__(self):
+        while True:
+            row = self.fetchone()
+            if row is None:
+                return
+            yield row
+
+    @contextmanager
+    def copy(self, statement, params=None, **kwargs):
+        async_copy = self._cur.copy(statement, params, **kwargs)
+        copy = self._wait(async_copy.__aenter__())
+        try:
+            yield _SyncCopy(copy, self._wait)
+        except BaseException:
+            if not self._wait(async_copy.__aexit__(*sys.exc_info())):
+                raise
+        else:
+            self._wait(async_copy.__aexit__(None, None, None))
+
+
+class _SyncConnection(object):
+    """Blocking view of an AsyncConnection."""
+
+    def __init__(self, conn, wait):
+        self._conn = conn
+        self._wait = wait
+
+    def __getattr__(self, name):
+        # info, autocommit, cancel(), ...
+        return getattr(self._conn, name)
+
+    def execute(self, query, params=None, **kwargs):
+        return self._wait(self._conn.execute(query, params, **kwargs))
+
+    @contextmanager
+    def transaction(self, *args, **kwargs):
+        async_transaction = self._conn.transaction(*args, **kwargs)
+        transaction = self._wait(async_transaction.__aenter__())
+        try:
+            yield transaction
+        except BaseException:
+            if not self._wait(async_transaction.__aexit__(*sys.exc_info())):
+                raise
+        else:
+            self._wait(async_transaction.__aexit__(None, None, None))
+
+
+class _SyncCopy(object):
+    """Blocking view of an AsyncCopy."""
+
+    def __init__(self, copy, wait):
+        self._copy = copy
+        self._wait = wait
+
+    def write(self, buffer):
+        self._wait(self._copy.write(buffer))
+
+    def write_row(self, row):
+        self._wait(self._copy.write_row(row))
+
+    def read(self):
+        return self._wait(self._copy.read())
+
+    def read_row(self):
+        return self._wait(self._copy.read_row())
+
+    def __iter__(self):
+        while True:
+            data = self.read()
+            if not data:
+                return
+            yield data
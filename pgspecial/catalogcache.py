@@ -0,0 +1,89 @@
+import logging
+import re
+import time
+
+from . import export
+
+log = logging.getLogger(__name__)
+
+# Statements that may change what the listings show, or which schemas they
+# are resolved against: DDL, DO blocks and procedures that may run some,
+# settings such as search_path, and rollbacks that undo DDL. This errs on the
+# side of invalidating too often: a false positive only costs one extra query.
+# Block comments before the statement are skipped, line comments end before
+# the ^ of the next line.
+DDL_RE = re.compile(
+    r"(^|;)\s*(/\*.*?\*/\s*)*(create|alter|drop|comment|grant|revoke|security\s+label|import\s+foreign\s+schema"
+    r"|do|call|set|reset|discard|rollback|abort)\b",
+    re.IGNORECASE | re.MULTILINE | re.DOTALL,
+)
+
+
+@export
+class CatalogCache(object):
+    """Memoizes the output of catalog listings such as \\dt and \\d.
+
+    Results are kept per server, database and search_path. The cache only
+    watches the statements passed to `PGSpecial.execute`: the whole cache is
+    dropped when one of them looks like DDL or changes a setting. Nothing is
+    sent to the server to validate a hit, so changes made by other sessions,
+    or by functions called from plain queries, are only seen after `clear()`
+    or once the results are older than `max_age` seconds. With max_age=None
+    they are kept until clear().
+
+    Output that depends on table data isn't cached: the verbose listings with
+    their sizes, and the description of sequences with their current values.
+
+    Attach an instance to `PGSpecial.catalog_cache` to enable it.
+    """
+
+    commands = frozenset(("\\d", "describe", "\\dt", "\\dn", "\\df", "\\dT"))
+
+    def __init__(self, max_age=30):
+        self.results = {}
+        self.max_age = max_age
+        self.hits = 0
+        self.misses = 0
+        self.volatile = False
+
+    def handles(self, command, verbose=False):
+        return not verbose and command in self.commands
+
+    def note_volatile(self):
+        """Called by handlers while they run when their output depends on
+        table data, so that it isn't cached."""
+        self.volatile = True
+
+    def note_query(self, sql):
+        """Invalidate the cache if `sql` may change the catalog."""
+        if self.results and DDL_RE.search(sql):
+            log.debug("Catalog cache invalidated by DDL.")
+            self.clear()
+
+    def clear(self):
+        self.results.clear()
+
+    def fetch(self, cur, key, run):
+        """Return the cached results for `key`, calling `run()` on a miss.
+
+        The results are materialized, so cursors returned by the handler are
+        consumed here and replaced with lists of rows.
+        """
+        info = cur.connection.info
+        # search_path is only reported by PostgreSQL 18+. On older servers,
+        # SET search_path is caught by note_query().
+        key = (info.host, info.port, info.dbname, info.parameter_status("search_path")) + key
+        now = time.monotonic()
+        try:
+            created, results = self.results[key]
+            if self.max_age is not None and now - created > self.max_age:
+                raise KeyError(key)
+        except KeyError:
+            self.misses += 1
+            self.volatile = False
+            results = [(title, None if rows is None else list(rows), headers, status) for title, rows, headers, status in run()]
+            if not self.volatile:
+                self.results[key] = (now, results)
+        else:
+            self.hits += 1
+        return list(results)
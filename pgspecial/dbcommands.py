@@ -1,12 +1,12 @@
 from __future__ import unicode_literals
+import functools
+import itertools
 import logging
-import shlex
-import subprocess
+import re
 from collections import namedtuple
 
-from psycopg.sql import SQL
-
-from .main import special_command
+from .main import current_option, special_command, statement_timeout
+from .templates import query_templates
 
 TableInfo = namedtuple(
     "TableInfo",
@@ -28,9 +28,28 @@ TableInfo = namedtuple(
 log = logging.getLogger(__name__)
 
 
+# psycopg.sql is only imported when the first query is composed, so that
+# importing pgspecial stays cheap for code that never runs a command.
+def SQL(obj):
+    from psycopg.sql import SQL
+
+    return SQL(obj)
+
+
+def Identifier(*strings):
+    from psycopg.sql import Identifier
+
+    return Identifier(*strings)
+
+
+def Literal(obj):
+    from psycopg.sql import Literal
+
+    return Literal(obj)
+
+
 @special_command("\\l", "\\l[+] [pattern]", "List databases.", aliases=("\\list",))
 def list_databases(cur, pattern, verbose):
-    params = {}
     query = SQL(
         """SELECT d.datname as name,
         pg_catalog.pg_get_userbyid(d.datdba) as owner,
@@ -44,45 +63,119 @@ def list_databases(cur, pattern, verbose):
         {pattern_where}
         ORDER BY 1"""
     )
-    if verbose:
-        params["verbose_fields"] = SQL(
-            """,
+    params = {}
+    if pattern:
+        _, params["datname"] = sql_name_pattern(pattern)
+        pattern_where = SQL("""WHERE d.datname ~ %(datname)s""")
+    else:
+        pattern_where = SQL("")
+
+    def format_query(approximate):
+        fields = {"pattern_where": pattern_where}
+        if verbose:
+            fields["verbose_fields"] = SQL(
+                """,
             CASE WHEN pg_catalog.has_database_privilege(d.datname, 'CONNECT')
-                    THEN pg_catalog.pg_size_pretty(pg_catalog.pg_database_size(d.datname))
+                    THEN {size}
                     ELSE 'No Access'
             END as size,
             t.spcname as "Tablespace",
             pg_catalog.shobj_description(d.oid, 'pg_database') as description"""
-        )
-        params["verbose_tables"] = SQL("""JOIN pg_catalog.pg_tablespace t on d.dattablespace = t.oid""")
-    else:
-        params["verbose_fields"] = SQL("")
-        params["verbose_tables"] = SQL("")
+            ).format(size=SQL(_APPROXIMATE_DATABASE_SIZE if approximate else _DATABASE_SIZE))
+            fields["verbose_tables"] = SQL("""JOIN pg_catalog.pg_tablespace t on d.dattablespace = t.oid""")
+        else:
+            fields["verbose_fields"] = SQL("")
+            fields["verbose_tables"] = SQL("")
+        return query.format(**fields)
 
-    if pattern:
-        _, schema = sql_name_pattern(pattern)
-        params["pattern_where"] = SQL("""WHERE d.datname ~ {}""").format(schema)
-    else:
-        params["pattern_where"] = SQL("")
-    formatted_query = query.format(**params)
-    log.debug(formatted_query.as_string(cur))
-    cur.execute(formatted_query)
+    approximate = _execute_sized(cur, verbose, format_query, params)
     if cur.description:
         headers = [titleize(x.name) for x in cur.description]
-        return [(None, cur, headers, cur.statusmessage)]
+        return [(None, cur, headers, _sizes_status(cur.statusmessage, approximate))]
     else:
         return [(None, None, None, cur.statusmessage)]
 
 
+_DATABASE_SIZE = "pg_catalog.pg_size_pretty(pg_catalog.pg_database_size(d.datname))"
+
+# The pages of the relations of the current database, as of their last
+# VACUUM or ANALYZE. The catalogs of the other databases can't be read from
+# here, so their size is left out.
+_APPROXIMATE_DATABASE_SIZE = """CASE WHEN d.datname = pg_catalog.current_database()
+                    THEN pg_catalog.pg_size_pretty((SELECT pg_catalog.sum(relpages)::int8
+                                                    FROM pg_catalog.pg_class
+                                                    WHERE NOT relisshared)
+                                                   * pg_catalog.current_setting('block_size')::int8)
+                    END"""
+
+
+def _execute_sized(cur, verbose, format_query, params, execute=None):
+    """
+    Runs the listing `format_query(approximate)` composes, with exact or
+    estimated sizes. Returns whether the sizes are estimates.
+
+    The sizes are estimated when `approximate_sizes` is set, or when the
+    exact ones take longer than `size_timeout` seconds to measure.
+    `execute(query)` runs the query, by default with cur.execute().
+    """
+    if execute is None:
+
+        def execute(query):
+            cur.execute(query, params, prepare=True)
+
+    approximate = verbose and current_option("approximate_sizes", False)
+    timeout = current_option("size_timeout")
+    if verbose and not approximate and timeout:
+        from psycopg.errors import QueryCanceled
+
+        query = format_query(False)
+        log.debug("%s, %s", query.as_string(cur), params)
+        try:
+            with statement_timeout(cur, timeout):
+                execute(query)
+            return False
+        except QueryCanceled:
+            log.info("Sizes took longer than %s s to measure, estimating them instead.", timeout)
+            approximate = True
+
+    query = format_query(approximate)
+    log.debug("%s, %s", query.as_string(cur), params)
+    execute(query)
+    return approximate
+
+
+def _sizes_status(status, approximate):
+    if approximate:
+        return "{} (sizes are estimates)".format(status) if status else "Sizes are estimates."
+    return status
+
+
 @special_command("\\du", "\\du[+] [pattern]", "List roles.")
 def list_roles(cur, pattern, verbose):
     """
     Returns (title, rows, headers, status)
     """
 
+    params = {}
+    server_version = cur.connection.info.server_version
+    if pattern and server_version > 90000:
+        _, params["rolname"] = sql_name_pattern(pattern)
+
+    formatted_query = query_templates.get(
+        ("\\du", server_version, verbose, bool(params)),
+        lambda: _list_roles_query(server_version, verbose, bool(params)),
+    )
+    log.debug("%s, %s", formatted_query.as_string(cur), params)
+    cur.execute(formatted_query, params, prepare=True)
+    if cur.description:
+        headers = [x.name for x in cur.description]
+        return [(None, cur, headers, cur.statusmessage)]
+
+
+def _list_roles_query(server_version, verbose, has_pattern):
     params = {}
 
-    if cur.connection.info.server_version > 90000:
+    if server_version > 90000:
         sql = SQL(
             """
             SELECT r.rolname,
@@ -121,18 +214,12 @@ def list_roles(cur, pattern, verbose):
             """
         )
 
-    if pattern:
-        _, schema = sql_name_pattern(pattern)
-        params["pattern"] = SQL("WHERE r.rolname ~ {}").format(schema)
+    if has_pattern:
+        params["pattern"] = SQL("WHERE r.rolname ~ %(rolname)s")
     else:
         params["pattern"] = SQL("")
 
-    formatted_query = sql.format(**params)
-    log.debug(formatted_query.as_string(cur))
-    cur.execute(formatted_query)
-    if cur.description:
-        headers = [x.name for x in cur.description]
-        return [(None, cur, headers, cur.statusmessage)]
+    return sql.format(**params)
 
 
 @special_command("\\dp", "\\dp [pattern]", "List privileges.", aliases=("\\z",))
@@ -189,12 +276,19 @@ def list_privileges(cur, pattern, verbose):
     """
     )
 
+    params = {}
     if pattern:
-        schema, table = sql_name_pattern(pattern)
-        if table:
-            pattern = SQL(" AND c.relname OPERATOR(pg_catalog.~) {} COLLATE pg_catalog.default ").format(table)
-        if schema:
-            pattern += SQL(" AND n.nspname OPERATOR(pg_catalog.~) {} COLLATE pg_catalog.default ").format(schema)
+        name_pattern = parse_name_pattern(pattern)
+        regex_operator = "OPERATOR(pg_catalog.~)"
+        table_match = _name_match(params, "relname", name_pattern.relname, name_pattern.relname_literal, name_pattern.relname_prefix)
+        schema_match = _name_match(params, "nspname", name_pattern.schema, name_pattern.schema_literal, name_pattern.schema_prefix)
+        pattern = SQL("")
+        if table_match:
+            condition = _name_condition("c.relname", "relname", table_match, regex_operator)
+            pattern += SQL(" AND " + condition + (" COLLATE pg_catalog.default " if table_match == "~" else " "))
+        if schema_match:
+            condition = _name_condition("n.nspname", "nspname", schema_match, regex_operator)
+            pattern += SQL(" AND " + condition + (" COLLATE pg_catalog.default " if schema_match == "~" else " "))
     else:
         pattern = SQL(" AND pg_catalog.pg_table_is_visible(c.oid) ")
 
@@ -208,8 +302,8 @@ def list_privileges(cur, pattern, verbose):
 
     sql += where_clause + SQL(" ORDER BY 1, 2 ")
 
-    log.debug(sql.as_string(cur))
-    cur.execute(sql)
+    log.debug("%s, %s", sql.as_string(cur), params)
+    cur.execute(sql, params)
     if cur.description:
         headers = [titleize(x.name) for x in cur.description]
         return [(None, cur, headers, cur.statusmessage)]
@@ -300,8 +394,7 @@ def list_schemas(cur, pattern, verbose):
     sql = SQL(
         """SELECT n.nspname AS name, pg_catalog.pg_get_userbyid(n.nspowner) AS owner
                 {verbose}
-              FROM pg_catalog.pg_namespace n WHERE n.nspname
-                {pattern}
+              FROM pg_catalog.pg_namespace n WHERE {pattern}
               ORDER BY 1
               """
     )
@@ -313,15 +406,17 @@ def list_schemas(cur, pattern, verbose):
     else:
         params["verbose"] = SQL("")
 
-    if pattern:
-        _, schema = sql_name_pattern(pattern)
-        params["pattern"] = SQL("~ {}").format(schema)
+    name_pattern = parse_name_pattern(pattern)
+    values = {}
+    schema_match = _name_match(values, "nspname", name_pattern.relname, name_pattern.relname_literal, name_pattern.relname_prefix)
+    if schema_match:
+        params["pattern"] = SQL(_name_condition("n.nspname", "nspname", schema_match))
     else:
-        params["pattern"] = SQL("!~ '^pg_' AND n.nspname <> 'information_schema'")
+        params["pattern"] = SQL("n.nspname !~ '^pg_' AND n.nspname <> 'information_schema'")
 
     formatted_query = sql.format(**params)
-    log.debug(formatted_query.as_string(cur))
-    cur.execute(formatted_query)
+    log.debug("%s, %s", formatted_query.as_string(cur), values)
+    cur.execute(formatted_query, values)
     if cur.description:
         headers = [titleize(x.name) for x in cur.description]
         return [(None, cur, headers, cur.statusmessage)]
@@ -359,12 +454,13 @@ def list_extensions(cur, pattern, verbose):
                     AS object_description
             FROM    pg_catalog.pg_depend
             WHERE   refclassid = 'pg_catalog.pg_extension'::pg_catalog.regclass
-                    AND refobjid = {}
+                    AND refobjid = %(oid)s::pg_catalog.oid
                     AND deptype = 'e'
             ORDER BY 1"""
-        ).format(oid)
-        log.debug(sql.as_string(cur))
-        cur.execute(sql)
+        )
+        params = {"oid": oid}
+        log.debug("%s, %s", sql.as_string(cur), params)
+        cur.execute(sql, params, prepare=True)
 
         headers = [titleize(x.name) for x in cur.description]
         return cur, headers, cur.statusmessage
@@ -429,10 +525,151 @@ def list_objects(cur, pattern, verbose, relkinds):
     relkinds is a list of strings to filter pg_class.relkind
 
     """
-    schema_pattern, table_pattern = sql_name_pattern(pattern)
+    name_pattern = parse_name_pattern(pattern)
 
     params = {"relkind": relkinds}
-    if verbose:
+    schema_match = _name_match(params, "nspname", name_pattern.schema, name_pattern.schema_literal, name_pattern.schema_prefix)
+    table_match = _name_match(params, "relname", name_pattern.relname, name_pattern.relname_literal, name_pattern.relname_prefix)
+
+    page_size = current_option("listing_page_size")
+    if page_size:
+        return _list_objects_paginated(cur, params, verbose, schema_match, table_match, page_size)
+
+    server_version = cur.connection.info.server_version
+    approximate = _execute_sized(
+        cur,
+        verbose,
+        lambda approximate: query_templates.get(
+            ("list_objects", server_version, verbose, approximate, schema_match, table_match),
+            lambda: _list_objects_query(verbose, schema_match, table_match, approximate=approximate),
+        ),
+        params,
+    )
+
+    if cur.description:
+        headers = [titleize(x.name) for x in cur.description]
+        return [(None, cur, headers, _sizes_status(cur.statusmessage, approximate))]
+
+
+def _list_objects_paginated(cur, params, verbose, schema_match, table_match, page_size):
+    """
+    Returns the listing with rows fetched `page_size` at a time.
+
+    The listing runs once, in a cursor declared WITH HOLD on the server,
+    and each page is a FETCH from it, so the first rows can be shown right
+    away and at most one page is held in memory. The status is None since
+    the total isn't known up front.
+    """
+    from psycopg.pq import TransactionStatus
+
+    server_version = cur.connection.info.server_version
+    # Unique on the connection, in case a listing wasn't read to the end.
+    name = Identifier("pgspecial_listing_{}".format(next(_listing_cursors)))
+    fetch = SQL("FETCH FORWARD {} FROM {}").format(Literal(page_size), name)
+    page = []
+
+    def query(approximate):
+        listing = query_templates.get(
+            ("list_objects", server_version, verbose, approximate, schema_match, table_match),
+            lambda: _list_objects_query(verbose, schema_match, table_match, approximate=approximate),
+        )
+        return SQL("DECLARE {} NO SCROLL CURSOR WITH HOLD FOR {}").format(name, listing)
+
+    def declare(query):
+        # The first page is fetched within the size timeout too. In
+        # autocommit mode that's when the whole listing runs.
+        cur.execute(query, params)
+        cur.execute(fetch)
+        page[:] = cur.fetchall()
+
+    approximate = _execute_sized(cur, verbose, query, params, declare)
+    headers = [titleize(x.name) for x in cur.description]
+
+    def rows(page):
+        try:
+            while True:
+                yield from page
+                if len(page) < page_size:
+                    return
+                log.debug(fetch.as_string(cur))
+                cur.execute(fetch)
+                page = cur.fetchall()
+        finally:
+            # Unless a failed query left nothing to close.
+            if cur.connection.info.transaction_status in (TransactionStatus.IDLE, TransactionStatus.INTRANS):
+                cur.execute(SQL("CLOSE {}").format(name))
+
+    return [(None, rows(page), headers, _sizes_status(None, approximate))]
+
+
+_listing_cursors = itertools.count()
+
+
+# Names are at most NAMEDATALEN - 1 bytes. Longer values would be truncated
+# by the cast to name, and then match names they aren't equal to.
+_MAX_NAME_BYTES = 63
+
+
+def _name_match(params, key, regex, literal=None, prefix=None):
+    """
+    Plans the filter on one part of a parsed name pattern: adds its
+    parameters to `params` under `key` and returns how to filter.
+
+    "=" compares with a plain name and "prefix" looks up a range of names.
+    Both can use the name index of the catalog. "~" matches a regex and None
+    means there is nothing to filter on.
+    """
+    if literal is not None and len(literal.encode("utf-8")) <= _MAX_NAME_BYTES:
+        params[key] = literal
+        return "="
+    # Names compare byte by byte, so the names starting with `prefix` sort
+    # below the prefix with its last character incremented. Only an ASCII
+    # last character is sure to be a single byte in the server encoding.
+    if prefix and prefix[-1] < "\x7f" and len(prefix.encode("utf-8")) <= _MAX_NAME_BYTES:
+        params[key] = prefix
+        params[key + "_end"] = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+        return "prefix"
+    if regex:
+        params[key] = regex
+        return "~"
+    return None
+
+
+def _name_condition(column, key, match, regex_operator="~"):
+    """The condition on `column` for the `match` returned by _name_match."""
+    if match == "=":
+        return f"{column} = %({key})s::pg_catalog.name"
+    elif match == "prefix":
+        return f"{column} >= %({key})s::pg_catalog.name AND {column} < %({key}_end)s::pg_catalog.name"
+    return f"{column} {regex_operator} %({key})s"
+
+
+def _list_objects_query(verbose, schema_match, table_match, approximate=False):
+    """Compose the list_objects query. `schema_match` and `table_match` are
+    the operators returned by _name_match. `approximate` estimates the sizes
+    from pg_class."""
+    params = {}
+    if verbose and approximate:
+        # The pages of the relation, of its TOAST table and of the index of
+        # the TOAST table as of their last VACUUM or ANALYZE. A table that
+        # had neither (reltuples is -1 from PostgreSQL 14 on) may have any
+        # size, so none is shown.
+        params["verbose_columns"] = SQL(
+            """
+            ,CASE WHEN c.reltuples >= 0 OR c.relkind NOT IN ('r', 'm')
+                  THEN pg_catalog.pg_size_pretty(
+                    (c.relpages
+                     + COALESCE((SELECT t.relpages FROM pg_catalog.pg_class t
+                                 WHERE t.oid = c.reltoastrelid), 0)
+                     + COALESCE((SELECT pg_catalog.sum(t.relpages)
+                                 FROM pg_catalog.pg_index i
+                                      JOIN pg_catalog.pg_class t ON t.oid = i.indexrelid
+                                 WHERE i.indrelid = c.reltoastrelid), 0))::int8
+                    * pg_catalog.current_setting('block_size')::int8)
+             END as size,
+            pg_catalog.obj_description(c.oid, 'pg_class') as description """
+        )
+    elif verbose:
         params["verbose_columns"] = SQL(
             """
             ,pg_catalog.pg_size_pretty(pg_catalog.pg_table_size(c.oid)) as size,
@@ -456,15 +693,15 @@ def list_objects(cur, pattern, verbose, relkinds):
             FROM    pg_catalog.pg_class c
                     LEFT JOIN pg_catalog.pg_namespace n
                       ON n.oid = c.relnamespace
-            WHERE   c.relkind = ANY({relkind})
+            WHERE   c.relkind = ANY(%(relkind)s)
                 {schema_pattern}
                 {table_pattern}
             ORDER BY 1, 2
         """
     )
 
-    if schema_pattern:
-        params["schema_pattern"] = SQL(" AND n.nspname ~ {}").format(schema_pattern)
+    if schema_match:
+        params["schema_pattern"] = SQL(" AND " + _name_condition("n.nspname", "nspname", schema_match))
     else:
         params["schema_pattern"] = SQL(
             """
@@ -474,18 +711,12 @@ def list_objects(cur, pattern, verbose, relkinds):
             AND pg_catalog.pg_table_is_visible(c.oid) """
         )
 
-    if table_pattern:
-        params["table_pattern"] = SQL(" AND c.relname ~ {}").format(table_pattern)
+    if table_match:
+        params["table_pattern"] = SQL(" AND " + _name_condition("c.relname", "relname", table_match))
     else:
         params["table_pattern"] = SQL("")
 
-    formatted_query = sql.format(**params)
-    log.debug(formatted_query.as_string(cur))
-    cur.execute(formatted_query)
-
-    if cur.description:
-        headers = [titleize(x.name) for x in cur.description]
-        return [(None, cur, headers, cur.statusmessage)]
+    return sql.format(**params)
 
 
 @special_command("\\dt", "\\dt[+] [pattern]", "List tables.")
@@ -515,6 +746,26 @@ def list_indexes(cur, pattern, verbose):
 
 @special_command("\\df", "\\df[+] [pattern]", "List functions.")
 def list_functions(cur, pattern, verbose):
+    name_pattern = parse_name_pattern(pattern)
+    params = {}
+    schema_match = _name_match(params, "nspname", name_pattern.schema, name_pattern.schema_literal, name_pattern.schema_prefix)
+    func_match = _name_match(params, "proname", name_pattern.relname, name_pattern.relname_literal, name_pattern.relname_prefix)
+
+    server_version = cur.connection.info.server_version
+    sql = query_templates.get(
+        ("\\df", server_version, verbose, schema_match, func_match),
+        lambda: _list_functions_query(server_version, verbose, schema_match, func_match),
+    )
+
+    log.debug("%s, %s", sql, params)
+    cur.execute(sql, params, prepare=True)
+
+    if cur.description:
+        headers = [titleize(x.name) for x in cur.description]
+        return [(None, cur, headers, cur.statusmessage)]
+
+
+def _list_functions_query(server_version, verbose, schema_match, func_match):
     if verbose:
         verbose_columns = """
             ,CASE
@@ -532,7 +783,7 @@ def list_functions(cur, pattern, verbose):
     else:
         verbose_columns = verbose_table = ""
 
-    if cur.connection.info.server_version >= 110000:
+    if server_version >= 110000:
         sql = (
             """
             SELECT  n.nspname as schema,
@@ -557,7 +808,7 @@ def list_functions(cur, pattern, verbose):
             + """
             WHERE  """
         )
-    elif cur.connection.info.server_version > 90000:
+    elif server_version > 90000:
         sql = (
             """
             SELECT  n.nspname as schema,
@@ -604,35 +855,47 @@ def list_functions(cur, pattern, verbose):
             WHERE  """
         )
 
-    schema_pattern, func_pattern = sql_name_pattern(pattern)
-    params = {}
-
-    if schema_pattern:
-        sql += " n.nspname ~ %(nspname)s "
-        params["nspname"] = schema_pattern
+    if schema_match:
+        sql += " " + _name_condition("n.nspname", "nspname", schema_match) + " "
     else:
         sql += " pg_catalog.pg_function_is_visible(p.oid) "
 
-    if func_pattern:
-        sql += " AND p.proname ~ %(proname)s "
-        params["proname"] = func_pattern
+    if func_match:
+        sql += " AND " + _name_condition("p.proname", "proname", func_match) + " "
 
-    if not (schema_pattern or func_pattern):
+    if not (schema_match or func_match):
         sql += """ AND n.nspname <> 'pg_catalog'
                    AND n.nspname <> 'information_schema' """
 
     sql += " ORDER BY 1, 2, 4"
+    return sql
 
-    log.debug("%s, %s", sql, params)
-    cur.execute(sql, params)
 
+@special_command("\\dT", "\\dT[S+] [pattern]", "List data types")
+def list_datatypes(cur, pattern, verbose):
+    name_pattern = parse_name_pattern(pattern)
+    params = {}
+    schema_match = _name_match(params, "nspname", name_pattern.schema, name_pattern.schema_literal, name_pattern.schema_prefix)
+    # Types are also matched by their SQL name, as in "integer", so the type
+    # part stays a regex.
+    type_pattern = name_pattern.relname
+    if type_pattern:
+        params["typname"] = type_pattern
+
+    server_version = cur.connection.info.server_version
+    sql = query_templates.get(
+        ("\\dT", server_version, verbose, schema_match, bool(type_pattern)),
+        lambda: _list_datatypes_query(server_version, verbose, schema_match, bool(type_pattern)),
+    )
+
+    log.debug("%s, %s", sql, params)
+    cur.execute(sql, params, prepare=True)
     if cur.description:
         headers = [titleize(x.name) for x in cur.description]
         return [(None, cur, headers, cur.statusmessage)]
 
 
-@special_command("\\dT", "\\dT[S+] [pattern]", "List data types")
-def list_datatypes(cur, pattern, verbose):
+def _list_datatypes_query(server_version, verbose, schema_match, has_type_pattern):
     sql = """SELECT n.nspname as schema,
                     pg_catalog.format_type(t.oid, NULL) AS name, """
 
@@ -660,7 +923,7 @@ def list_datatypes(cur, pattern, verbose):
         sql += """  pg_catalog.obj_description(t.oid, 'pg_type')
                         as description """
 
-    if cur.connection.info.server_version > 90000:
+    if server_version > 90000:
         sql += """  FROM    pg_catalog.pg_type t
                             LEFT JOIN pg_catalog.pg_namespace n
                               ON n.oid = t.typnamespace
@@ -682,30 +945,21 @@ def list_datatypes(cur, pattern, verbose):
                                 FROM pg_catalog.pg_class c
                                 WHERE c.oid = t.typrelid)) """
 
-    schema_pattern, type_pattern = sql_name_pattern(pattern)
-    params = {}
-
-    if schema_pattern:
-        sql += " AND n.nspname ~ %(nspname)s "
-        params["nspname"] = schema_pattern
+    if schema_match:
+        sql += " AND " + _name_condition("n.nspname", "nspname", schema_match) + " "
     else:
         sql += " AND pg_catalog.pg_type_is_visible(t.oid) "
 
-    if type_pattern:
+    if has_type_pattern:
         sql += """ AND (t.typname ~ %(typname)s
                         OR pg_catalog.format_type(t.oid, NULL) ~ %(typname)s) """
-        params["typname"] = type_pattern
 
-    if not (schema_pattern or type_pattern):
+    if not (schema_match or has_type_pattern):
         sql += """ AND n.nspname <> 'pg_catalog'
                    AND n.nspname <> 'information_schema' """
 
     sql += " ORDER BY 1, 2"
-    log.debug("%s, %s", sql, params)
-    cur.execute(sql, params)
-    if cur.description:
-        headers = [titleize(x.name) for x in cur.description]
-        return [(None, cur, headers, cur.statusmessage)]
+    return sql
 
 
 @special_command("\\dD", "\\dD[+] [pattern]", "List or describe domains.")
@@ -747,15 +1001,15 @@ def list_domains(cur, pattern, verbose):
            LEFT JOIN pg_catalog.pg_namespace AS n ON n.oid = t.typnamespace{extra_joins}
         WHERE t.typtype = 'd' """
 
-    schema_pattern, name_pattern = sql_name_pattern(pattern)
+    name_pattern = parse_name_pattern(pattern)
     params = {}
-    if schema_pattern or name_pattern:
-        if schema_pattern:
-            sql += " AND n.nspname ~ %(nspname)s"
-            params["nspname"] = schema_pattern
-        if name_pattern:
-            sql += " AND t.typname ~ %(typname)s"
-            params["typname"] = name_pattern
+    schema_match = _name_match(params, "nspname", name_pattern.schema, name_pattern.schema_literal, name_pattern.schema_prefix)
+    type_match = _name_match(params, "typname", name_pattern.relname, name_pattern.relname_literal, name_pattern.relname_prefix)
+    if schema_match or type_match:
+        if schema_match:
+            sql += " AND " + _name_condition("n.nspname", "nspname", schema_match)
+        if type_match:
+            sql += " AND " + _name_condition("t.typname", "typname", type_match)
     else:
         sql += """
           AND (n.nspname <> 'pg_catalog')
@@ -764,7 +1018,7 @@ def list_domains(cur, pattern, verbose):
 
     sql += " ORDER BY 1, 2"
     log.debug("%s, %s", sql, params)
-    cur.execute(sql, params)
+    cur.execute(sql, params, prepare=True)
     if cur.description:
         headers = [titleize(x.name) for x in cur.description]
         return [(None, cur, headers, cur.statusmessage)]
@@ -794,7 +1048,7 @@ def list_text_search_configurations(cur, pattern, verbose):
 
         sql += " ORDER BY 1, 2;"
         log.debug("%s, %s", sql, params)
-        cur.execute(sql, params)
+        cur.execute(sql, params, prepare=True)
         return cur.fetchall()
 
     def _fetch_oid_details(cur, oid):
@@ -821,7 +1075,7 @@ def list_text_search_configurations(cur, pattern, verbose):
         """
 
         log.debug("%s, %s", sql, params)
-        cur.execute(sql, params)
+        cur.execute(sql, params, prepare=True)
 
         headers = [titleize(x.name) for x in cur.description]
         return cur, headers, cur.statusmessage
@@ -867,7 +1121,7 @@ def list_text_search_configurations(cur, pattern, verbose):
 
     sql += " ORDER BY 1, 2"
     log.debug("%s, %s", sql, params)
-    cur.execute(sql, params)
+    cur.execute(sql, params, prepare=True)
     if cur.description:
         headers = [titleize(x.name) for x in cur.description]
         yield None, cur, headers, cur.statusmessage
@@ -885,19 +1139,19 @@ def describe_table_details(cur, pattern, verbose):
         return list_objects(cur, pattern, verbose, ["r", "p", "v", "m", "S", "f", ""])
 
     # This is a \d <tablename> command. A royal pain in the ass.
-    schema, relname = sql_name_pattern(pattern)
+    name_pattern = parse_name_pattern(pattern)
     where = []
     params = {}
 
-    if schema:
-        where.append("n.nspname ~ %(nspname)s")
-        params["nspname"] = schema
+    schema_match = _name_match(params, "nspname", name_pattern.schema, name_pattern.schema_literal, name_pattern.schema_prefix)
+    if schema_match:
+        where.append(_name_condition("n.nspname", "nspname", schema_match))
     else:
         where.append("pg_catalog.pg_table_is_visible(c.oid)")
 
-    if relname:
-        where.append("c.relname OPERATOR(pg_catalog.~) %(relname)s")
-        params["relname"] = relname
+    relname_match = _name_match(params, "relname", name_pattern.relname, name_pattern.relname_literal, name_pattern.relname_prefix)
+    if relname_match:
+        where.append(_name_condition("c.relname", "relname", relname_match, "OPERATOR(pg_catalog.~)"))
 
     sql = (
         """SELECT c.oid, n.nspname, c.relname
@@ -911,18 +1165,342 @@ def describe_table_details(cur, pattern, verbose):
     # Execute the sql, get the results and call describe_one_table_details on each table.
 
     log.debug("%s, %s", sql, params)
-    cur.execute(sql, params)
+    cur.execute(sql, params, prepare=True)
     if not (cur.rowcount > 0):
         return [(None, None, None, f"Did not find any relation named {pattern}.")]
 
+    relations = cur.fetchall()
+    if cur.connection.info.server_version < COMPOSITE_DESCRIBE_MIN_VERSION:
+        return [describe_one_table_details(cur, nspname, relname, oid, verbose) for oid, nspname, relname in relations]
+
+    # Describe the matches in batches rather than one query per relation,
+    # which adds up quickly for patterns like "public.*".
     results = []
-    for oid, nspname, relname in cur.fetchall():
-        results.append(describe_one_table_details(cur, nspname, relname, oid, verbose))
+    for i in range(0, len(relations), DESCRIBE_BATCH_SIZE):
+        batch = relations[i : i + DESCRIBE_BATCH_SIZE]
+        details = _fetch_table_details_batch(cur, [oid for oid, _, _ in batch], verbose)
+        for oid, nspname, relname in batch:
+            results.append(_describe_from_details(cur, nspname, relname, oid, details.get(oid), verbose))
 
     return results
 
 
 def describe_one_table_details(cur, schema_name, relation_name, oid, verbose):
+    """
+    Returns (title, rows, headers, status) for a single relation.
+
+    Servers that support it get the whole description in one round trip,
+    older ones fall back to the query-per-footer implementation.
+    """
+    if cur.connection.info.server_version >= COMPOSITE_DESCRIBE_MIN_VERSION:
+        details = _fetch_table_details(cur, oid, verbose)
+    else:
+        details = _fetch_table_details_sequential(cur, oid, verbose)
+    return _describe_from_details(cur, schema_name, relation_name, oid, details, verbose)
+
+
+def _describe_from_details(cur, schema_name, relation_name, oid, details, verbose):
+    if details is None:
+        return None, None, None, f"Did not find any relation with OID {oid}."
+
+    # If it's a seq, fetch it's value and store it for later.
+    if details["tableinfo"].relkind == "S":
+        catalog_cache = current_option("catalog_cache")
+        if catalog_cache is not None:
+            catalog_cache.note_volatile()
+        details["seq_values"] = _fetch_sequence_values(cur, schema_name, relation_name)
+        if details["seq_values"] is None:
+            return None, None, None, "Something went wrong."
+
+    return _format_table_details(schema_name, details, verbose)
+
+
+def _fetch_sequence_values(cur, schema_name, relation_name):
+    sql = SQL("SELECT * FROM {}.{}").format(Identifier(schema_name), Identifier(relation_name))
+    log.debug(sql.as_string(cur))
+    cur.execute(sql)
+    return cur.fetchone()
+
+
+# Minimum server version handled by the single round-trip describe query.
+COMPOSITE_DESCRIBE_MIN_VERSION = 120000
+
+# Maximum number of relations described by one composite query.
+DESCRIBE_BATCH_SIZE = 500
+
+# Footer sections of \d, as (name, condition, query) triples. Each query
+# describes the relation whose OID expression is substituted for {rel}, so it
+# can run on its own or be correlated with pg_class in the composite query.
+# The condition, evaluated against that pg_class row, skips sections that
+# can't apply to the relation kind.
+_TABLE_DETAILS_SECTIONS = [
+    (
+        "columns",
+        None,
+        """SELECT a.attname,
+                pg_catalog.format_type(a.atttypid, a.atttypmod) AS atttype,
+                (SELECT substring(pg_catalog.pg_get_expr(d.adbin, d.adrelid, true) for 128)
+                 FROM pg_catalog.pg_attrdef d
+                 WHERE d.adrelid = a.attrelid AND d.adnum = a.attnum AND a.atthasdef) AS attrdef,
+                a.attnotnull,
+                (SELECT co.collname FROM pg_catalog.pg_collation co, pg_catalog.pg_type t
+                 WHERE co.oid = a.attcollation
+                   AND t.oid = a.atttypid AND a.attcollation <> t.typcollation) AS attcollation,
+                a.attidentity,
+                a.attgenerated,
+                CASE WHEN ac.relkind IN ('i', 'I')
+                     THEN pg_catalog.pg_get_indexdef(a.attrelid, a.attnum, TRUE) END AS indexdef,
+                CASE WHEN ac.relkind <> 'f' THEN NULL
+                     WHEN a.attfdwoptions IS NULL THEN ''
+                     ELSE '(' || pg_catalog.array_to_string(ARRAY(
+                            SELECT pg_catalog.quote_ident(option_name) || ' ' || pg_catalog.quote_literal(option_value)
+                            FROM pg_catalog.pg_options_to_table(a.attfdwoptions)), ', ') || ')'
+                END AS attfdwoptions,
+                a.attstorage,
+                CASE WHEN a.attstattarget = -1 THEN NULL ELSE a.attstattarget END AS attstattarget,
+                pg_catalog.col_description(a.attrelid, a.attnum) AS attdescr
+         FROM pg_catalog.pg_attribute a
+         JOIN pg_catalog.pg_class ac ON ac.oid = a.attrelid
+         WHERE a.attrelid = {rel} AND a.attnum > 0 AND NOT a.attisdropped
+         ORDER BY a.attnum""",
+    ),
+    (
+        "index_info",
+        "c.relkind IN ('i', 'I')",
+        """SELECT i.indisunique,
+                i.indisprimary,
+                i.indisclustered,
+                i.indisvalid,
+                (NOT i.indimmediate) AND EXISTS (
+                    SELECT 1 FROM pg_catalog.pg_constraint
+                    WHERE conrelid = i.indrelid AND conindid = i.indexrelid
+                      AND contype IN ('p','u','x') AND condeferrable
+                ) AS condeferrable,
+                (NOT i.indimmediate) AND EXISTS (
+                    SELECT 1 FROM pg_catalog.pg_constraint
+                    WHERE conrelid = i.indrelid AND conindid = i.indexrelid
+                      AND contype IN ('p','u','x') AND condeferred
+                ) AS condeferred,
+                am.amname,
+                it.relname,
+                pg_catalog.pg_get_expr(i.indpred, i.indrelid, true) AS indpred
+         FROM pg_catalog.pg_index i
+         JOIN pg_catalog.pg_class ic ON ic.oid = i.indexrelid
+         JOIN pg_catalog.pg_class it ON it.oid = i.indrelid
+         JOIN pg_catalog.pg_am am ON am.oid = ic.relam
+         WHERE i.indexrelid = {rel}""",
+    ),
+    (
+        "seq_owner",
+        "c.relkind = 'S'",
+        """SELECT pg_catalog.quote_ident(n.nspname) || '.' ||
+                pg_catalog.quote_ident(dc.relname) || '.' ||
+                pg_catalog.quote_ident(a.attname) AS owned_by
+         FROM pg_catalog.pg_class dc
+         JOIN pg_catalog.pg_depend d ON dc.oid = d.refobjid
+         JOIN pg_catalog.pg_namespace n ON n.oid = dc.relnamespace
+         JOIN pg_catalog.pg_attribute a ON a.attrelid = dc.oid AND a.attnum = d.refobjsubid
+         WHERE d.classid = 'pg_catalog.pg_class'::pg_catalog.regclass
+           AND d.refclassid = 'pg_catalog.pg_class'::pg_catalog.regclass
+           AND d.objid = {rel} AND d.deptype = 'a'""",
+    ),
+    (
+        "indexes",
+        "c.relhasindex",
+        """SELECT ic.relname,
+                i.indisprimary,
+                i.indisunique,
+                i.indisclustered,
+                i.indisvalid,
+                pg_catalog.pg_get_indexdef(i.indexrelid, 0, true) AS indexdef,
+                pg_catalog.pg_get_constraintdef(con.oid, true) AS condef,
+                con.contype,
+                con.condeferrable,
+                con.condeferred,
+                ic.reltablespace
+         FROM pg_catalog.pg_index i
+         JOIN pg_catalog.pg_class ic ON ic.oid = i.indexrelid
+         LEFT JOIN pg_catalog.pg_constraint con
+                ON con.conrelid = i.indrelid
+               AND con.conindid = i.indexrelid
+               AND con.contype IN ('p','u','x')
+         WHERE i.indrelid = {rel}
+         ORDER BY i.indisprimary DESC, i.indisunique DESC, ic.relname""",
+    ),
+    (
+        "checks",
+        "c.relchecks > 0",
+        """SELECT r.conname, pg_catalog.pg_get_constraintdef(r.oid, true) AS condef
+         FROM pg_catalog.pg_constraint r
+         WHERE r.conrelid = {rel} AND r.contype = 'c'
+         ORDER BY 1""",
+    ),
+    (
+        "foreign_keys",
+        "c.relhastriggers",
+        """SELECT r.conname, pg_catalog.pg_get_constraintdef(r.oid, true) AS condef
+         FROM pg_catalog.pg_constraint r
+         WHERE r.conrelid = {rel} AND r.contype = 'f'
+         ORDER BY 1""",
+    ),
+    (
+        "referenced_by",
+        "c.relhastriggers",
+        """SELECT r.conrelid::pg_catalog.regclass::pg_catalog.text AS conrelid,
+                r.conname,
+                pg_catalog.pg_get_constraintdef(r.oid, true) AS condef
+         FROM pg_catalog.pg_constraint r
+         WHERE r.confrelid = {rel} AND r.contype = 'f'
+         ORDER BY r.conrelid::pg_catalog.regclass, r.conname""",
+    ),
+    (
+        "rules",
+        "c.relhasrules",
+        """SELECT r.rulename,
+                trim(trailing ';' from pg_catalog.pg_get_ruledef(r.oid, true)) AS ruledef,
+                r.ev_enabled
+         FROM pg_catalog.pg_rewrite r
+         WHERE r.ev_class = {rel}
+         ORDER BY 1""",
+    ),
+    (
+        "partition_of",
+        "c.relispartition",
+        """SELECT pg_catalog.quote_ident(np.nspname) || '.' ||
+                pg_catalog.quote_ident(cp.relname) || ' ' ||
+                pg_catalog.pg_get_expr(cc.relpartbound, cc.oid, true) AS partition_of,
+                pg_catalog.pg_get_partition_constraintdef(cc.oid) AS partition_constraint
+         FROM pg_catalog.pg_inherits i
+         JOIN pg_catalog.pg_class cp ON cp.oid = i.inhparent
+         JOIN pg_catalog.pg_namespace np ON np.oid = cp.relnamespace
+         JOIN pg_catalog.pg_class cc ON cc.oid = i.inhrelid
+         WHERE cc.oid = {rel}""",
+    ),
+    (
+        "partition_key",
+        "c.relkind = 'p'",
+        """SELECT pg_catalog.pg_get_partkeydef({rel}) AS partition_key""",
+    ),
+    (
+        "partitions",
+        "c.relkind = 'p'",
+        """SELECT pg_catalog.quote_ident(n.nspname) || '.' ||
+                pg_catalog.quote_ident(pc.relname) || ' ' ||
+                pg_catalog.pg_get_expr(pc.relpartbound, pc.oid, true) AS partition
+         FROM pg_catalog.pg_inherits i
+         JOIN pg_catalog.pg_class pc ON pc.oid = i.inhrelid
+         JOIN pg_catalog.pg_namespace n ON n.oid = pc.relnamespace
+         WHERE i.inhparent = {rel}
+         ORDER BY 1""",
+    ),
+    (
+        "triggers",
+        "c.relhastriggers",
+        """SELECT t.tgname, pg_catalog.pg_get_triggerdef(t.oid, true) AS tgdef, t.tgenabled
+         FROM pg_catalog.pg_trigger t
+         WHERE t.tgrelid = {rel} AND NOT t.tgisinternal
+         ORDER BY 1""",
+    ),
+    (
+        "foreign_server",
+        "c.relkind = 'f'",
+        """SELECT s.srvname,
+                pg_catalog.array_to_string(ARRAY(
+                    SELECT pg_catalog.quote_ident(option_name) || ' ' || pg_catalog.quote_literal(option_value)
+                    FROM pg_catalog.pg_options_to_table(f.ftoptions)), ', ') AS ftoptions
+         FROM pg_catalog.pg_foreign_table f
+         JOIN pg_catalog.pg_foreign_server s ON s.oid = f.ftserver
+         WHERE f.ftrelid = {rel}""",
+    ),
+    (
+        "inherits",
+        "c.relkind IN ('r', 'm', 'f') AND NOT c.relispartition",
+        """SELECT p.oid::pg_catalog.regclass::pg_catalog.text AS parent
+         FROM pg_catalog.pg_class p
+         JOIN pg_catalog.pg_inherits i ON p.oid = i.inhparent
+         WHERE i.inhrelid = {rel}
+         ORDER BY i.inhseqno""",
+    ),
+    (
+        "children",
+        "c.relkind IN ('r', 'm', 'f')",
+        """SELECT ch.oid::pg_catalog.regclass::pg_catalog.text AS child
+         FROM pg_catalog.pg_class ch
+         JOIN pg_catalog.pg_inherits i ON ch.oid = i.inhrelid
+         WHERE i.inhparent = {rel}
+         ORDER BY 1""",
+    ),
+]
+
+
+def _table_details_query(verbose):
+    """Build the single round-trip query behind \\d for an array of OIDs.
+
+    Every footer section is folded into a json_agg() column, so the server
+    returns one row per relation with everything _format_table_details()
+    needs.
+    """
+    if verbose:
+        reloptions = """pg_catalog.array_to_string(c.reloptions || array(select
+            'toast.' || x from pg_catalog.unnest(tc.reloptions) x), ', ')"""
+        view_def = "CASE WHEN c.relkind IN ('v', 'm') THEN pg_catalog.pg_get_viewdef(c.oid, true) END"
+    else:
+        reloptions = "''"
+        view_def = "NULL"
+
+    sections = []
+    for name, condition, query in _TABLE_DETAILS_SECTIONS:
+        section = f"(SELECT pg_catalog.json_agg(s) FROM ({query.format(rel='c.oid')}) s)"
+        if condition:
+            section = f"CASE WHEN {condition} THEN {section} END"
+        sections.append(f"{section} AS {name}")
+
+    return f"""SELECT c.oid, c.relchecks, c.relkind, c.relhasindex,
+                c.relhasrules, c.relhastriggers, false AS relhasoids,
+                {reloptions},
+                c.reltablespace,
+                CASE WHEN c.reloftype = 0 THEN ''
+                    ELSE c.reloftype::pg_catalog.regtype::pg_catalog.text
+                END,
+                c.relpersistence,
+                c.relispartition,
+                {view_def} AS view_def,
+                {", ".join(sections)}
+             FROM pg_catalog.pg_class c
+             LEFT JOIN pg_catalog.pg_class tc ON (c.reltoastrelid = tc.oid)
+             WHERE c.oid = ANY(%(oids)s::pg_catalog.oid[])"""
+
+
+def _table_details_from_row(row):
+    """Split a row of the composite describe query into footer sections."""
+    details = {"tableinfo": TableInfo._make(row[: len(TableInfo._fields)])}
+    details["view_def"] = row[len(TableInfo._fields)] or ""
+    sections = row[len(TableInfo._fields) + 1 :]
+    for (name, _, _), rows in zip(_TABLE_DETAILS_SECTIONS, sections):
+        if name == "columns":
+            details[name] = rows or []
+        else:
+            details[name] = [tuple(r.values()) for r in rows or ()]
+    return details
+
+
+def _fetch_table_details(cur, oid, verbose):
+    return _fetch_table_details_batch(cur, [oid], verbose).get(oid)
+
+
+def _fetch_table_details_batch(cur, oids, verbose):
+    """Returns a dict mapping each OID found to its \\d sections."""
+    server_version = cur.connection.info.server_version
+    sql = query_templates.get(("\\d", server_version, verbose), lambda: _table_details_query(verbose))
+    params = {"oids": oids}
+    log.debug("%s, %s", sql, params)
+    cur.execute(sql, params, prepare=True)
+    return {row[0]: _table_details_from_row(row[1:]) for row in cur.fetchall()}
+
+
+def _fetch_table_details_sequential(cur, oid, verbose):
+    """Fetch the \\d sections one query at a time, for servers the composite
+    query doesn't support."""
     if verbose and cur.connection.info.server_version >= 80200:
         suffix = """pg_catalog.array_to_string(c.reloptions || array(select
         'toast.' || x from pg_catalog.unnest(tc.reloptions) x), ', ')"""
@@ -946,7 +1524,7 @@ def describe_one_table_details(cur, schema_name, relation_name, oid, verbose):
                     c.relispartition
                  FROM pg_catalog.pg_class c
                  LEFT JOIN pg_catalog.pg_class tc ON (c.reltoastrelid = tc.oid)
-                 WHERE c.oid = '{oid}'"""
+                 WHERE c.oid = %(oid)s::pg_catalog.oid"""
 
     elif cur.connection.info.server_version > 90000:
         sql = f"""SELECT c.relchecks, c.relkind, c.relhasindex,
@@ -960,7 +1538,7 @@ def describe_one_table_details(cur, schema_name, relation_name, oid, verbose):
                     false as relispartition
                  FROM pg_catalog.pg_class c
                  LEFT JOIN pg_catalog.pg_class tc ON (c.reltoastrelid = tc.oid)
-                 WHERE c.oid = '{oid}'"""
+                 WHERE c.oid = %(oid)s::pg_catalog.oid"""
 
     elif cur.connection.info.server_version >= 80400:
         sql = f"""SELECT c.relchecks,
@@ -976,7 +1554,7 @@ def describe_one_table_details(cur, schema_name, relation_name, oid, verbose):
                     false as relispartition
                  FROM pg_catalog.pg_class c
                  LEFT JOIN pg_catalog.pg_class tc ON (c.reltoastrelid = tc.oid)
-                 WHERE c.oid = '{oid}'"""
+                 WHERE c.oid = %(oid)s::pg_catalog.oid"""
 
     else:
         sql = f"""SELECT c.relchecks,
@@ -992,27 +1570,19 @@ def describe_one_table_details(cur, schema_name, relation_name, oid, verbose):
                     false as relispartition
                  FROM pg_catalog.pg_class c
                  LEFT JOIN pg_catalog.pg_class tc ON (c.reltoastrelid = tc.oid)
-                 WHERE c.oid = '{oid}'"""
+                 WHERE c.oid = %(oid)s::pg_catalog.oid"""
 
     # Create a namedtuple called tableinfo and match what's in describe.c
 
-    log.debug(sql)
-    cur.execute(sql)
+    params = {"oid": oid}
+    log.debug("%s, %s", sql, params)
+    cur.execute(sql, params, prepare=True)
     if cur.rowcount > 0:
         tableinfo = TableInfo._make(cur.fetchone())
     else:
-        return None, None, None, f"Did not find any relation with OID {oid}."
-
-    # If it's a seq, fetch it's value and store it for later.
-    if tableinfo.relkind == "S":
-        # Do stuff here.
-        sql = f'''SELECT * FROM "{schema_name}"."{relation_name}"'''
-        log.debug(sql)
-        cur.execute(sql)
-        if not (cur.rowcount > 0):
-            return None, None, None, "Something went wrong."
+        return None
 
-        seq_values = cur.fetchone()
+    details = {"tableinfo": tableinfo}
 
     # Get column info
     cols = 0
@@ -1056,7 +1626,7 @@ def describe_one_table_details(cur, schema_name, relation_name, oid, verbose):
         if cur.connection.info.server_version >= 110000:
             sql += (
                 ",\n CASE WHEN a.attnum <= (SELECT i.indnkeyatts FROM pg_catalog.pg_index i "
-                f"WHERE i.indexrelid = '{oid}') THEN 'yes' ELSE 'no' END AS is_key"
+                "WHERE i.indexrelid = %(oid)s::pg_catalog.oid) THEN 'yes' ELSE 'no' END AS is_key"
             )
             att_cols["indexkey"] = cols
             cols += 1
@@ -1101,131 +1671,32 @@ def describe_one_table_details(cur, schema_name, relation_name, oid, verbose):
             att_cols["attdescr"] = cols
             cols += 1
 
-    sql += f""" FROM pg_catalog.pg_attribute a WHERE a.attrelid = '{oid}' AND
+    sql += """ FROM pg_catalog.pg_attribute a WHERE a.attrelid = %(oid)s::pg_catalog.oid AND
     a.attnum > 0 AND NOT a.attisdropped ORDER BY a.attnum; """
 
-    log.debug(sql)
-    cur.execute(sql)
-    res = cur.fetchall()
-
-    # Set the column names.
-    headers = ["Column", "Type"]
-
-    show_modifiers = False
-    if (
-        tableinfo.relkind == "r"
-        or tableinfo.relkind == "p"
-        or tableinfo.relkind == "v"
-        or tableinfo.relkind == "m"
-        or tableinfo.relkind == "f"
-        or tableinfo.relkind == "c"
-    ):
-        headers.append("Modifiers")
-        show_modifiers = True
-
-    if tableinfo.relkind == "S":
-        headers.append("Value")
-
-    if tableinfo.relkind == "i":
-        headers.append("Definition")
-
-    if tableinfo.relkind == "f":
-        headers.append("FDW Options")
-
-    if verbose:
-        headers.append("Storage")
-        if tableinfo.relkind == "r" or tableinfo.relkind == "m" or tableinfo.relkind == "f":
-            headers.append("Stats target")
-        #  Column comments, if the relkind supports this feature. */
-        if (
-            tableinfo.relkind == "r"
-            or tableinfo.relkind == "v"
-            or tableinfo.relkind == "m"
-            or tableinfo.relkind == "c"
-            or tableinfo.relkind == "f"
-        ):
-            headers.append("Description")
+    log.debug("%s, %s", sql, params)
+    cur.execute(sql, params, prepare=True)
+    details["columns"] = [{name: row[idx] for name, idx in att_cols.items()} for row in cur.fetchall()]
 
-    view_def = ""
+    details["view_def"] = ""
     # /* Check if table is a view or materialized view */
     if (tableinfo.relkind == "v" or tableinfo.relkind == "m") and verbose:
-        sql = f"""SELECT pg_catalog.pg_get_viewdef('{oid}'::pg_catalog.oid, true)"""
-        log.debug(sql)
-        cur.execute(sql)
+        sql = """SELECT pg_catalog.pg_get_viewdef(%(oid)s::pg_catalog.oid, true)"""
+        log.debug("%s, %s", sql, params)
+        cur.execute(sql, params, prepare=True)
         if cur.rowcount > 0:
-            (view_def,) = cur.fetchone()
-
-    # Prepare the cells of the table to print.
-    cells = []
-    for i, row in enumerate(res):
-        cell = []
-        cell.append(row[att_cols["attname"]])  # Column
-        cell.append(row[att_cols["atttype"]])  # Type
+            (details["view_def"],) = cur.fetchone()
 
-        if show_modifiers:
-            modifier = ""
-            if row[att_cols["attcollation"]]:
-                modifier += f" collate {row[att_cols['attcollation']]}"
-            if row[att_cols["attnotnull"]]:
-                modifier += " not null"
-            if row[att_cols["attrdef"]]:
-                modifier += f" default {row[att_cols['attrdef']]}"
-            if row[att_cols["attidentity"]] == "a":
-                modifier += " generated always as identity"
-            elif row[att_cols["attidentity"]] == "d":
-                modifier += " generated by default as identity"
-            elif row[att_cols["attgenerated"]] == "s":
-                modifier += f" generated always as ({row[att_cols['attrdef']]}) stored"
-            cell.append(modifier)
-
-        # Sequence
-        if tableinfo.relkind == "S":
-            cell.append(seq_values[i])
-
-        # Index column
-        if tableinfo.relkind == "i":
-            cell.append(row[att_cols["indexdef"]])
-
-        # /* FDW options for foreign table column, only for 9.2 or later */
-        if tableinfo.relkind == "f":
-            cell.append(att_cols["attfdwoptions"])
-
-        if verbose:
-            storage = row[att_cols["attstorage"]]
-
-            if storage[0] == "p":
-                cell.append("plain")
-            elif storage[0] == "m":
-                cell.append("main")
-            elif storage[0] == "x":
-                cell.append("extended")
-            elif storage[0] == "e":
-                cell.append("external")
-            else:
-                cell.append("???")
+    def fetch_section(name, sql):
+        log.debug("%s, %s", sql, params)
+        cur.execute(sql, params, prepare=True)
+        details[name] = cur.fetchall()
 
-            if tableinfo.relkind == "r" or tableinfo.relkind == "m" or tableinfo.relkind == "f":
-                cell.append(row[att_cols["attstattarget"]])
-
-            #  /* Column comments, if the relkind supports this feature. */
-            if (
-                tableinfo.relkind == "r"
-                or tableinfo.relkind == "v"
-                or tableinfo.relkind == "m"
-                or tableinfo.relkind == "c"
-                or tableinfo.relkind == "f"
-            ):
-                cell.append(row[att_cols["attdescr"]])
-        cells.append(cell)
-
-    # Make Footers
-
-    status = []
-    if tableinfo.relkind == "i":
-        # /* Footer information about an index */
+    if tableinfo.relkind == "i":
+        # /* Footer information about an index */
 
         if cur.connection.info.server_version > 90000:
-            sql = f"""SELECT i.indisunique,
+            sql = """SELECT i.indisunique,
                         i.indisprimary,
                         i.indisclustered,
                         i.indisvalid,
@@ -1253,12 +1724,12 @@ def describe_one_table_details(cur, schema_name, relation_name, oid, verbose):
                             pg_catalog.pg_class c2,
                             pg_catalog.pg_am a
                         WHERE i.indexrelid = c.oid
-                            AND c.oid = '{oid}'
+                            AND c.oid = %(oid)s::pg_catalog.oid
                             AND c.relam = a.oid
                             AND i.indrelid = c2.oid;
                 """
         else:
-            sql = f"""SELECT i.indisunique,
+            sql = """SELECT i.indisunique,
                         i.indisprimary,
                         i.indisclustered,
                         't' AS indisvalid,
@@ -1272,53 +1743,11 @@ def describe_one_table_details(cur, schema_name, relation_name, oid, verbose):
                             pg_catalog.pg_class c2,
                             pg_catalog.pg_am a
                         WHERE i.indexrelid = c.oid
-                            AND c.oid = '{oid}'
+                            AND c.oid = %(oid)s::pg_catalog.oid
                             AND c.relam = a.oid
                             AND i.indrelid = c2.oid;
                 """
-
-        log.debug(sql)
-        cur.execute(sql)
-
-        (
-            indisunique,
-            indisprimary,
-            indisclustered,
-            indisvalid,
-            deferrable,
-            deferred,
-            indamname,
-            indtable,
-            indpred,
-        ) = cur.fetchone()
-
-        if indisprimary:
-            status.append("primary key, ")
-        elif indisunique:
-            status.append("unique, ")
-        status.append(f"{indamname}, ")
-
-        # /* we assume here that index and table are in same schema */
-        status.append(f'''for table "{schema_name}.{indtable}"''')
-
-        if indpred:
-            status.append(f", predicate ({indpred})")
-
-        if indisclustered:
-            status.append(", clustered")
-
-        if not indisvalid:
-            status.append(", invalid")
-
-        if deferrable:
-            status.append(", deferrable")
-
-        if deferred:
-            status.append(", initially deferred")
-
-        status.append("\n")
-        # add_tablespace_footer(&cont, tableinfo.relkind,
-        # tableinfo.tablespace, true);
+        fetch_section("index_info", sql)
 
     elif tableinfo.relkind == "S":
         # /* Footer information about a sequence */
@@ -1335,27 +1764,16 @@ def describe_one_table_details(cur, schema_name, relation_name, oid, verbose):
             "\n a.attnum=d.refobjsubid)"
             "\nWHERE d.classid='pg_catalog.pg_class'::pg_catalog.regclass"
             "\n AND d.refclassid='pg_catalog.pg_class'::pg_catalog.regclass"
-            f"\n AND d.objid={oid} \n AND d.deptype='a'"
+            "\n AND d.objid=%(oid)s::pg_catalog.oid \n AND d.deptype='a'"
         )
-
-        log.debug(sql)
-        cur.execute(sql)
-        result = cur.fetchone()
-        if result:
-            status.append(f"Owned by: {result[0]}")
-
-        # /*
-        # * If we get no rows back, don't show anything (obviously). We should
-        # * never get more than one row back, but if we do, just ignore it and
-        # * don't print anything.
-        # */
+        fetch_section("seq_owner", sql)
 
     elif tableinfo.relkind == "r" or tableinfo.relkind == "p" or tableinfo.relkind == "m" or tableinfo.relkind == "f":
         # /* Footer information about a table */
 
         if tableinfo.hasindex:
             if cur.connection.info.server_version > 90000:
-                sql = f"""SELECT c2.relname,
+                sql = """SELECT c2.relname,
                                 i.indisprimary,
                                 i.indisunique,
                                 i.indisclustered,
@@ -1373,7 +1791,7 @@ def describe_one_table_details(cur, schema_name, relation_name, oid, verbose):
                         ON conrelid = i.indrelid
                             AND conindid = i.indexrelid
                             AND contype IN ('p','u','x')
-                        WHERE c.oid = '{oid}'
+                        WHERE c.oid = %(oid)s::pg_catalog.oid
                             AND c.oid = i.indrelid
                             AND i.indexrelid = c2.oid
                         ORDER BY i.indisprimary DESC,
@@ -1381,7 +1799,7 @@ def describe_one_table_details(cur, schema_name, relation_name, oid, verbose):
                             c2.relname;
                     """
             else:
-                sql = f"""SELECT c2.relname,
+                sql = """SELECT c2.relname,
                                 i.indisprimary,
                                 i.indisunique,
                                 i.indisclustered,
@@ -1398,65 +1816,14 @@ def describe_one_table_details(cur, schema_name, relation_name, oid, verbose):
                         LEFT JOIN pg_catalog.pg_constraint con
                         ON conrelid = i.indrelid
                             AND contype IN ('p','u','x')
-                        WHERE c.oid = '{oid}'
+                        WHERE c.oid = %(oid)s::pg_catalog.oid
                             AND c.oid = i.indrelid
                             AND i.indexrelid = c2.oid
                         ORDER BY i.indisprimary DESC,
                             i.indisunique DESC,
                             c2.relname;
                     """
-
-            log.debug(sql)
-            result = cur.execute(sql)
-
-            if cur.rowcount > 0:
-                status.append("Indexes:\n")
-            for row in cur:
-                # /* untranslated indextname */
-                status.append(f'''    "{row[0]}"''')
-
-                # /* If exclusion constraint, print the constraintdef */
-                if row[7] == "x":
-                    status.append(" ")
-                    status.append(row[6])
-                else:
-                    # /* Label as primary key or unique (but not both) */
-                    if row[1]:
-                        status.append(" PRIMARY KEY,")
-                    elif row[2]:
-                        if row[7] == "u":
-                            status.append(" UNIQUE CONSTRAINT,")
-                        else:
-                            status.append(" UNIQUE,")
-
-                    # /* Everything after "USING" is echoed verbatim */
-                    indexdef = row[5]
-                    usingpos = indexdef.find(" USING ")
-                    if usingpos >= 0:
-                        indexdef = indexdef[(usingpos + 7) :]
-                    status.append(f" {indexdef}")
-
-                    # /* Need these for deferrable PK/UNIQUE indexes */
-                    if row[8]:
-                        status.append(" DEFERRABLE")
-
-                    if row[9]:
-                        status.append(" INITIALLY DEFERRED")
-
-                # /* Add these for all cases */
-                if row[3]:
-                    status.append(" CLUSTER")
-
-                if not row[4]:
-                    status.append(" INVALID")
-
-                status.append("\n")
-                # printTableAddFooter(&cont, buf.data);
-
-                # /* Print tablespace of the index on the same line */
-                # add_tablespace_footer(&cont, 'i',
-                # atooid(PQgetvalue(result, i, 10)),
-                # false);
+            fetch_section("indexes", sql)
 
         # /* print table (and column) check constraints */
         if tableinfo.checks:
@@ -1464,17 +1831,10 @@ def describe_one_table_details(cur, schema_name, relation_name, oid, verbose):
                 "SELECT r.conname, "
                 "pg_catalog.pg_get_constraintdef(r.oid, true)\n"
                 "FROM pg_catalog.pg_constraint r\n"
-                f"WHERE r.conrelid = '{oid}' AND r.contype = 'c'\n"
+                "WHERE r.conrelid = %(oid)s::pg_catalog.oid AND r.contype = 'c'\n"
                 "ORDER BY 1;"
             )
-            log.debug(sql)
-            cur.execute(sql)
-            if cur.rowcount > 0:
-                status.append("Check constraints:\n")
-            for row in cur:
-                # /* untranslated contraint name and def */
-                status.append(f"""    "{row[0]}" {row[1]}""")
-                status.append("\n")
+            fetch_section("checks", sql)
 
         # /* print foreign-key constraints (there are none if no triggers) */
         if tableinfo.hastriggers:
@@ -1482,15 +1842,9 @@ def describe_one_table_details(cur, schema_name, relation_name, oid, verbose):
                 "SELECT conname,\n"
                 " pg_catalog.pg_get_constraintdef(r.oid, true) as condef\n"
                 "FROM pg_catalog.pg_constraint r\n"
-                f"WHERE r.conrelid = '{oid}' AND r.contype = 'f' ORDER BY 1;"
+                "WHERE r.conrelid = %(oid)s::pg_catalog.oid AND r.contype = 'f' ORDER BY 1;"
             )
-            log.debug(sql)
-            cur.execute(sql)
-            if cur.rowcount > 0:
-                status.append("Foreign-key constraints:\n")
-            for row in cur:
-                # /* untranslated constraint name and def */
-                status.append(f"""    "{row[0]}" {row[1]}\n""")
+            fetch_section("foreign_keys", sql)
 
         # /* print incoming foreign-key references (none if no triggers) */
         if tableinfo.hastriggers:
@@ -1498,14 +1852,9 @@ def describe_one_table_details(cur, schema_name, relation_name, oid, verbose):
                 "SELECT conrelid::pg_catalog.regclass, conname,\n"
                 "  pg_catalog.pg_get_constraintdef(c.oid, true) as condef\n"
                 "FROM pg_catalog.pg_constraint c\n"
-                f"WHERE c.confrelid = '{oid}' AND c.contype = 'f' ORDER BY 1;"
+                "WHERE c.confrelid = %(oid)s::pg_catalog.oid AND c.contype = 'f' ORDER BY 1;"
             )
-            log.debug(sql)
-            cur.execute(sql)
-            if cur.rowcount > 0:
-                status.append("Referenced by:\n")
-            for row in cur:
-                status.append(f"""    TABLE "{row[0]}" CONSTRAINT "{row[1]}" {row[2]}\n""")
+            fetch_section("referenced_by", sql)
 
         # /* print rules */
         if tableinfo.hasrules and tableinfo.relkind != "m":
@@ -1513,40 +1862,9 @@ def describe_one_table_details(cur, schema_name, relation_name, oid, verbose):
                 "SELECT r.rulename, trim(trailing ';' from pg_catalog.pg_get_ruledef(r.oid, true)), "
                 "ev_enabled\n"
                 "FROM pg_catalog.pg_rewrite r\n"
-                f"WHERE r.ev_class = '{oid}' ORDER BY 1;"
+                "WHERE r.ev_class = %(oid)s::pg_catalog.oid ORDER BY 1;"
             )
-            log.debug(sql)
-            cur.execute(sql)
-            if cur.rowcount > 0:
-                for category in range(4):
-                    have_heading = False
-                    for row in cur:
-                        if category == 0 and row[2] == "O":
-                            list_rule = True
-                        elif category == 1 and row[2] == "D":
-                            list_rule = True
-                        elif category == 2 and row[2] == "A":
-                            list_rule = True
-                        elif category == 3 and row[2] == "R":
-                            list_rule = True
-
-                        if not list_rule:
-                            continue
-
-                        if not have_heading:
-                            if category == 0:
-                                status.append("Rules:")
-                            if category == 1:
-                                status.append("Disabled rules:")
-                            if category == 2:
-                                status.append("Rules firing always:")
-                            if category == 3:
-                                status.append("Rules firing on replica only:")
-                            have_heading = True
-
-                        # /* Everything after "CREATE RULE" is echoed verbatim */
-                        ruledef = row[1]
-                        status.append(f"    {ruledef}")
+            fetch_section("rules", sql)
 
         # /* print partition info */
         if tableinfo.relispartition:
@@ -1564,21 +1882,13 @@ def describe_one_table_details(cur, schema_name, relation_name, oid, verbose):
                 "on cc.oid = i.inhrelid\n"
                 "inner join pg_namespace nc\n"
                 "on nc.oid = cc.relnamespace\n"
-                f"where cc.oid = {oid}"
+                "where cc.oid = %(oid)s::pg_catalog.oid"
             )
-            log.debug(sql)
-            cur.execute(sql)
-            for row in cur:
-                status.append(f"Partition of: {row[0]}\n")
-                status.append(f"Partition constraint: {row[1]}\n")
+            fetch_section("partition_of", sql)
 
         if tableinfo.relkind == "p":
             # /* print partition key */
-            sql = f"select pg_get_partkeydef({oid})"
-            log.debug(sql)
-            cur.execute(sql)
-            for row in cur:
-                status.append(f"Partition key: {row[0]}\n")
+            fetch_section("partition_key", "select pg_get_partkeydef(%(oid)s::pg_catalog.oid)")
             # /* print list of partitions */
             sql = (
                 "select quote_ident(n.nspname) || '.' ||\n"
@@ -1589,143 +1899,50 @@ def describe_one_table_details(cur, schema_name, relation_name, oid, verbose):
                 "on c.oid = i.inhrelid\n"
                 "inner join pg_namespace n\n"
                 "on n.oid = c.relnamespace\n"
-                f"where i.inhparent = {oid} order by 1"
+                "where i.inhparent = %(oid)s::pg_catalog.oid order by 1"
             )
-            log.debug(sql)
-            cur.execute(sql)
-            if cur.rowcount > 0:
-                if verbose:
-                    first = True
-                    for row in cur:
-                        if first:
-                            status.append(f"Partitions: {row[0]}\n")
-                            first = False
-                        else:
-                            status.append(f"            {row[0]}\n")
-                else:
-                    status.append("Number of partitions %i: (Use \\d+ to list them.)\n" % cur.rowcount)
-
-    if view_def:
-        # /* Footer information about a view */
-        status.append("View definition:\n")
-        status.append(f"{view_def} \n")
+            fetch_section("partitions", sql)
 
+    if details["view_def"] and tableinfo.hasrules:
         # /* print rules */
-        if tableinfo.hasrules:
-            sql = (
-                "SELECT r.rulename, trim(trailing ';' from pg_catalog.pg_get_ruledef(r.oid, true))\n"
-                "FROM pg_catalog.pg_rewrite r\n"
-                f"WHERE r.ev_class = '{oid}' AND r.rulename != '_RETURN' ORDER BY 1;"
-            )
-
-            log.debug(sql)
-            cur.execute(sql)
-            if cur.rowcount > 0:
-                status.append("Rules:\n")
-                for row in cur:
-                    # /* Everything after "CREATE RULE" is echoed verbatim */
-                    ruledef = row[1]
-                    status.append(f" {ruledef}\n")
+        sql = (
+            "SELECT r.rulename, trim(trailing ';' from pg_catalog.pg_get_ruledef(r.oid, true))\n"
+            "FROM pg_catalog.pg_rewrite r\n"
+            "WHERE r.ev_class = %(oid)s::pg_catalog.oid AND r.rulename != '_RETURN' ORDER BY 1;"
+        )
+        fetch_section("rules", sql)
 
-    # /*
-    # * Print triggers next, if any (but only user-defined triggers).  This
-    # * could apply to either a table or a view.
-    # */
     if tableinfo.hastriggers:
         if cur.connection.info.server_version > 90000:
-            sql = f"""SELECT t.tgname,
+            sql = """SELECT t.tgname,
                         pg_catalog.pg_get_triggerdef(t.oid, true),
                         t.tgenabled
                    FROM pg_catalog.pg_trigger t
-                   WHERE t.tgrelid = '{oid}' AND NOT t.tgisinternal
+                   WHERE t.tgrelid = %(oid)s::pg_catalog.oid AND NOT t.tgisinternal
                    ORDER BY 1
                 """
         else:
-            sql = f"""SELECT t.tgname,
+            sql = """SELECT t.tgname,
                         pg_catalog.pg_get_triggerdef(t.oid),
                         t.tgenabled
                    FROM pg_catalog.pg_trigger t
-                   WHERE t.tgrelid = '{oid}'
+                   WHERE t.tgrelid = %(oid)s::pg_catalog.oid
                    ORDER BY 1
                 """
+        fetch_section("triggers", sql)
 
-        log.debug(sql)
-        cur.execute(sql)
-        if cur.rowcount > 0:
-            # /*
-            # * split the output into 4 different categories. Enabled triggers,
-            # * disabled triggers and the two special ALWAYS and REPLICA
-            # * configurations.
-            # */
-            for category in range(4):
-                have_heading = False
-                list_trigger = False
-                for row in cur:
-                    # /*
-                    # * Check if this trigger falls into the current category
-                    # */
-                    tgenabled = row[2]
-                    if category == 0:
-                        if tgenabled == "O" or tgenabled is True:
-                            list_trigger = True
-                    elif category == 1:
-                        if tgenabled == "D" or tgenabled is False:
-                            list_trigger = True
-                    elif category == 2:
-                        if tgenabled == "A":
-                            list_trigger = True
-                    elif category == 3:
-                        if tgenabled == "R":
-                            list_trigger = True
-                    if list_trigger is False:
-                        continue
-
-                    # /* Print the category heading once */
-                    if not have_heading:
-                        if category == 0:
-                            status.append("Triggers:")
-                        elif category == 1:
-                            status.append("Disabled triggers:")
-                        elif category == 2:
-                            status.append("Triggers firing always:")
-                        elif category == 3:
-                            status.append("Triggers firing on replica only:")
-                        status.append("\n")
-                        have_heading = True
-
-                    # /* Everything after "TRIGGER" is echoed verbatim */
-                    tgdef = row[1]
-                    triggerpos = tgdef.find(" TRIGGER ")
-                    if triggerpos >= 0:
-                        tgdef = triggerpos + 9
-
-                    status.append(f"    {row[1][tgdef:]}\n")
-
-    # /*
-    # * Finish printing the footer information about a table.
-    # */
     if tableinfo.relkind == "r" or tableinfo.relkind == "m" or tableinfo.relkind == "f":
-        # /* print foreign server name */
         if tableinfo.relkind == "f":
             # /* Footer information about foreign table */
-            sql = f"""SELECT s.srvname,\n
+            sql = """SELECT s.srvname,\n
                           array_to_string(ARRAY(SELECT
                           quote_ident(option_name) ||  ' ' ||
                           quote_literal(option_value)  FROM
                           pg_options_to_table(ftoptions)),  ', ')
                    FROM pg_catalog.pg_foreign_table f,\n
                         pg_catalog.pg_foreign_server s\n
-                   WHERE f.ftrelid = {oid} AND s.oid = f.ftserver;"""
-            log.debug(sql)
-            cur.execute(sql)
-            row = cur.fetchone()
-
-            # /* Print server name */
-            status.append(f"Server: {row[0]}\n")
-
-            # /* Print per-table FDW options, if any */
-            if row[1]:
-                status.append(f"FDW Options: ({row[1]})\n")
+                   WHERE f.ftrelid = %(oid)s::pg_catalog.oid AND s.oid = f.ftserver;"""
+            fetch_section("foreign_server", sql)
 
         # /* print inherited tables */
         if not tableinfo.relispartition:
@@ -1733,61 +1950,391 @@ def describe_one_table_details(cur, schema_name, relation_name, oid, verbose):
                 "SELECT c.oid::pg_catalog.regclass\n"
                 "FROM pg_catalog.pg_class c, pg_catalog.pg_inherits i\n"
                 "WHERE c.oid = i.inhparent\n"
-                f"  AND i.inhrelid = '{oid}'\n"
+                "  AND i.inhrelid = %(oid)s::pg_catalog.oid\n"
                 "ORDER BY inhseqno"
             )
-            log.debug(sql)
-            cur.execute(sql)
-            spacer = ""
-            if cur.rowcount > 0:
-                status.append("Inherits")
-                spacer = ":"
-                trailer = ",\n"
-                for idx, row in enumerate(cur, 1):
-                    if idx == 2:
-                        spacer = " " * (len("Inherits") + 1)
-                    if idx == cur.rowcount:
-                        trailer = "\n"
-                    status.append(f"{spacer} {row[0]}{trailer}")
+            fetch_section("inherits", sql)
 
         # /* print child tables */
         if cur.connection.info.server_version > 90000:
-            sql = f"""SELECT c.oid::pg_catalog.regclass
+            sql = """SELECT c.oid::pg_catalog.regclass
                         FROM pg_catalog.pg_class c,
                             pg_catalog.pg_inherits i
                         WHERE c.oid = i.inhrelid
-                            AND i.inhparent = '{oid}'
+                            AND i.inhparent = %(oid)s::pg_catalog.oid
                         ORDER BY c.oid::pg_catalog.regclass::pg_catalog.text;
                     """
         else:
-            sql = f"""SELECT c.oid::pg_catalog.regclass
+            sql = """SELECT c.oid::pg_catalog.regclass
                         FROM pg_catalog.pg_class c,
                             pg_catalog.pg_inherits i
                         WHERE c.oid = i.inhrelid
-                            AND i.inhparent = '{oid}'
+                            AND i.inhparent = %(oid)s::pg_catalog.oid
                         ORDER BY c.oid;
                     """
+        fetch_section("children", sql)
 
-        log.debug(sql)
-        cur.execute(sql)
+    return details
+
+
+def _format_table_details(schema_name, details, verbose):
+    """Assemble (title, cells, headers, status) for \\d from fetched sections."""
+    tableinfo = details["tableinfo"]
+
+    # Set the column names.
+    headers = ["Column", "Type"]
 
+    show_modifiers = False
+    if (
+        tableinfo.relkind == "r"
+        or tableinfo.relkind == "p"
+        or tableinfo.relkind == "v"
+        or tableinfo.relkind == "m"
+        or tableinfo.relkind == "f"
+        or tableinfo.relkind == "c"
+    ):
+        headers.append("Modifiers")
+        show_modifiers = True
+
+    if tableinfo.relkind == "S":
+        headers.append("Value")
+
+    if tableinfo.relkind == "i":
+        headers.append("Definition")
+
+    if tableinfo.relkind == "f":
+        headers.append("FDW Options")
+
+    if verbose:
+        headers.append("Storage")
+        if tableinfo.relkind == "r" or tableinfo.relkind == "m" or tableinfo.relkind == "f":
+            headers.append("Stats target")
+        #  Column comments, if the relkind supports this feature. */
+        if (
+            tableinfo.relkind == "r"
+            or tableinfo.relkind == "v"
+            or tableinfo.relkind == "m"
+            or tableinfo.relkind == "c"
+            or tableinfo.relkind == "f"
+        ):
+            headers.append("Description")
+
+    # Prepare the cells of the table to print.
+    cells = []
+    for i, column in enumerate(details["columns"]):
+        cell = []
+        cell.append(column["attname"])  # Column
+        cell.append(column["atttype"])  # Type
+
+        if show_modifiers:
+            modifier = ""
+            if column["attcollation"]:
+                modifier += f" collate {column['attcollation']}"
+            if column["attnotnull"]:
+                modifier += " not null"
+            if column["attrdef"]:
+                modifier += f" default {column['attrdef']}"
+            if column["attidentity"] == "a":
+                modifier += " generated always as identity"
+            elif column["attidentity"] == "d":
+                modifier += " generated by default as identity"
+            elif column["attgenerated"] == "s":
+                modifier += f" generated always as ({column['attrdef']}) stored"
+            cell.append(modifier)
+
+        # Sequence
+        if tableinfo.relkind == "S":
+            cell.append(details["seq_values"][i])
+
+        # Index column
+        if tableinfo.relkind == "i":
+            cell.append(column["indexdef"])
+
+        # /* FDW options for foreign table column, only for 9.2 or later */
+        if tableinfo.relkind == "f":
+            cell.append(column["attfdwoptions"])
+
+        if verbose:
+            storage = column["attstorage"]
+
+            if storage[0] == "p":
+                cell.append("plain")
+            elif storage[0] == "m":
+                cell.append("main")
+            elif storage[0] == "x":
+                cell.append("extended")
+            elif storage[0] == "e":
+                cell.append("external")
+            else:
+                cell.append("???")
+
+            if tableinfo.relkind == "r" or tableinfo.relkind == "m" or tableinfo.relkind == "f":
+                cell.append(column["attstattarget"])
+
+            #  /* Column comments, if the relkind supports this feature. */
+            if (
+                tableinfo.relkind == "r"
+                or tableinfo.relkind == "v"
+                or tableinfo.relkind == "m"
+                or tableinfo.relkind == "c"
+                or tableinfo.relkind == "f"
+            ):
+                cell.append(column["attdescr"])
+        cells.append(cell)
+
+    # Make Footers
+
+    status = []
+    if tableinfo.relkind == "i" and details.get("index_info"):
+        # /* Footer information about an index */
+        (
+            indisunique,
+            indisprimary,
+            indisclustered,
+            indisvalid,
+            deferrable,
+            deferred,
+            indamname,
+            indtable,
+            indpred,
+        ) = details["index_info"][0]
+
+        if indisprimary:
+            status.append("primary key, ")
+        elif indisunique:
+            status.append("unique, ")
+        status.append(f"{indamname}, ")
+
+        # /* we assume here that index and table are in same schema */
+        status.append(f'''for table "{schema_name}.{indtable}"''')
+
+        if indpred:
+            status.append(f", predicate ({indpred})")
+
+        if indisclustered:
+            status.append(", clustered")
+
+        if not indisvalid:
+            status.append(", invalid")
+
+        if deferrable:
+            status.append(", deferrable")
+
+        if deferred:
+            status.append(", initially deferred")
+
+        status.append("\n")
+        # add_tablespace_footer(&cont, tableinfo.relkind,
+        # tableinfo.tablespace, true);
+
+    elif tableinfo.relkind == "S":
+        # /* Footer information about a sequence */
+        # /*
+        # * If we get no rows back, don't show anything (obviously). We should
+        # * never get more than one row back, but if we do, just ignore it and
+        # * don't print anything.
+        # */
+        if details.get("seq_owner"):
+            status.append(f"Owned by: {details['seq_owner'][0][0]}")
+
+    elif tableinfo.relkind == "r" or tableinfo.relkind == "p" or tableinfo.relkind == "m" or tableinfo.relkind == "f":
+        # /* Footer information about a table */
+
+        indexes = details.get("indexes", []) if tableinfo.hasindex else []
+        if indexes:
+            status.append("Indexes:\n")
+        for row in indexes:
+            # /* untranslated indextname */
+            status.append(f'''    "{row[0]}"''')
+
+            # /* If exclusion constraint, print the constraintdef */
+            if row[7] == "x":
+                status.append(" ")
+                status.append(row[6])
+            else:
+                # /* Label as primary key or unique (but not both) */
+                if row[1]:
+                    status.append(" PRIMARY KEY,")
+                elif row[2]:
+                    if row[7] == "u":
+                        status.append(" UNIQUE CONSTRAINT,")
+                    else:
+                        status.append(" UNIQUE,")
+
+                # /* Everything after "USING" is echoed verbatim */
+                indexdef = row[5]
+                usingpos = indexdef.find(" USING ")
+                if usingpos >= 0:
+                    indexdef = indexdef[(usingpos + 7) :]
+                status.append(f" {indexdef}")
+
+                # /* Need these for deferrable PK/UNIQUE indexes */
+                if row[8]:
+                    status.append(" DEFERRABLE")
+
+                if row[9]:
+                    status.append(" INITIALLY DEFERRED")
+
+            # /* Add these for all cases */
+            if row[3]:
+                status.append(" CLUSTER")
+
+            if not row[4]:
+                status.append(" INVALID")
+
+            status.append("\n")
+
+        # /* print table (and column) check constraints */
+        checks = details.get("checks", []) if tableinfo.checks else []
+        if checks:
+            status.append("Check constraints:\n")
+        for row in checks:
+            # /* untranslated contraint name and def */
+            status.append(f"""    "{row[0]}" {row[1]}""")
+            status.append("\n")
+
+        # /* print foreign-key constraints (there are none if no triggers) */
+        foreign_keys = details.get("foreign_keys", []) if tableinfo.hastriggers else []
+        if foreign_keys:
+            status.append("Foreign-key constraints:\n")
+        for row in foreign_keys:
+            # /* untranslated constraint name and def */
+            status.append(f"""    "{row[0]}" {row[1]}\n""")
+
+        # /* print incoming foreign-key references (none if no triggers) */
+        referenced_by = details.get("referenced_by", []) if tableinfo.hastriggers else []
+        if referenced_by:
+            status.append("Referenced by:\n")
+        for row in referenced_by:
+            status.append(f"""    TABLE "{row[0]}" CONSTRAINT "{row[1]}" {row[2]}\n""")
+
+        # /* print rules */
+        if tableinfo.hasrules and tableinfo.relkind != "m":
+            rules = details.get("rules", [])
+            for heading, enabled in (
+                ("Rules:", "O"),
+                ("Disabled rules:", "D"),
+                ("Rules firing always:", "A"),
+                ("Rules firing on replica only:", "R"),
+            ):
+                category = [row for row in rules if row[2] == enabled]
+                if category:
+                    status.append(f"{heading}\n")
+                for row in category:
+                    # /* Everything after "CREATE RULE" is echoed verbatim */
+                    status.append(f"    {row[1]}\n")
+
+        # /* print partition info */
+        if tableinfo.relispartition:
+            for row in details.get("partition_of", []):
+                status.append(f"Partition of: {row[0]}\n")
+                status.append(f"Partition constraint: {row[1]}\n")
+
+        if tableinfo.relkind == "p":
+            # /* print partition key */
+            for row in details.get("partition_key", []):
+                status.append(f"Partition key: {row[0]}\n")
+            # /* print list of partitions */
+            partitions = details.get("partitions", [])
+            if partitions:
+                if verbose:
+                    first = True
+                    for row in partitions:
+                        if first:
+                            status.append(f"Partitions: {row[0]}\n")
+                            first = False
+                        else:
+                            status.append(f"            {row[0]}\n")
+                else:
+                    status.append("Number of partitions %i: (Use \\d+ to list them.)\n" % len(partitions))
+
+    if details["view_def"]:
+        # /* Footer information about a view */
+        status.append("View definition:\n")
+        status.append(f"{details['view_def']} \n")
+
+        # /* print rules */
+        view_rules = [row for row in details.get("rules", []) if row[0] != "_RETURN"] if tableinfo.hasrules else []
+        if view_rules:
+            status.append("Rules:\n")
+            for row in view_rules:
+                # /* Everything after "CREATE RULE" is echoed verbatim */
+                status.append(f" {row[1]}\n")
+
+    # /*
+    # * Print triggers next, if any (but only user-defined triggers).  This
+    # * could apply to either a table or a view.
+    # */
+    if tableinfo.hastriggers:
+        triggers = details.get("triggers", [])
+        # /*
+        # * split the output into 4 different categories. Enabled triggers,
+        # * disabled triggers and the two special ALWAYS and REPLICA
+        # * configurations.
+        # */
+        for heading, enabled in (
+            ("Triggers:", ("O", True)),
+            ("Disabled triggers:", ("D", False)),
+            ("Triggers firing always:", ("A",)),
+            ("Triggers firing on replica only:", ("R",)),
+        ):
+            category = [row for row in triggers if row[2] in enabled]
+            if category:
+                status.append(f"{heading}\n")
+            for row in category:
+                # /* Everything after "TRIGGER" is echoed verbatim */
+                tgdef = row[1]
+                triggerpos = tgdef.find(" TRIGGER ")
+                if triggerpos >= 0:
+                    tgdef = tgdef[triggerpos + 9 :]
+                status.append(f"    {tgdef}\n")
+
+    # /*
+    # * Finish printing the footer information about a table.
+    # */
+    if tableinfo.relkind == "r" or tableinfo.relkind == "m" or tableinfo.relkind == "f":
+        # /* print foreign server name */
+        if tableinfo.relkind == "f" and details.get("foreign_server"):
+            srvname, ftoptions = details["foreign_server"][0]
+
+            # /* Print server name */
+            status.append(f"Server: {srvname}\n")
+
+            # /* Print per-table FDW options, if any */
+            if ftoptions:
+                status.append(f"FDW Options: ({ftoptions})\n")
+
+        # /* print inherited tables */
+        inherits = details.get("inherits", []) if not tableinfo.relispartition else []
+        if inherits:
+            status.append("Inherits")
+            spacer = ":"
+            trailer = ",\n"
+            for idx, row in enumerate(inherits, 1):
+                if idx == 2:
+                    spacer = " " * (len("Inherits") + 1)
+                if idx == len(inherits):
+                    trailer = "\n"
+                status.append(f"{spacer} {row[0]}{trailer}")
+
+        # /* print child tables */
+        children = details.get("children", [])
         if not verbose:
             # /* print the number of child tables, if any */
-            if cur.rowcount > 0:
-                status.append("Number of child tables: %d (Use \\d+ to list them.)\n" % cur.rowcount)
-        else:
-            if cur.rowcount > 0:
-                status.append("Child tables")
-
-                spacer = ":"
-                trailer = ",\n"
-                # /* display the list of child tables */
-                for idx, row in enumerate(cur, 1):
-                    if idx == 2:
-                        spacer = " " * (len("Child tables") + 1)
-                    if idx == cur.rowcount:
-                        trailer = "\n"
-                    status.append(f"{spacer} {row[0]}{trailer}")
+            if children:
+                status.append("Number of child tables: %d (Use \\d+ to list them.)\n" % len(children))
+        elif children:
+            status.append("Child tables")
+
+            spacer = ":"
+            trailer = ",\n"
+            # /* display the list of child tables */
+            for idx, row in enumerate(children, 1):
+                if idx == 2:
+                    spacer = " " * (len("Child tables") + 1)
+                if idx == len(children):
+                    trailer = "\n"
+                status.append(f"{spacer} {row[0]}{trailer}")
 
         # /* Table type */
         if tableinfo.reloftype:
@@ -1808,6 +2355,72 @@ def describe_one_table_details(cur, schema_name, relation_name, oid, verbose):
     return (None, cells, headers, "".join(status))
 
 
+NamePattern = namedtuple(
+    "NamePattern",
+    ["schema", "relname", "schema_literal", "relname_literal", "schema_prefix", "relname_prefix"],
+)
+
+# A quoted part (the closing quote may be missing), a run of unquoted
+# characters, or the schema separator.
+_NAME_PATTERN_TOKEN_RE = re.compile(r'"((?:[^"]|"")*)"?|([^".]+)|\.')
+_UNQUOTED_TRANSLATION = str.maketrans({"*": ".*", "?": ".", "$": "\\$"})
+# Quoted characters are matched as they are, so regex syntax is escaped.
+_QUOTED_TRANSLATION = str.maketrans({c: "\\" + c for c in "|*+?()[]{}.^\\$"})
+# Unquoted characters that make a pattern more than a plain name.
+_UNQUOTED_WILDCARDS = frozenset("*?|+()[]{}^\\")
+
+
+@functools.lru_cache(maxsize=256)
+def parse_name_pattern(pattern):
+    """
+    Takes a wildcard-pattern and returns a NamePattern with the POSIX regexes
+    for its schema and name parts, as sql_name_pattern does.
+
+    schema_literal and relname_literal are the names the parts stand for
+    when they have no wildcards, so they can be compared with = instead of
+    matched as regexes, and None otherwise. Likewise schema_prefix and
+    relname_prefix are set for parts that are a name followed by *.
+
+    >>> parse_name_pattern('Public."Foo$"')
+    NamePattern(schema='^(public)$', relname='^(Foo\\\\$)$', schema_literal='public', relname_literal='Foo$', schema_prefix=None, relname_prefix=None)
+    """
+    schema = schema_literal = schema_prefix = None
+    regex, literal, prefix = [], [], None
+    for match in _NAME_PATTERN_TOKEN_RE.finditer(pattern):
+        quoted, unquoted = match.groups()
+        if quoted is not None:
+            text = quoted.replace('""', '"')
+            regex.append(text.translate(_QUOTED_TRANSLATION))
+        elif unquoted is not None:
+            text = "".join(c.lower() if c.isupper() else c for c in unquoted)
+            regex.append(text.translate(_UNQUOTED_TRANSLATION))
+            if literal is not None and not _UNQUOTED_WILDCARDS.isdisjoint(text):
+                # A name followed by * is a prefix, if that ends the part.
+                head = text.rstrip("*")
+                if _UNQUOTED_WILDCARDS.isdisjoint(head) and pattern[match.end() : match.end() + 1] in ("", "."):
+                    prefix = "".join(literal) + head
+                literal = None
+        else:
+            # Found schema/name separator, move current pattern to schema
+            schema, schema_literal, schema_prefix = "".join(regex), literal, prefix
+            regex, literal, prefix = [], [], None
+            continue
+        if literal is not None:
+            literal.append(text)
+
+    relname = "".join(regex)
+    relname_literal = "".join(literal) if relname and literal is not None else None
+    schema_literal = "".join(schema_literal) if schema and schema_literal is not None else None
+    return NamePattern(
+        "^(" + schema + ")$" if schema else schema,
+        "^(" + relname + ")$" if relname else relname,
+        schema_literal,
+        relname_literal,
+        schema_prefix or None,
+        prefix or None,
+    )
+
+
 def sql_name_pattern(pattern):
     """
     Takes a wildcard-pattern and converts to an appropriate SQL pattern to be
@@ -1818,45 +2431,7 @@ def sql_name_pattern(pattern):
     >>> sql_name_pattern('foo*."b""$ar*"')
     ('^(foo.*)$', '^(b"\\\\$ar\\\\*)$')
     """
-
-    inquotes = False
-    relname = ""
-    schema = None
-    pattern_len = len(pattern)
-    i = 0
-
-    while i < pattern_len:
-        c = pattern[i]
-        if c == '"':
-            if inquotes and i + 1 < pattern_len and pattern[i + 1] == '"':
-                relname += '"'
-                i += 1
-            else:
-                inquotes = not inquotes
-        elif not inquotes and c.isupper():
-            relname += c.lower()
-        elif not inquotes and c == "*":
-            relname += ".*"
-        elif not inquotes and c == "?":
-            relname += "."
-        elif not inquotes and c == ".":
-            # Found schema/name separator, move current pattern to schema
-            schema = relname
-            relname = ""
-        else:
-            # Dollar is always quoted, whether inside quotes or not.
-            if c == "$" or inquotes and c in "|*+?()[]{}.^\\":
-                relname += "\\"
-            relname += c
-        i += 1
-
-    if relname:
-        relname = "^(" + relname + ")$"
-
-    if schema:
-        schema = "^(" + schema + ")$"
-
-    return schema, relname
+    return parse_name_pattern(pattern)[:2]
 
 
 class _FakeCursor(list):
@@ -1874,13 +2449,13 @@ def show_function_definition(cur, pattern, verbose):
     else:
         sql = "SELECT %(pattern)s::pg_catalog.regproc::pg_catalog.oid"
     log.debug("%s, %s", sql, params)
-    cur.execute(sql, params)
+    cur.execute(sql, params, prepare=True)
     (foid,) = cur.fetchone()
 
     params = {"foid": foid}
     sql = "SELECT pg_catalog.pg_get_functiondef(%(foid)s) as source"
     log.debug("%s, %s", sql, params)
-    cur.execute(sql, params)
+    cur.execute(sql, params, prepare=True)
     if cur.description:
         headers = [titleize(x.name) for x in cur.description]
         if verbose:
@@ -1901,8 +2476,11 @@ def show_function_definition(cur, pattern, verbose):
     return [(None, cur, headers, None)]
 
 
-@special_command("\\!", "\\! [command]", "Pass commands to shell.")
+@special_command("\\!", "\\! [command]", "Pass commands to shell.", timed=False)
 def shell_command(cur, pattern, verbose):
+    import shlex
+    import subprocess
+
     cur, headers = [], []
     params = shlex.split(pattern)
     return [(None, cur, headers, subprocess.call(params))]
@@ -0,0 +1,89 @@
+"""Partial matches for \\h, over the help topics and the text of their help."""
+
+import bisect
+import functools
+import re
+
+from . import commands
+
+_WORD_RE = re.compile(r"[A-Z_][A-Z0-9_]*")
+
+
+class HelpIndex(object):
+    """Prefix search over help topics and the words of their help.
+
+    Topic names and (word, topic) pairs are kept in sorted lists, so all the
+    entries starting with a prefix are a contiguous run found by bisection.
+    """
+
+    def __init__(self, helpcommands):
+        self.helpcommands = helpcommands
+        self.topics = sorted(helpcommands)
+        topic_words, text_words = set(), set()
+        for topic, helpcommand in helpcommands.items():
+            topic_words.update((word, topic) for word in topic.split())
+            text = "{} {}".format(self.summary(topic), helpcommand.get("synopsis") or "").upper()
+            text_words.update((word, topic) for word in _WORD_RE.findall(text))
+        self.topic_words = sorted(topic_words)
+        self.text_words = sorted(text_words | topic_words)
+
+    def summary(self, topic):
+        """The description of `topic` without its "Description" heading."""
+        description = self.helpcommands[topic].get("description") or ""
+        if description.startswith("Description\n"):
+            description = description[len("Description\n") :]
+        return " ".join(description.split())
+
+    def search(self, query):
+        """Return the topics matching `query`, best matches first.
+
+        Topics starting with the query come first, then the topics with a
+        word starting with each word of the query, then the topics whose
+        help has such words.
+        """
+        words = _WORD_RE.findall(query.upper())
+        if not words:
+            return []
+
+        phrase = " ".join(words)
+        ranked = []
+        seen = set()
+        for rank in (
+            _prefixed(self.topics, phrase),
+            _all_prefixed(self.topic_words, words),
+            _all_prefixed(self.text_words, words),
+        ):
+            ranked.extend(sorted(rank - seen))
+            seen |= rank
+        return ranked
+
+
+def _prefixed(entries, prefix):
+    """The entries of the sorted list `entries` starting with `prefix`."""
+    found = set()
+    for i in range(bisect.bisect_left(entries, prefix), len(entries)):
+        if not entries[i].startswith(prefix):
+            break
+        found.add(entries[i])
+    return found
+
+
+def _all_prefixed(pairs, words):
+    """Topics having, for each of `words`, a word starting with it."""
+    found = None
+    for word in words:
+        topics = set()
+        for i in range(bisect.bisect_left(pairs, (word,)), len(pairs)):
+            if not pairs[i][0].startswith(word):
+                break
+            topics.add(pairs[i][1])
+        found = topics if found is None else found & topics
+        if not found:
+            break
+    return found
+
+
+@functools.lru_cache(maxsize=1)
+def help_index():
+    """The HelpIndex over `commands.helpcommands`, built on first use."""
+    return HelpIndex(commands.helpcommands)
@@ -0,0 +1,177 @@
+import bisect
+from collections import namedtuple
+
+from . import export
+
+
+@export
+class CommandStats(
+    namedtuple(
+        "CommandStats",
+        ["command", "pattern", "verbose", "elapsed_ms", "n_queries", "rows", "bytes_fetched", "host", "server_version"],
+    )
+):
+    """What PGSpecial.command_hook is called with after each command.
+
+    n_queries, rows and bytes_fetched count the statements the command sent
+    through its cursor and the rows and bytes of data they returned, and
+    measuring the bytes copies each value once more. The hook is called
+    when the command returns: the pages of a paginated listing fetched
+    while its rows are read aren't counted, nor is their time in
+    elapsed_ms. host and server_version are None for commands run without
+    a cursor.
+    """
+
+    __slots__ = ()
+
+
+class _CursorCounter(object):
+    """Counts the statements run on `cur` and the results they return."""
+
+    def __init__(self, cur):
+        self._cur = cur
+        self.n_queries = 0
+        self.rows = 0
+        self.bytes_fetched = 0
+
+    def __getattr__(self, name):
+        return getattr(self._cur, name)
+
+    def __iter__(self):
+        return iter(self._cur)
+
+    def _count(self):
+        self.n_queries += 1
+        result = self._cur.pgresult
+        if result is None:
+            return
+        nrows, ncols = result.ntuples, result.nfields
+        self.rows += nrows
+        # libpq keeps the length of each value, but psycopg only exposes the
+        # values themselves.
+        get_value = result.get_value
+        self.bytes_fetched += sum(len(get_value(row, col) or b"") for row in range(nrows) for col in range(ncols))
+
+
+class _InstrumentedCursor(_CursorCounter):
+    def execute(self, query, params=None, **kwargs):
+        self._cur.execute(query, params, **kwargs)
+        self._count()
+        return self
+
+    def copy(self, statement, params=None, **kwargs):
+        self.n_queries += 1
+        return self._cur.copy(statement, params, **kwargs)
+
+
+class _InstrumentedAsyncCursor(_CursorCounter):
+    async def execute(self, query, params=None, **kwargs):
+        await self._cur.execute(query, params, **kwargs)
+        self._count()
+        return self
+
+    def copy(self, statement, params=None, **kwargs):
+        self.n_queries += 1
+        return self._cur.copy(statement, params, **kwargs)
+
+
+def _command_stats(command, pattern, verbose, elapsed, counter):
+    if counter is None:
+        return CommandStats(command, pattern, verbose, elapsed * 1000, 0, 0, 0, None, None)
+    # Stand-ins for a cursor may have no connection to describe.
+    info = getattr(getattr(counter, "connection", None), "info", None)
+    host, server_version = (None, None) if info is None else (info.host, info.server_version)
+    return CommandStats(
+        command, pattern, verbose, elapsed * 1000, counter.n_queries, counter.rows, counter.bytes_fetched, host, server_version
+    )
+
+
+class _Timings(object):
+    __slots__ = ("buckets", "calls", "total_ms", "max_ms", "n_queries", "rows", "bytes_fetched")
+
+    def __init__(self, nbuckets):
+        self.buckets = [0] * nbuckets
+        self.calls = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.n_queries = 0
+        self.rows = 0
+        self.bytes_fetched = 0
+
+
+@export
+class CommandHistogram(object):
+    """Latency histograms of special commands, per command and server.
+
+    Instances are callable with a CommandStats, so one can be set as
+    PGSpecial.command_hook directly. `bounds` are the upper bounds of the
+    buckets in milliseconds, a last bucket holds the slower calls.
+    """
+
+    BOUNDS = tuple(2**i for i in range(17))
+
+    def __init__(self, bounds=BOUNDS):
+        self.bounds = tuple(bounds)
+        self.timings = {}
+
+    def __call__(self, stats):
+        key = (stats.command, stats.host, stats.server_version)
+        timings = self.timings.get(key)
+        if timings is None:
+            timings = self.timings[key] = _Timings(len(self.bounds) + 1)
+        timings.buckets[bisect.bisect_left(self.bounds, stats.elapsed_ms)] += 1
+        timings.calls += 1
+        timings.total_ms += stats.elapsed_ms
+        timings.max_ms = max(timings.max_ms, stats.elapsed_ms)
+        timings.n_queries += stats.n_queries
+        timings.rows += stats.rows
+        timings.bytes_fetched += stats.bytes_fetched
+
+    def clear(self):
+        self.timings.clear()
+
+    def quantile(self, key, q):
+        """The upper bound of the bucket holding the `q` quantile of the
+        latencies of `key`, a (command, host, server_version) tuple."""
+        timings = self.timings[key]
+        rank = q * timings.calls
+        seen = 0
+        for bound, count in zip(self.bounds, timings.buckets):
+            seen += count
+            if seen >= rank:
+                return min(bound, timings.max_ms)
+        return timings.max_ms
+
+    def report(self):
+        """Returns [(title, rows, headers, status)] like a special command,
+        the commands taking the most time in total first."""
+        headers = [
+            "Command",
+            "Host",
+            "Server version",
+            "Calls",
+            "Total ms",
+            "Mean ms",
+            "P50 ms",
+            "P95 ms",
+            "Max ms",
+            "Queries",
+            "Rows",
+            "Bytes",
+        ]
+        rows = [
+            key
+            + (
+                timings.calls,
+                round(timings.total_ms, 3),
+                round(timings.total_ms / timings.calls, 3),
+                round(self.quantile(key, 0.5), 3),
+                round(self.quantile(key, 0.95), 3),
+                round(timings.max_ms, 3),
+                timings.n_queries,
+                timings.rows,
+                timings.bytes_fetched,
+            )
+            for key, timings in sorted(self.timings.items(), key=lambda item: -item[1].total_ms)
+        ]
+        return [(None, rows, headers, "{} commands".format(len(rows)))]
@@ -1,21 +1,59 @@
 from __future__ import unicode_literals
+import importlib
 import re
 import sys
 import logging
-import click
+import contextlib
 import io
+import mmap
+import os
+import queue
 import shlex
-import sqlparse
-import psycopg
+import stat
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from os.path import expanduser
 from .namedqueries import NamedQueries
 from . import export
-from .main import show_extra_help_command, special_command
+from .main import current_option, show_extra_help_command, special_command
 
 NAMED_QUERY_PLACEHOLDERS = frozenset({"$1", "$*", "$@"})
 
 DEFAULT_WATCH_SECONDS = 2
 
+# Chunk size for \copy FROM, unless PGSpecial.copy_buffer_size says otherwise.
+COPY_BUFFER_SIZE = 1024 * 1024
+
+# \copy source TO CONNECTION 'dsn' target [options]
+_COPY_TO_CONNECTION_RE = re.compile(
+    r"\s*(?P<source>.+?)\s+TO\s+CONNECTION\s+'(?P<dsn>(?:[^']|'')*)'\s+(?P<target>[^\s(]+(?:\s*\([^)]*\))?)(?P<options>.*)$",
+    re.IGNORECASE | re.DOTALL,
+)
+
+# Batches of rows buffered between the two sides of \copy TO CONNECTION.
+COPY_QUEUE_SIZE = 16
+
+# Most buffers os.writev() accepts at once.
+try:
+    _IOV_MAX = os.sysconf("SC_IOV_MAX")
+except (AttributeError, ValueError, OSError):
+    _IOV_MAX = -1
+if _IOV_MAX <= 0:
+    _IOV_MAX = 16
+
+# Rows shorter than this on average are joined before being written: the
+# kernel handles a few large buffers faster than many small ones.
+_WRITEV_MIN_ROW = 4096
+
+# Minimum number of seconds between two calls of the \copy progress callback.
+COPY_PROGRESS_INTERVAL = 0.5
+
+# \copy files with these extensions are (de)compressed on the fly, unless the
+# COMPRESSION option says otherwise.
+COPY_COMPRESSION_EXTENSIONS = {".gz": "gzip", ".bz2": "bz2", ".zst": "zstd", ".lz4": "lz4"}
+
 _logger = logging.getLogger(__name__)
 
 
@@ -90,6 +128,8 @@ def open_external_editor(filename=None, sql=None, editor=None):
     sql = sql or ""
     MARKER = "# Type your query above this line.\n"
 
+    import click
+
     # Populate the editor buffer with the partial sql (if available) and a
     # placeholder comment.
     query = click.edit(
@@ -128,14 +168,110 @@ def _index_of_file_name(tokenlist):
     raise Exception("Missing keyword in \\copy command. Either TO or FROM is required.")
 
 
+@export
+class CopyProgress(namedtuple("CopyProgress", ["bytes", "rows", "elapsed", "rate", "percent", "done"])):
+    """What PGSpecial.copy_progress is called with while \\copy runs.
+
+    bytes and rate (bytes per second) count the data as sent to or received
+    from the server. rows is None when unknown, percent is None unless
+    copying from a file of known size. done is True on the last call.
+    """
+
+    __slots__ = ()
+
+
+class _CopyProgressTracker(object):
+    """Accumulates \\copy progress and reports it to `callback`, at most every
+    COPY_PROGRESS_INTERVAL seconds. Safe to update from several threads."""
+
+    def __init__(self, callback, total_bytes=None, position=None):
+        self.callback = callback
+        self.total_bytes = total_bytes
+        # Returns how far into the file we are, when that differs from the
+        # bytes sent (i.e. for compressed files).
+        self.position = position
+        self.bytes = 0
+        self.rows = None
+        self.start = self.reported = time.perf_counter()
+        self.lock = threading.Lock()
+
+    def update(self, nbytes, rows=0):
+        with self.lock:
+            self.bytes += nbytes
+            if rows:
+                self.rows = (self.rows or 0) + rows
+            if time.perf_counter() - self.reported >= COPY_PROGRESS_INTERVAL:
+                self.report(False)
+
+    def set_rows(self, rows):
+        with self.lock:
+            self.rows = rows
+
+    def finish(self, rows=None):
+        with self.lock:
+            if rows is not None:
+                self.rows = rows
+            self.report(True)
+
+    def report(self, done):
+        now = self.reported = time.perf_counter()
+        elapsed = now - self.start
+        percent = None
+        if done and self.total_bytes:
+            # The whole file was read, and it may already be closed.
+            percent = 100.0
+        elif self.total_bytes:
+            position = self.position() if self.position else self.bytes
+            percent = min(100.0, 100.0 * position / self.total_bytes)
+        self.callback(CopyProgress(self.bytes, self.rows, elapsed, self.bytes / elapsed if elapsed > 0 else 0.0, percent, done))
+
+
+class _CopyProgressPoller(object):
+    """Polls pg_stat_progress_copy (PostgreSQL 14+) from a side connection,
+    feeding the server's row count of the COPY run by `cur` to `tracker`."""
+
+    def __init__(self, cur, tracker):
+        self.cur = cur
+        self.tracker = tracker
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stopped.set()
+        self.thread.join()
+
+    def run(self):
+        import psycopg
+
+        pid = self.cur.connection.info.backend_pid
+        try:
+            with _connect_like(self.cur, autocommit=True) as conn:
+                while not self.stopped.wait(COPY_PROGRESS_INTERVAL):
+                    row = conn.execute("SELECT tuples_processed FROM pg_catalog.pg_stat_progress_copy WHERE pid = %s", (pid,)).fetchone()
+                    if row:
+                        self.tracker.set_rows(row[0])
+        except psycopg.Error:
+            _logger.exception("Polling pg_stat_progress_copy failed.")
+
+
 @special_command(
     "\\copy",
     "\\copy [tablename] to/from [filename]",
     "Copy data between a file and a table.",
     case_sensitive=False,
+    timed=False,
 )
 def copy(cur, pattern, verbose):
     """Copies table data to/from files"""
+    import sqlparse
+
+    match = _COPY_TO_CONNECTION_RE.match(pattern)
+    if match:
+        return _copy_to_connection(cur, **match.groupdict())
 
     # Replace the specified file destination with STDIN or STDOUT
     parsed = sqlparse.parse(pattern)
@@ -146,35 +282,668 @@ def copy(cur, pattern, verbose):
     after_file_name = "".join(t.value for t in tokens[idx + 1 :])
 
     direction = tokens[idx - 2].value.upper()
+    after_file_name, parallel = _pop_copy_option(after_file_name, r"PARALLEL\s+(\d+)")
+    after_file_name, compression = _pop_copy_option(after_file_name, r"COMPRESSION\s+'?(\w+)'?")
     replacement_file_name = "STDIN" if direction == "FROM" else "STDOUT"
     query = f"{before_file_name} {replacement_file_name} {after_file_name}"
-    open_mode = "r" if direction == "FROM" else "wb"
-    if file_name.startswith("'") and file_name.endswith("'"):
-        file = io.open(expanduser(file_name.strip("'")), mode=open_mode)
+
+    is_path = file_name.startswith("'") and file_name.endswith("'")
+    if compression:
+        compression = compression.group(1).lower()
+    elif is_path:
+        compression = COPY_COMPRESSION_EXTENSIONS.get(os.path.splitext(file_name.strip("'"))[1].lower())
+    if compression == "none":
+        compression = None
+
+    progress_callback = current_option("copy_progress")
+
+    if parallel and int(parallel.group(1)) > 1:
+        if not is_path:
+            raise Exception("PARALLEL is only supported when copying from or to a file.")
+        path = expanduser(file_name.strip("'"))
+        start = time.perf_counter()
+        if direction == "FROM":
+            if compression:
+                raise Exception("PARALLEL is not supported when copying from a compressed file.")
+            progress = progress_callback and _CopyProgressTracker(progress_callback, os.path.getsize(path))
+            rows, transferred = _parallel_copy_from(cur, before_file_name, after_file_name, path, int(parallel.group(1)), progress)
+        else:
+            progress = progress_callback and _CopyProgressTracker(progress_callback)
+            rows, transferred = _parallel_copy_to(
+                cur, before_file_name, after_file_name, path, int(parallel.group(1)), compression, progress
+            )
+        elapsed = time.perf_counter() - start
+        if progress:
+            progress.finish(rows)
+        return [(None, None, None, "COPY {} ({})".format(rows, _format_throughput(transferred, elapsed)))]
+
+    # The file is passed through as is, like psql does: the server decodes
+    # it according to client_encoding or the ENCODING option.
+    open_mode = "rb" if direction == "FROM" else "wb"
+    # Only files opened here are closed here, never the standard streams.
+    owns_raw = is_path
+    if is_path:
+        # Unbuffered, since chunks are read straight into our own buffer, or
+        # written straight from psycopg's (unless compressed).
+        unbuffered = direction == "FROM" or (not compression and hasattr(os, "writev"))
+        raw = io.open(expanduser(file_name.strip("'")), mode=open_mode, buffering=0 if unbuffered else -1)
     elif "stdin" in file_name.lower():
-        file = sys.stdin.buffer
+        raw = sys.stdin.buffer
     elif "stdout" in file_name.lower():
-        file = sys.stdout.buffer
+        raw = sys.stdout.buffer
     else:
         raise Exception("Enclose filename in single quotes")
 
-    if direction == "FROM":
-        with cur.copy("copy " + query) as pgcopy:
-            while True:
-                data = file.read(8192)
-                if not data:
-                    break
-                pgcopy.write(data)
-    else:
-        with cur.copy("copy " + query) as pgcopy:
-            for data in pgcopy:
-                file.write(bytes(data))
+    progress = None
+    if progress_callback:
+        if direction == "FROM" and is_path:
+            progress = _CopyProgressTracker(progress_callback, os.fstat(raw.fileno()).st_size, raw.tell if compression else None)
+        else:
+            progress = _CopyProgressTracker(progress_callback)
+    poll = (
+        progress is not None
+        and direction == "FROM"
+        and current_option("copy_progress_poll")
+        and cur.connection.info.server_version >= 140000
+    )
 
+    start = time.perf_counter()
+    try:
+        file = _compressed_file(compression, raw, open_mode) if compression else raw
+        if direction == "FROM":
+            with _CopyProgressPoller(cur, progress) if poll else contextlib.nullcontext():
+                if file is raw and is_path and _is_mappable(raw):
+                    transferred = _copy_from_mapped_file(cur, "copy " + query, raw, progress)
+                else:
+                    transferred = _copy_from_file(cur, "copy " + query, file, progress)
+        else:
+            transferred = _copy_to_file(cur, "copy " + query, file, progress)
+        if file is not raw:
+            # Writes the end of the compressed stream, leaves raw open.
+            file.close()
+    finally:
+        if owns_raw:
+            raw.close()
+    elapsed = time.perf_counter() - start
+    if progress is not None:
+        progress.finish(cur.rowcount)
+
+    status = "{} ({})".format(cur.statusmessage, _format_throughput(transferred, elapsed))
     if cur.description:
         headers = [x.name for x in cur.description]
-        return [(None, None, headers, cur.statusmessage)]
+        return [(None, None, headers, status)]
     else:
-        return [(None, None, None, cur.statusmessage)]
+        return [(None, None, None, status)]
+
+
+def _copy_from_file(cur, statement, file, progress=None):
+    """Stream `file` into COPY ... FROM STDIN, returning the bytes sent.
+
+    The file is read straight into one reusable buffer, so the only per-chunk
+    work in Python is the readinto() and write() calls.
+    """
+    buffer_size = current_option("copy_buffer_size") or COPY_BUFFER_SIZE
+    buffer = bytearray(buffer_size)
+    view = memoryview(buffer)
+    transferred = 0
+    with cur.copy(statement) as pgcopy:
+        while True:
+            size = file.readinto(buffer)
+            if not size:
+                break
+            # psycopg sends the data before write() returns, so the buffer
+            # can be refilled right away.
+            pgcopy.write(view[:size])
+            transferred += size
+            if progress is not None:
+                progress.update(size)
+    return transferred
+
+
+def _is_mappable(file):
+    """Whether `file` is a non-empty regular file, which mmap can map."""
+    st = os.fstat(file.fileno())
+    return stat.S_ISREG(st.st_mode) and st.st_size > 0
+
+
+def _copy_from_mapped_file(cur, statement, file, progress=None):
+    """Stream a regular `file` into COPY ... FROM STDIN, returning the bytes sent.
+
+    The file is memory-mapped and slices of the mapping are handed to psycopg
+    as they are, so the data is never copied into a Python buffer. The file
+    must not be truncated while it is being sent.
+    """
+    buffer_size = current_option("copy_buffer_size") or COPY_BUFFER_SIZE
+    with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        if hasattr(mapped, "madvise"):
+            mapped.madvise(mmap.MADV_SEQUENTIAL)
+        # The view has to be released before the mapping can be closed.
+        with memoryview(mapped) as view:
+            _copy_slice(cur, statement, view, buffer_size, progress)
+        return len(mapped)
+
+
+def _copy_to_file(cur, statement, file, progress=None):
+    """Stream COPY ... TO STDOUT into `file`, returning the bytes received.
+
+    psycopg yields one buffer per row. For unbuffered files they are written
+    a batch at a time: wide rows as they are with os.writev(), instead of
+    being copied into a file buffer first, narrow ones joined into a single
+    buffer.
+    """
+    transferred = 0
+    with cur.copy(statement) as pgcopy:
+        if isinstance(file, io.FileIO) and hasattr(os, "writev"):
+            fd = file.fileno()
+            batch, batch_size = [], 0
+            for data in pgcopy:
+                batch.append(data)
+                batch_size += len(data)
+                if len(batch) >= _IOV_MAX or batch_size >= COPY_BUFFER_SIZE:
+                    _write_batch(fd, batch, batch_size)
+                    transferred += batch_size
+                    if progress is not None:
+                        progress.update(batch_size, len(batch))
+                    batch, batch_size = [], 0
+            if batch:
+                _write_batch(fd, batch, batch_size)
+                transferred += batch_size
+                if progress is not None:
+                    progress.update(batch_size, len(batch))
+        else:
+            for data in pgcopy:
+                file.write(data)
+                transferred += len(data)
+                if progress is not None:
+                    progress.update(len(data), 1)
+    return transferred
+
+
+def _write_batch(fd, batch, batch_size):
+    """Write the `batch_size` bytes of the buffers in `batch` to `fd`."""
+    if batch_size < len(batch) * _WRITEV_MIN_ROW:
+        batch = [b"".join(batch)]
+    _writev(fd, batch)
+
+
+def _writev(fd, buffers):
+    """os.writev() all of the list `buffers`, carrying on after short writes.
+
+    The list is consumed: after a short write, the buffer it stopped in is
+    replaced by a view of its remainder.
+    """
+    start, end = 0, len(buffers)
+    while start < end:
+        written = os.writev(fd, buffers[start:] if start else buffers)
+        while start < end and written >= len(buffers[start]):
+            written -= len(buffers[start])
+            start += 1
+        if written:
+            # Only the buffer the write stopped in is wrapped.
+            buffers[start] = memoryview(buffers[start])[written:]
+
+
+class _CopyTargetFailed(Exception):
+    """The target of \\copy ... TO CONNECTION failed before the source was read."""
+
+
+def _copy_to_connection(cur, source, dsn, target, options):
+    """
+    Stream COPY `source` TO STDOUT on `cur` into COPY `target` FROM STDIN on
+    a new connection to `dsn`, without going through a file.
+
+    Rows are read here and written by a second thread, in batches passed
+    through a bounded queue, so both servers work at the same time while
+    memory use stays capped. If the target fails, the source query is
+    cancelled rather than read to the end.
+    """
+    import psycopg
+
+    dsn = dsn.replace("''", "'")
+    progress_callback = current_option("copy_progress")
+    progress = progress_callback and _CopyProgressTracker(progress_callback)
+    batches = queue.Queue(COPY_QUEUE_SIZE)
+    result = {}
+
+    def write():
+        try:
+            with psycopg.connect(dsn, autocommit=True) as conn, conn.cursor() as target_cur:
+                with target_cur.copy(f"copy {target} FROM STDIN {options}") as pgcopy:
+                    while True:
+                        batch = batches.get()
+                        if batch is None:
+                            break
+                        if isinstance(batch, BaseException):
+                            # Makes psycopg abort the COPY.
+                            raise batch
+                        for data in batch:
+                            pgcopy.write(data)
+                result["rows"] = target_cur.rowcount
+        except BaseException as e:
+            result["error"] = e
+
+    writer = threading.Thread(target=write, daemon=True)
+    writer.start()
+
+    def put(item):
+        # Don't wait forever if the writer is gone.
+        while writer.is_alive():
+            try:
+                batches.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    start = time.perf_counter()
+    transferred = 0
+    writer_failed = False
+    try:
+        try:
+            with cur.copy(f"copy {source} TO STDOUT {options}") as pgcopy:
+                batch, batch_size = [], 0
+                for data in pgcopy:
+                    batch.append(data)
+                    batch_size += len(data)
+                    if "error" in result or (batch_size >= COPY_BUFFER_SIZE and not put(batch)):
+                        # Leaving the block without an exception would
+                        # leave the rest of the source to be read.
+                        writer_failed = True
+                        cur.connection.cancel()
+                        raise _CopyTargetFailed()
+                    if batch_size >= COPY_BUFFER_SIZE:
+                        transferred += batch_size
+                        if progress:
+                            progress.update(batch_size, len(batch))
+                        batch, batch_size = [], 0
+        except (_CopyTargetFailed, psycopg.errors.QueryCanceled):
+            if not writer_failed:
+                raise
+        if not writer_failed and put(batch):
+            transferred += batch_size
+            if progress:
+                progress.update(batch_size, len(batch))
+            put(None)
+    except BaseException:
+        put(Exception("Reading from the source failed."))
+        writer.join()
+        raise
+    writer.join()
+    if "error" in result:
+        raise result["error"]
+    elapsed = time.perf_counter() - start
+
+    if progress:
+        progress.finish(result["rows"])
+    return [(None, None, None, "COPY {} ({})".format(result["rows"], _format_throughput(transferred, elapsed)))]
+
+
+def _compressed_file(compression, raw, mode):
+    """Wrap the binary file object `raw` to decompress what is read from it
+    ("rb") or compress what is written to it ("wb"), in bounded memory.
+
+    Closing the returned file leaves `raw` open.
+    """
+    if compression == "gzip":
+        import gzip
+
+        return gzip.GzipFile(fileobj=raw, mode=mode, compresslevel=6)
+    elif compression == "bz2":
+        import bz2
+
+        return bz2.BZ2File(raw, mode)
+    elif compression == "zstd":
+        zstandard = _import_codec("zstandard", compression)
+        if mode == "rb":
+            return zstandard.ZstdDecompressor().stream_reader(raw, read_across_frames=True, closefd=False)
+        return zstandard.ZstdCompressor().stream_writer(raw, closefd=False)
+    elif compression == "lz4":
+        return _import_codec("lz4.frame", compression).LZ4FrameFile(raw, mode)
+    raise Exception("Unknown compression {}. Use one of gzip, bz2, zstd, lz4 or none.".format(compression))
+
+
+def _import_codec(module, compression):
+    try:
+        return importlib.import_module(module)
+    except ImportError:
+        raise Exception("{} compression needs the {} package.".format(compression, module.split(".")[0]))
+
+
+def _pop_copy_option(options, option):
+    """Remove `option`, a regex, from the options of a \\copy command.
+
+    Returns the remaining options and the match, or None if the option wasn't
+    there. Works with both the WITH (a, b) and the legacy WITH a b syntax.
+    Column names in the list of an option, as in FORCE_NOT_NULL (header),
+    and quoted strings are not options.
+    """
+    top_level = _top_level_offsets(options)
+    matches = re.finditer(r"(?:,\s*)?\b{}\b(?:\s*,)?".format(option), options, re.IGNORECASE)
+    match = next((match for match in matches if match.start() in top_level), None)
+    if not match:
+        return options, None
+    separator = " "
+    if match.group(0).lstrip().startswith(",") and match.group(0).rstrip().endswith(","):
+        separator = ", "
+    options = options[: match.start()].rstrip() + separator + options[match.end() :].lstrip()
+    options = re.sub(r"\bWITH\s*\(\s*\)", " ", options, flags=re.IGNORECASE)
+    return options, re.search(r"\b{}\b".format(option), match.group(0), re.IGNORECASE)
+
+
+def _top_level_offsets(options):
+    """The offsets of the characters of `options` that are neither quoted
+    nor within the parentheses of an option such as FORCE_QUOTE (a, b)."""
+    offsets = set()
+    depth = 0
+    for token in re.finditer(r"'(?:[^']|'')*'?|\"(?:[^\"]|\"\")*\"?|[()]|[^'\"()]+", options):
+        text = token.group(0)
+        if text == ")":
+            depth -= 1
+        # Depth 1 is the list of WITH (a, b).
+        if depth <= 1 and text[0] not in "'\"":
+            offsets.update(range(token.start(), token.end()))
+        if text == "(":
+            depth += 1
+    return offsets
+
+
+def _parallel_copy_from(cur, before_file_name, options, path, parallel, progress=None):
+    """
+    Load the file at `path` with `parallel` COPY FROM streams at once.
+
+    The file is split at line boundaries. In CSV, only the line ends outside
+    of quoted values are used, so values spanning several lines stay whole.
+    Each slice is loaded over its own connection, set up like the session,
+    and committed on its own: if some of them fail, the error lists the
+    slices that are already in the table.
+
+    Returns (rows copied, bytes sent).
+    """
+    if _pop_copy_option(options, r"(FORMAT\s+)?BINARY")[1]:
+        raise Exception("PARALLEL is not supported for binary format.")
+    table, _ = _copy_table(before_file_name)
+    settings = _session_settings(cur, table)
+    quote = None
+    if _pop_copy_option(options, r"(FORMAT\s+)?CSV")[1]:
+        quote = _csv_quote(options)
+
+    buffer_size = current_option("copy_buffer_size") or COPY_BUFFER_SIZE
+    statement = f"copy {before_file_name} STDIN {options}"
+    # Only the first slice starts with the header line.
+    without_header = "copy {} STDIN {}".format(before_file_name, _pop_copy_option(options, r"HEADER(\s+(TRUE|ON|1|MATCH|FALSE|OFF|0))?")[0])
+
+    with io.open(path, "rb") as file:
+        size = os.fstat(file.fileno()).st_size
+        if not size:
+            return _copy_slice(cur, statement, memoryview(b""), buffer_size), 0
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            bounds = _slice_bounds(mapped, size, parallel, quote)
+
+            with memoryview(mapped) as view, ThreadPoolExecutor(len(bounds) - 1) as executor:
+                futures = [
+                    executor.submit(
+                        _copy_slice_over_connection,
+                        cur,
+                        settings,
+                        statement if i == 0 else without_header,
+                        view[a:b],
+                        buffer_size,
+                        progress,
+                    )
+                    for i, (a, b) in enumerate(zip(bounds, bounds[1:]))
+                ]
+                slices = []
+                for future, a, b in zip(futures, bounds, bounds[1:]):
+                    try:
+                        slices.append((a, b, future.result(), None))
+                    except Exception as e:
+                        slices.append((a, b, None, e))
+    failed = [(a, b, error) for a, b, _, error in slices if error is not None]
+    if failed:
+        raise Exception(_partial_copy_message(slices, failed))
+    return sum(rows for _, _, rows, _ in slices), size
+
+
+def _csv_quote(options):
+    """The quote byte of the CSV options of a \\copy, as long as it escapes
+    itself, which is what _slice_bounds relies on."""
+    quote = re.search(r"\bQUOTE\s+(?:AS\s+)?'([^']|'')'", options, re.IGNORECASE)
+    quote = quote.group(1).replace("''", "'") if quote else '"'
+    escape = re.search(r"\bESCAPE\s+(?:AS\s+)?'([^']|'')'", options, re.IGNORECASE)
+    if escape and escape.group(1).replace("''", "'") != quote:
+        raise Exception("PARALLEL is not supported for CSV with an ESCAPE character other than the QUOTE one.")
+    if not quote.isascii():
+        raise Exception("PARALLEL is not supported for CSV with a non-ASCII QUOTE character.")
+    return quote.encode("ascii")
+
+
+def _slice_bounds(mapped, size, parallel, quote=None):
+    """
+    Offsets splitting `mapped` in up to `parallel` slices of whole lines.
+
+    With a CSV `quote`, a line end only ends a record when an even number of
+    quotes came before it: quotes inside values are doubled, so quoted
+    values spanning lines leave an odd count at their line ends.
+    """
+    bounds = [0]
+    quotes, counted = 0, 0
+    for i in range(1, parallel):
+        position = max(size * i // parallel, bounds[-1])
+        while True:
+            newline = mapped.find(b"\n", position)
+            if newline == -1:
+                break
+            if quote is None:
+                break
+            quotes += _count(mapped, quote, counted, newline)
+            counted = newline
+            if quotes % 2 == 0:
+                break
+            position = newline + 1
+        if newline == -1:
+            break
+        if newline + 1 < size:
+            bounds.append(newline + 1)
+    bounds.append(size)
+    return bounds
+
+
+def _count(mapped, byte, start, end):
+    """Occurrences of `byte` in mapped[start:end], read a buffer at a time."""
+    return sum(mapped[offset : min(offset + COPY_BUFFER_SIZE, end)].count(byte) for offset in range(start, end, COPY_BUFFER_SIZE))
+
+
+def _partial_copy_message(slices, failed):
+    def describe(a, b):
+        return "bytes {}-{}".format(a, b)
+
+    message = "\\copy PARALLEL failed for {} of {} slices of the file: {}.".format(
+        len(failed), len(slices), "; ".join("{}: {}".format(describe(a, b), error) for a, b, error in failed)
+    )
+    committed = [(a, b, rows) for a, b, rows, error in slices if error is None]
+    if committed:
+        message += " These slices were committed and are in the table: {}.".format(
+            ", ".join("{} ({} rows)".format(describe(a, b), rows) for a, b, rows in committed)
+        )
+    else:
+        message += " No slice was committed."
+    return message
+
+
+def _copy_table(before_file_name):
+    """Split the "table [(columns)] TO|FROM" part of a \\copy into the table
+    and its column list, raising if a query is copied instead."""
+    match = re.match(r"\s*([^(\s][^(]*?)\s*(\(.*\))?\s*(TO|FROM)\s*$", before_file_name, re.IGNORECASE | re.DOTALL)
+    if not match:
+        raise Exception("PARALLEL is only supported when copying a table, not a query.")
+    return match.group(1), match.group(2)
+
+
+def _session_settings(cur, table):
+    """
+    The settings of the session of `cur` that decide how `table` and the
+    data are resolved, for _connect_like() to apply to new connections.
+
+    Raises if `table` is a temporary table, which other sessions can't see.
+    """
+    cur.execute(
+        """SELECT pg_catalog.current_setting('search_path'),
+                  pg_catalog.current_setting('role'),
+                  c.relpersistence
+             FROM pg_catalog.pg_class c
+             WHERE c.oid = %s::pg_catalog.regclass""",
+        (table,),
+    )
+    search_path, role, persistence = cur.fetchone()
+    if persistence == "t":
+        raise Exception("PARALLEL is not supported for temporary tables, which other connections can't see.")
+    return {"search_path": search_path, "role": role}
+
+
+def _connect_like(cur, settings=None, **kwargs):
+    """Open a new connection with the same parameters and client_encoding as
+    the one of `cur`, and the _session_settings() `settings` if given."""
+    import psycopg
+
+    info = cur.connection.info
+    params = info.get_parameters()
+    params.update(password=info.password, client_encoding=info.parameter_status("client_encoding"), **kwargs)
+    conn = psycopg.connect(**params)
+    if settings:
+        conn.execute(
+            "SELECT pg_catalog.set_config('search_path', %(search_path)s, false), pg_catalog.set_config('role', %(role)s, false)",
+            settings,
+        )
+        if not conn.autocommit:
+            conn.commit()
+    return conn
+
+
+def _copy_slice_over_connection(cur, settings, statement, data, buffer_size, progress=None):
+    """Run `statement` on a new connection to the same server, feeding it `data`."""
+    with data, _connect_like(cur, settings, autocommit=True) as conn:
+        with conn.cursor() as slice_cur:
+            return _copy_slice(slice_cur, statement, data, buffer_size, progress)
+
+
+def _copy_slice(cur, statement, data, buffer_size, progress=None):
+    """Send `data` to COPY FROM STDIN in chunks, returning the rows copied."""
+    with cur.copy(statement) as pgcopy:
+        for offset in range(0, len(data), buffer_size):
+            # Released right away, even on errors, so that the file can be
+            # unmapped while tracebacks still refer to this frame.
+            with data[offset : offset + buffer_size] as chunk:
+                pgcopy.write(chunk)
+                if progress is not None:
+                    progress.update(len(chunk))
+    return cur.rowcount
+
+
+# Minimum server version scanning a ctid range without reading the whole
+# table (TID range scans).
+PARALLEL_COPY_TO_MIN_VERSION = 140000
+
+
+def _parallel_copy_to(cur, before_file_name, options, path, parallel, compression=None, progress=None):
+    """
+    Export a table to the file at `path` with `parallel` COPY TO streams.
+
+    The table is split in ranges of ctid blocks, read by separate
+    connections set up like the session and sharing one exported snapshot,
+    so together they see the same data a single COPY would. Each range goes
+    to its own shard, and the shards are then appended to the file in block
+    order. Compressed shards are complete streams of their own, and all the
+    supported formats decompress a concatenation of streams as the
+    concatenated data.
+
+    Returns (rows copied, bytes written).
+    """
+    import psycopg
+    import shutil
+    import tempfile
+
+    if cur.connection.info.server_version < PARALLEL_COPY_TO_MIN_VERSION:
+        raise Exception(
+            "PARALLEL is only supported when copying to a file from PostgreSQL 14 or later. "
+            "Older servers would read the whole table once per stream."
+        )
+    table, columns = _copy_table(before_file_name)
+    if _pop_copy_option(options, r"(FORMAT\s+)?BINARY")[1]:
+        raise Exception("PARALLEL is not supported for binary format.")
+    columns = columns.strip()[1:-1] if columns else "*"
+    settings = _session_settings(cur, table)
+
+    without_header = _pop_copy_option(options, r"HEADER(\s+(TRUE|ON|1|MATCH|FALSE|OFF|0))?")[0]
+
+    def statement(i, first_block, last_block):
+        where = f"ctid >= '({first_block},0)'::pg_catalog.tid"
+        if last_block is not None:
+            where += f" AND ctid < '({last_block},0)'::pg_catalog.tid"
+        return f"copy (SELECT {columns} FROM {table} WHERE {where}) TO STDOUT {options if i == 0 else without_header}"
+
+    with _connect_like(cur, settings) as conn:
+        conn.isolation_level = psycopg.IsolationLevel.REPEATABLE_READ
+        with conn.transaction():
+            snapshot, blocks = conn.execute(
+                """SELECT pg_catalog.pg_export_snapshot(),
+                          pg_catalog.pg_relation_size(%s::pg_catalog.regclass)
+                          / pg_catalog.current_setting('block_size')::pg_catalog.int8""",
+                (table,),
+            ).fetchone()
+            # The last range is left open, so it covers whatever the size
+            # estimate missed.
+            bounds = sorted({blocks * i // parallel for i in range(parallel)}) + [None]
+            statements = [statement(i, a, b) for i, (a, b) in enumerate(zip(bounds, bounds[1:]))]
+
+            with io.open(path, "wb") as file, ThreadPoolExecutor(len(statements)) as executor:
+                shards = [file] + [tempfile.TemporaryFile(dir=os.path.dirname(os.path.abspath(path))) for _ in statements[1:]]
+                try:
+                    futures = [
+                        executor.submit(_copy_range_to_shard, cur, settings, snapshot, stmt, shard, compression, progress)
+                        for stmt, shard in zip(statements, shards)
+                    ]
+                    results = [future.result() for future in futures]
+                    for shard in shards[1:]:
+                        shard.seek(0)
+                        shutil.copyfileobj(shard, file, COPY_BUFFER_SIZE)
+                finally:
+                    for shard in shards[1:]:
+                        shard.close()
+
+    return sum(rows for rows, _ in results), sum(size for _, size in results)
+
+
+def _copy_range_to_shard(cur, settings, snapshot, statement, shard, compression, progress=None):
+    """Run the COPY TO `statement` in `snapshot` on a new connection with the
+    session's `settings`, writing its output, compressed if asked to, to
+    `shard`. Returns (rows copied, bytes written before compression)."""
+    import psycopg
+
+    with _connect_like(cur, settings) as conn:
+        conn.isolation_level = psycopg.IsolationLevel.REPEATABLE_READ
+        with conn.transaction(), conn.cursor() as shard_cur:
+            shard_cur.execute(psycopg.sql.SQL("SET TRANSACTION SNAPSHOT {}").format(snapshot))
+            file = _compressed_file(compression, shard, "wb") if compression else shard
+            transferred = _copy_to_file(shard_cur, statement, file, progress)
+            if file is not shard:
+                file.close()
+            return shard_cur.rowcount, transferred
+
+
+def _format_throughput(nbytes, seconds):
+    """Returns e.g. "12.5 MB in 0.51 s, 24.5 MB/s"."""
+    rate = nbytes / seconds if seconds > 0 else 0
+    return "{} in {:.2f} s, {}/s".format(_format_bytes(nbytes), seconds, _format_bytes(rate))
+
+
+def _format_bytes(nbytes):
+    for unit in ("bytes", "kB", "MB", "GB"):
+        if nbytes < 1024 or unit == "GB":
+            break
+        nbytes /= 1024
+    if unit == "bytes":
+        return "{} bytes".format(int(nbytes))
+    return "{:.1f} {}".format(nbytes, unit)
 
 
 def subst_favorite_query_args(query, args):
@@ -220,9 +989,11 @@ def subst_favorite_query_args(query, args):
     return [query, None]
 
 
-@special_command("\\n", "\\n[+] [name] [param1 param2 ...]", "List or execute named queries.")
+@special_command("\\n", "\\n[+] [name] [param1 param2 ...]", "List or execute named queries.", timed=False)
 def execute_named_query(cur, pattern, **_):
     """Returns (title, rows, headers, status)"""
+    import psycopg
+
     if pattern == "":
         return list_named_queries(True)
 
@@ -273,7 +1044,7 @@ def list_named_queries(verbose):
     return [("", rows, headers, status)]
 
 
-@special_command("\\np", "\\np name_pattern", "Print a named query.")
+@special_command("\\np", "\\np name_pattern", "Print a named query.", timed=False)
 def get_named_query(pattern, **_):
     """Get a named query that matches name_pattern.
 
@@ -300,7 +1071,7 @@ def get_named_query(pattern, **_):
     return [("", rows, headers, status)]
 
 
-@special_command("\\ns", "\\ns name query", "Save a named query.")
+@special_command("\\ns", "\\ns name query", "Save a named query.", timed=False)
 def save_named_query(pattern, **_):
     """Save a new named query.
     Returns (title, rows, headers, status)"""
@@ -319,7 +1090,7 @@ def save_named_query(pattern, **_):
     return [(None, None, None, "Saved.")]
 
 
-@special_command("\\nd", "\\nd [name]", "Delete a named query.")
+@special_command("\\nd", "\\nd [name]", "Delete a named query.", timed=False)
 def delete_named_query(pattern, **_):
     """Delete an existing named query."""
     usage = "Syntax: \\nd name.\n\n" + NamedQueries.instance.usage
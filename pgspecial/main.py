@@ -1,10 +1,17 @@
 from __future__ import unicode_literals
+import functools
 import os
 import logging
+import time
 from collections import namedtuple
+from contextlib import contextmanager
+from contextvars import ContextVar
 
 from . import export
-from .help.commands import helpcommands
+from .help import commands as help_commands
+from .help.index import help_index
+from .instrumentation import _command_stats, _InstrumentedCursor
+from .templates import query_templates
 
 log = logging.getLogger(__name__)
 
@@ -24,10 +31,58 @@ PAGER_MSG = {
 
 SpecialCommand = namedtuple(
     "SpecialCommand",
-    ["handler", "syntax", "description", "arg_type", "hidden", "case_sensitive"],
+    ["handler", "syntax", "description", "arg_type", "hidden", "case_sensitive", "timed"],
+    defaults=(False,),
 )
 
 
+# The PGSpecial instance running the current command. Static handlers only
+# get (cur, pattern, verbose), so they read instance options through here.
+_current_special = ContextVar("current_special", default=None)
+
+
+def current_option(name, default=None):
+    """Return option `name` of the PGSpecial instance executing the current
+    command, or `default` when called outside of `PGSpecial.execute`."""
+    return getattr(_current_special.get(), name, default)
+
+
+@contextmanager
+def statement_timeout(cur, seconds):
+    """
+    Cancel the statements run on `cur` within the block once they take
+    longer than `seconds`, raising psycopg.errors.QueryCanceled.
+
+    In autocommit mode the block runs in a transaction of its own with SET
+    LOCAL statement_timeout. Otherwise a SET LOCAL would outlive the block,
+    so a timer cancels the running statement instead, within a savepoint
+    that keeps the surrounding transaction usable.
+
+    So in autocommit mode each statement gets `seconds` of its own, while
+    the timer limits the whole block, however many statements it runs.
+    """
+    from psycopg.pq import TransactionStatus
+
+    conn = cur.connection
+    if conn.autocommit and conn.info.transaction_status == TransactionStatus.IDLE:
+        with conn.transaction():
+            # On the connection, so it isn't counted as one of the command's
+            # queries by command_hook.
+            conn.execute("SELECT pg_catalog.set_config('statement_timeout', %s, true)", ("{}ms".format(max(1, int(seconds * 1000))),))
+            yield
+    else:
+        import threading
+
+        timer = threading.Timer(seconds, conn.cancel)
+        with conn.transaction():
+            timer.start()
+            try:
+                yield
+            finally:
+                timer.cancel()
+                timer.join()
+
+
 @export
 class CommandNotFound(Exception):
     pass
@@ -43,11 +98,46 @@ class PGSpecial(object):
         self.timing_enabled = True
 
         self.commands = self.default_commands.copy()
+        # Lookup tables derived from self.commands, see _find_command. Reset
+        # by register(); a commands dict assigned wholesale is noticed too.
+        self._dispatcher = None
         self.timing_enabled = False
         self.expanded_output = False
         self.auto_expand = False
         self.pager_config = PAGER_ALWAYS
         self.pager = os.environ.get("PAGER", "")
+        # Composed catalog queries, shared across instances. Exposed here so
+        # clients can inspect the hit/miss counters or clear it.
+        self.query_templates = query_templates
+        # Optional CatalogCache memoizing catalog listings.
+        self.catalog_cache = None
+        # Rows fetched per query by \dt, \dv, \di and friends. None fetches
+        # the whole listing at once.
+        self.listing_page_size = None
+        # Read size for \copy FROM, None uses iocommands.COPY_BUFFER_SIZE.
+        self.copy_buffer_size = None
+        # Called with an iocommands.CopyProgress while \copy runs, and once
+        # more when it's done.
+        self.copy_progress = None
+        # Also poll pg_stat_progress_copy for the rows loaded by \copy FROM
+        # (PostgreSQL 14+). This uses a second connection.
+        self.copy_progress_poll = False
+        # Estimate the sizes shown by \dt+ and \l+ from pg_class instead of
+        # measuring the files on disk.
+        self.approximate_sizes = False
+        # Seconds after which \dt+ and \l+ give up on exact sizes and fall
+        # back to estimates. None waits for the exact sizes.
+        self.size_timeout = None
+        # Seconds after which the queries of a special command are cancelled
+        # and the command returns a timeout status. None never cancels them.
+        # Only applies to the commands registered with timed=True, which
+        # the built-in ones are unless they run the user's own statements or
+        # transfer data (\copy, \n, \!, ...). See statement_timeout() for
+        # what the timeout limits.
+        self.command_timeout = None
+        # Called with an instrumentation.CommandStats after each command,
+        # e.g. an instrumentation.CommandHistogram.
+        self.command_hook = None
 
         self.register(self.show_help, "\\?", "\\?", "Show Commands.", arg_type=PARSED_QUERY)
 
@@ -92,28 +182,107 @@ class PGSpecial(object):
         )
 
     def register(self, *args, **kwargs):
+        """
+        Register a special command, see register_special_command().
+
+        command_timeout runs the handler in a transaction, or a savepoint,
+        with its statements cancelled after the timeout. Handlers only get
+        that if they are registered with timed=True: a handler that commits,
+        or runs statements that can't be in a transaction block such as
+        VACUUM, must not be.
+        """
         register_special_command(*args, command_dict=self.commands, **kwargs)
+        self._dispatcher = None
 
     def execute(self, cur, sql):
-        commands = self.commands
-        command, verbose, pattern = parse_special_command(sql)
+        special_cmd, command, verbose, pattern = self._find_command(sql)
+        return self._run_command(special_cmd, command, cur, sql, verbose, pattern)
 
-        if (command not in commands) and (command.lower() not in commands):
-            raise CommandNotFound
+    def _run_command(self, special_cmd, command, cur, sql, verbose, pattern):
+        token = _current_special.set(self)
+        try:
+            if self.command_hook is not None:
+                return self._run_instrumented_command(special_cmd, command, cur, sql, verbose, pattern)
+            return self._run_guarded_command(special_cmd, command, cur, sql, verbose, pattern)
+        finally:
+            _current_special.reset(token)
+
+    def _run_instrumented_command(self, special_cmd, command, cur, sql, verbose, pattern):
+        """Runs the command through a cursor counting its queries, and
+        reports a CommandStats to command_hook, also when it fails."""
+        counter = None if cur is None else _InstrumentedCursor(cur)
+        start = time.perf_counter()
+        try:
+            results = self._run_guarded_command(special_cmd, command, cur if counter is None else counter, sql, verbose, pattern)
+            if counter is None:
+                return results
+            # Rows left in the counting cursor are copied out of it, as it
+            # isn't handed back to the caller. Others, such as the pages of
+            # a paginated listing, stay lazy.
+            return [(title, list(rows) if rows is counter else rows, headers, status) for title, rows, headers, status in results or ()]
+        finally:
+            self.command_hook(_command_stats(command, pattern, verbose, time.perf_counter() - start, counter))
+
+    def _run_guarded_command(self, special_cmd, command, cur, sql, verbose, pattern):
+        timeout = self.command_timeout
+        if timeout and cur is not None and special_cmd.timed and special_cmd.arg_type != NO_QUERY:
+            return self._run_timed_command(special_cmd, command, cur, sql, verbose, pattern, timeout)
+        return self._run_handler(special_cmd, command, cur, sql, verbose, pattern)
+
+    def _run_handler(self, special_cmd, command, cur, sql, verbose, pattern):
+        catalog_cache = self.catalog_cache
+        if special_cmd.arg_type == PARSED_QUERY and catalog_cache is not None and catalog_cache.handles(command, verbose):
+            return catalog_cache.fetch(
+                cur,
+                (command, verbose, pattern),
+                lambda: _call_handler(special_cmd, cur, sql, verbose, pattern),
+            )
+        return _call_handler(special_cmd, cur, sql, verbose, pattern)
+
+    def _run_timed_command(self, special_cmd, command, cur, sql, verbose, pattern, timeout):
+        """
+        Runs the command with its queries cancelled after `timeout` seconds,
+        returning a timeout status if they were. The rows are fetched within
+        the timeout, including those of paginated listings.
+        """
+        from psycopg.errors import QueryCanceled
 
         try:
-            special_cmd = commands[command]
-        except KeyError:
-            special_cmd = commands[command.lower()]
-            if special_cmd.case_sensitive:
+            with statement_timeout(cur, timeout):
+                return _materialize(self._run_handler(special_cmd, command, cur, sql, verbose, pattern))
+        except QueryCanceled:
+            log.info("%s was cancelled after %s s.", command, timeout)
+            return [(None, None, None, "{} timed out after {} s.".format(command, timeout))]
+
+    def _find_command(self, sql):
+        """Returns (special_cmd, command, verbose, pattern) for `sql`, raising
+        CommandNotFound if it isn't a special command."""
+        commands = self.commands
+        if self.catalog_cache is not None:
+            # Every statement goes through here, including the ones that turn
+            # out not to be special commands.
+            self.catalog_cache.note_query(sql)
+
+        dispatcher = self._dispatcher
+        if dispatcher is None or dispatcher.commands is not commands:
+            dispatcher = self._dispatcher = _Dispatcher(commands)
+
+        # Most statements are plain SQL, rejected without being parsed.
+        # Leading newlines and tabs are skipped by parse_special_command().
+        first_char = sql.lstrip()[:1] if sql[:1].isspace() else sql[:1]
+        if first_char not in dispatcher.first_chars:
+            raise CommandNotFound
+
+        command, verbose, pattern = parse_special_command(sql)
+
+        special_cmd = commands.get(command)
+        if special_cmd is None:
+            special_cmd = dispatcher.folded.get(command.lower())
+            if special_cmd is None:
                 raise CommandNotFound("Command not found: %s" % command)
+            command = command.lower()
 
-        if special_cmd.arg_type == NO_QUERY:
-            return special_cmd.handler()
-        elif special_cmd.arg_type == PARSED_QUERY:
-            return special_cmd.handler(cur=cur, pattern=pattern, verbose=verbose)
-        elif special_cmd.arg_type == RAW_QUERY:
-            return special_cmd.handler(cur=cur, query=sql)
+        return special_cmd, command, verbose, pattern
 
     def show_help(self, pattern, **_):
         if pattern.strip():
@@ -128,28 +297,27 @@ class PGSpecial(object):
         return [(None, result, headers, None)]
 
     def show_command_help_listing(self):
-        table = chunks(sorted(helpcommands.keys()), 6)
-        return [(None, table, [], None)]
+        return [(None, _help_listing(), [], None)]
 
     def show_command_help(self, pattern, **_):
         command = pattern.strip().upper()
-        message = ""
 
         if not command:
             return self.show_command_help_listing()
 
-        if command in helpcommands:
-            helpcommand = helpcommands[command]
+        if command in help_commands.helpcommands:
+            return [(None, None, None, _format_command_help(help_commands.helpcommands[command]))]
 
-            if "description" in helpcommand:
-                message += helpcommand["description"]
-            if "synopsis" in helpcommand:
-                message += "\nSyntax:\n"
-                message += helpcommand["synopsis"]
-        else:
-            message = 'No help available for "%s"' % pattern
-            message += "\nTry \\h with no arguments to see available help."
+        index = help_index()
+        matches = index.search(command)
+        if len(matches) == 1:
+            return [(None, None, None, _format_command_help(help_commands.helpcommands[matches[0]]))]
+        elif matches:
+            rows = [(topic, index.summary(topic)) for topic in matches]
+            return [(None, rows, ["Command", "Description"], "Use \\h with one of these commands to see its help.")]
 
+        message = 'No help available for "%s"' % pattern
+        message += "\nTry \\h with no arguments to see available help."
         return [(None, None, None, message)]
 
     def toggle_expanded_output(self, pattern, **_):
@@ -222,12 +390,36 @@ def content_exceeds_width(row, width):
     return line_len > width
 
 
+class _Dispatcher(object):
+    """Lookup tables for PGSpecial._find_command, derived from `commands`.
+
+    `folded` holds the commands that aren't case sensitive, under the
+    names they are registered with, which register_special_command()
+    lowercases. Any spelling of them is found by looking up its lowercase
+    form.
+    `first_chars` holds every character a special command can start with.
+    """
+
+    def __init__(self, commands):
+        self.commands = commands
+        self.folded = {name: cmd for name, cmd in commands.items() if not cmd.case_sensitive}
+        # "+" may come first, as in "+\dt".
+        self.first_chars = {"+"}
+        for name, cmd in commands.items():
+            if name:
+                self.first_chars.add(name[0])
+                if not cmd.case_sensitive:
+                    self.first_chars.update((name[0].lower(), name[0].upper()))
+
+
 @export
 def parse_special_command(sql):
     command, _, arg = sql.partition(" ")
     verbose = "+" in command
 
-    command = command.strip().replace("+", "")
+    command = command.strip()
+    if verbose:
+        command = command.replace("+", "")
     return (command, verbose, arg.strip())
 
 
@@ -248,6 +440,25 @@ def show_extra_help_command(command, syntax, description):
     return wrapper
 
 
+def _materialize(results):
+    """
+    Fetches the rows of the (title, rows, headers, status) results of a
+    handler into lists. Handlers may be generators reusing one cursor for
+    each result they yield, so every result is copied before the next one
+    is produced.
+    """
+    return [(title, None if rows is None else list(rows), headers, status) for title, rows, headers, status in results or ()]
+
+
+def _call_handler(special_cmd, cur, sql, verbose, pattern):
+    if special_cmd.arg_type == NO_QUERY:
+        return special_cmd.handler()
+    elif special_cmd.arg_type == PARSED_QUERY:
+        return special_cmd.handler(cur=cur, pattern=pattern, verbose=verbose)
+    elif special_cmd.arg_type == RAW_QUERY:
+        return special_cmd.handler(cur=cur, query=sql)
+
+
 def special_command(
     command,
     syntax,
@@ -256,6 +467,7 @@ def special_command(
     hidden=False,
     case_sensitive=True,
     aliases=(),
+    timed=True,
 ):
     """A decorator used internally for static special commands"""
 
@@ -270,6 +482,7 @@ def special_command(
             case_sensitive,
             aliases,
             command_dict=PGSpecial.default_commands,
+            timed=timed,
         )
         return wrapped
 
@@ -286,9 +499,10 @@ def register_special_command(
     case_sensitive=True,
     aliases=(),
     command_dict=None,
+    timed=False,
 ):
     cmd = command.lower() if not case_sensitive else command
-    command_dict[cmd] = SpecialCommand(handler, syntax, description, arg_type, hidden, case_sensitive)
+    command_dict[cmd] = SpecialCommand(handler, syntax, description, arg_type, hidden, case_sensitive, timed)
     for alias in aliases:
         cmd = alias.lower() if not case_sensitive else alias
         command_dict[cmd] = SpecialCommand(
@@ -298,9 +512,25 @@ def register_special_command(
             arg_type,
             case_sensitive=case_sensitive,
             hidden=True,
+            timed=timed,
         )
 
 
+def _format_command_help(helpcommand):
+    message = ""
+    if "description" in helpcommand:
+        message += helpcommand["description"]
+    if "synopsis" in helpcommand:
+        message += "\nSyntax:\n"
+        message += helpcommand["synopsis"]
+    return message
+
+
+@functools.lru_cache(maxsize=1)
+def _help_listing():
+    return chunks(help_index().topics, 6)
+
+
 def chunks(l, n):  # noqa
     n = max(1, n)
     return [l[i : i + n] for i in range(0, len(l), n)]
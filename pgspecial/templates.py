@@ -0,0 +1,43 @@
+import logging
+
+log = logging.getLogger(__name__)
+
+
+class QueryTemplates(object):
+    """Registry of composed catalog queries.
+
+    Most special commands build their SQL from a few fixed pieces picked by
+    the server version and the verbose flag, with the user's pattern passed
+    as a query parameter. The composed query only depends on those choices,
+    so it is built once per key and reused afterwards.
+
+    Keys are tuples starting with ``(command, server_version, verbose)``,
+    optionally followed by whatever else changes the shape of the query.
+    """
+
+    def __init__(self):
+        self.templates = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, build):
+        """Return the template for `key`, calling `build()` to compose it on
+        the first request."""
+        try:
+            template = self.templates[key]
+        except KeyError:
+            self.misses += 1
+            log.debug("Composing query template for %s", key)
+            template = self.templates[key] = build()
+        else:
+            self.hits += 1
+        return template
+
+    def clear(self):
+        self.templates.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+# Shared by every PGSpecial instance: templates don't depend on the session.
+query_templates = QueryTemplates()
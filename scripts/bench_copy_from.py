@@ -0,0 +1,81 @@
+"""Compare the ways \\copy FROM can feed a local file to the server.
+
+    python scripts/bench_copy_from.py "dbname=bench" --size 4 --path /tmp/bench.csv
+
+The CSV is generated on the first run and reused afterwards. Each method
+loads it into a fresh UNLOGGED table; the client CPU time is what differs
+between them, the wall time also includes the server's work.
+"""
+
+import argparse
+import io
+import os
+import time
+
+import psycopg
+
+from pgspecial import iocommands
+
+STATEMENT = "copy bench_copy_from FROM STDIN WITH csv"
+
+COPY_WRITE_BUFFER = 16 * 1024 * 1024
+
+
+def read_loop(cur, file):
+    """What \\copy FROM used to do: a read() and a new bytes object per 8 kB."""
+    transferred = 0
+    with cur.copy(STATEMENT) as pgcopy:
+        while True:
+            data = file.read(8192)
+            if not data:
+                break
+            pgcopy.write(data)
+            transferred += len(data)
+    return transferred
+
+
+def readinto_loop(cur, file):
+    return iocommands._copy_from_file(cur, STATEMENT, file)
+
+
+def mapped(cur, file):
+    return iocommands._copy_from_mapped_file(cur, STATEMENT, file)
+
+
+METHODS = {"read": read_loop, "readinto": readinto_loop, "mmap": mapped}
+
+
+def generate(path, size):
+    line = 0
+    with open(path, "w", buffering=COPY_WRITE_BUFFER) as file:
+        while file.tell() < size:
+            file.write("".join(f"{i},name {i},{i * 0.5}\n" for i in range(line, line + 10000)))
+            line += 10000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("dsn", help="connection string of a scratch database")
+    parser.add_argument("--path", default="bench_copy_from.csv", help="CSV file, generated if missing")
+    parser.add_argument("--size", type=float, default=2, help="size of the generated file, in GB")
+    parser.add_argument("--methods", nargs="+", choices=list(METHODS), default=list(METHODS))
+    args = parser.parse_args()
+
+    if not os.path.exists(args.path):
+        print(f"Generating {args.path}...")
+        generate(args.path, int(args.size * 1024**3))
+
+    with psycopg.connect(args.dsn, autocommit=True) as conn, conn.cursor() as cur:
+        for name in args.methods:
+            cur.execute("DROP TABLE IF EXISTS bench_copy_from")
+            cur.execute("CREATE UNLOGGED TABLE bench_copy_from (id bigint, name text, value float8)")
+            with io.open(args.path, "rb", buffering=0) as file:
+                wall, cpu = time.perf_counter(), time.process_time()
+                transferred = METHODS[name](cur, file)
+                wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+            print(f"{name:>9}: {iocommands._format_throughput(transferred, wall)}, client CPU {cpu:.2f} s")
+        cur.execute("DROP TABLE bench_copy_from")
+
+
+if __name__ == "__main__":
+    main()
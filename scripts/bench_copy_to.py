@@ -0,0 +1,80 @@
+"""Compare the ways \\copy TO can write the rows it receives to a local file.
+
+    python scripts/bench_copy_to.py --rows 5000000 --width 40 --path /tmp/bench.out
+
+No database is needed: the rows psycopg would yield are generated up front
+and replayed through the same code \\copy TO runs, once writing them one by
+one to a buffered file, as it used to, and once in os.writev() batches to an
+unbuffered one. With --check the exit status is non-zero if the batched
+writes are more than 10% slower than the plain loop.
+"""
+
+import argparse
+import contextlib
+import io
+import sys
+import time
+
+from pgspecial import iocommands
+
+
+class ReplayCursor(object):
+    """Enough of a psycopg cursor for iocommands._copy_to_file()."""
+
+    def __init__(self, rows):
+        self.rows = rows
+
+    @contextlib.contextmanager
+    def copy(self, statement):
+        yield iter(self.rows)
+
+
+def write_loop(rows, path):
+    """What \\copy TO used to do: a write() per row into a buffered file."""
+    with open(path, "wb") as file:
+        for data in rows:
+            file.write(data)
+
+
+def writev_batches(rows, path):
+    with io.open(path, "wb", buffering=0) as file:
+        iocommands._copy_to_file(ReplayCursor(rows), "copy bench TO STDOUT", file)
+
+
+METHODS = {"write": write_loop, "writev": writev_batches}
+
+
+def best_of(method, rows, path, runs):
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        method(rows, path)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--path", default="bench_copy_to.out", help="file the rows are written to")
+    parser.add_argument("--rows", type=int, default=2000000)
+    parser.add_argument("--width", type=int, default=40, help="bytes per row")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--check", action="store_true", help="fail if writev is slower than write")
+    args = parser.parse_args()
+
+    row = b"x" * (args.width - 1) + b"\n"
+    # Distinct objects, as psycopg yields a new buffer for every row.
+    rows = [bytes(row) for _ in range(args.rows)]
+    size = args.rows * args.width
+
+    times = {}
+    for name, method in METHODS.items():
+        times[name] = best_of(method, rows, args.path, args.runs)
+        print(f"{name:>7}: {times[name]:.2f} s, {iocommands._format_throughput(size, times[name])}")
+
+    if args.check and times["writev"] > times["write"] * 1.1:
+        sys.exit("writev is slower than the plain write() loop")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Time how fast PGSpecial tells special commands from SQL.
+
+    python scripts/bench_dispatch.py --lines 1000000
+
+Replays a mix of SQL statements and meta-commands through the command lookup
+that PGSpecial.execute does before running anything, and through the lookup
+it used to do, for comparison. No database is needed.
+"""
+
+import argparse
+import itertools
+import time
+
+from pgspecial.main import CommandNotFound, PGSpecial, parse_special_command
+
+LINES = [
+    "SELECT * FROM orders WHERE id = 42",
+    "INSERT INTO t VALUES (1, 'a')",
+    "\\dt",
+    "update accounts set balance = balance - 1",
+    "\\d+ orders",
+    "DESCRIBE orders",
+    "with x as (select 1) select * from x",
+    "\\COPY orders TO 'orders.csv'",
+    "\\nosuchcommand",
+    "delete from t",
+]
+
+
+def legacy_find_command(commands, sql):
+    """The lookup PGSpecial.execute did before the dispatch tables."""
+    command, verbose, pattern = parse_special_command(sql)
+    if (command not in commands) and (command.lower() not in commands):
+        raise CommandNotFound
+    try:
+        special_cmd = commands[command]
+    except KeyError:
+        special_cmd = commands[command.lower()]
+        if special_cmd.case_sensitive:
+            raise CommandNotFound("Command not found: %s" % command)
+        command = command.lower()
+    return special_cmd, command, verbose, pattern
+
+
+def run(find, lines):
+    start = time.perf_counter()
+    found = 0
+    for sql in lines:
+        try:
+            find(sql)
+            found += 1
+        except CommandNotFound:
+            pass
+    return time.perf_counter() - start, found
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lines", type=int, default=1000000)
+    args = parser.parse_args()
+
+    pgspecial = PGSpecial()
+    lines = list(itertools.islice(itertools.cycle(LINES), args.lines))
+    for name, find in (
+        ("legacy", lambda sql: legacy_find_command(pgspecial.commands, sql)),
+        ("dispatch", pgspecial._find_command),
+    ):
+        elapsed, found = run(find, lines)
+        print(f"{name:>9}: {elapsed:.2f} s, {elapsed / len(lines) * 1e9:.0f} ns per line, {found} commands")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Measure how long `import pgspecial` takes in a fresh interpreter.
+
+    python scripts/bench_import.py --runs 50
+
+Each run starts a new Python with -X importtime and reads the cumulative
+time of the pgspecial package from its report, so the interpreter start-up
+and the import of the dependencies shared with the application are left
+out. The time to load the SQL help on the first \\h is reported separately.
+With --baseline, the same is measured on another checkout, e.g. a git
+worktree of the release before, and the two are shown side by side.
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+
+def python(args, path=None):
+    """Run this Python with `args`, importing pgspecial from `path` if given.
+
+    With -c, the working directory comes first in sys.path, before any
+    installed copy of pgspecial.
+    """
+    return subprocess.run([sys.executable, *args], capture_output=True, text=True, check=True, cwd=path)
+
+
+def import_times(code, runs, path=None):
+    """Return {module: [cumulative microseconds, ...]} for `code` run `runs` times."""
+    times = {}
+    for _ in range(runs):
+        result = python(["-X", "importtime", "-c", code], path)
+        for line in result.stderr.splitlines():
+            if not line.startswith("import time:") or "cumulative" in line:
+                continue
+            _, cumulative, name = line[len("import time:") :].split("|")
+            times.setdefault(name.strip(), []).append(int(cumulative))
+    return times
+
+
+def help_load_time(runs, path=None):
+    code = (
+        "import time, pgspecial\n"
+        "start = time.perf_counter()\n"
+        "from pgspecial.help.commands import helpcommands\n"
+        "print(time.perf_counter() - start)"
+    )
+    return [float(python(["-c", code], path).stdout) * 1e6 for _ in range(runs)]
+
+
+def measure(runs, path=None):
+    """Median milliseconds of each measurement, None for modules not imported."""
+    times = import_times("import pgspecial", runs, path)
+    medians = {name: statistics.median(times[name]) / 1000 if name in times else None for name in MODULES}
+    medians["first \\h"] = statistics.median(help_load_time(runs, path)) / 1000
+    return medians
+
+
+MODULES = ("pgspecial", "pgspecial.main", "pgspecial.help.commands")
+
+
+def format_ms(ms):
+    return "-" if ms is None else f"{ms:.2f} ms"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=30)
+    parser.add_argument("--baseline", metavar="PATH", help="checkout to compare with, containing the pgspecial package")
+    args = parser.parse_args()
+
+    current = measure(args.runs)
+    if args.baseline is None:
+        for name, ms in current.items():
+            if ms is not None:
+                print(f"{name:>24}: median {ms:.2f} ms")
+        return
+
+    baseline = measure(args.runs, args.baseline)
+    print("{:>24}  {:>12}  {:>12}  {:>8}".format("median", "baseline", "current", "ratio"))
+    for name, ms in current.items():
+        ratio = f"{ms / baseline[name]:.2f}x" if ms is not None and baseline[name] else "-"
+        print(f"{name:>24}  {format_ms(baseline[name]):>12}  {format_ms(ms):>12}  {ratio:>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -32,9 +32,7 @@ if __name__ == "__main__":
     if len(sys.argv) < 2:
         print("Parse postgres SGML reference files into JSON")
         print("Usage:")
-        print(
-            'echo -n "commands = " > command_help.py; python parser.py ref/ | python -mjson.tool | sed \'s/"\\: null/": None/g\' >>  command_help.py'
-        )
+        print("python scripts/docparser.py ref/ > pgspecial/help/commands.json")
         print("")
         sys.exit(0)
 
@@ -48,4 +46,4 @@ if __name__ == "__main__":
             parsed = parse(path)
             if parsed:
                 docs[command.upper()] = parsed
-    print(json.dumps(docs))
+    print(json.dumps(docs, ensure_ascii=False, sort_keys=True, separators=(",", ":")))
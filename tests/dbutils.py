@@ -27,6 +27,17 @@ def db_connection(dbname=None):
     return conn
 
 
+async def async_db_connection(dbname=None):
+    return await psycopg.AsyncConnection.connect(
+        user=POSTGRES_USER,
+        host=POSTGRES_HOST,
+        password=POSTGRES_PASSWORD,
+        port=POSTGRES_PORT,
+        dbname=dbname,
+        autocommit=True,
+    )
+
+
 try:
     conn = db_connection(dbname=None)
     CAN_CONNECT_TO_DB = True
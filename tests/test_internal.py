@@ -113,3 +113,430 @@ def test_subst_favorite_query_args_aggregation(template_query, query_args, query
     subst_query, error = iocommands.subst_favorite_query_args(template_query, query_args)
     assert error is None
     assert subst_query == query
+
+
+def test_query_templates_build_once():
+    from pgspecial.templates import QueryTemplates
+
+    templates = QueryTemplates()
+    calls = []
+
+    def build():
+        calls.append(1)
+        return "SELECT 1"
+
+    assert templates.get(("\\dt", 150000, False), build) == "SELECT 1"
+    assert templates.get(("\\dt", 150000, False), build) == "SELECT 1"
+    assert templates.get(("\\dt", 150000, True), build) == "SELECT 1"
+    assert len(calls) == 2
+    assert (templates.hits, templates.misses) == (1, 2)
+
+    templates.clear()
+    assert templates.templates == {}
+    assert (templates.hits, templates.misses) == (0, 0)
+
+
+@pytest.mark.parametrize(
+    "sql,invalidates",
+    [
+        ("CREATE TABLE foo (a int)", True),
+        ("  alter table foo add column b int", True),
+        ("select 1;\ndrop view bar", True),
+        ("COMMENT ON TABLE foo IS 'x'", True),
+        ("begin; create table foo (a int)", True),
+        ("SET search_path TO schema1", True),
+        ("select 1;\nrollback", True),
+        ("update foo set a = 1", False),
+        ("SELECT * FROM foo", False),
+        ("/* setup */ create table foo (a int)", True),
+        ("/* one */\n/* two\n */ DROP TABLE foo", True),
+        ("select 1; /* then */ set search_path to schema1", True),
+        ("select 'drop table foo'", False),
+        ("/* drop table foo */ select 1", False),
+        ("\\dt", False),
+    ],
+)
+def test_catalog_cache_invalidated_by_ddl(sql, invalidates):
+    from pgspecial.catalogcache import CatalogCache
+
+    cache = CatalogCache()
+    cache.results[("db", "public", "\\dt", False, "")] = []
+    cache.note_query(sql)
+    assert (not cache.results) == invalidates
+
+
+def test_catalog_cache_max_age_default():
+    """Changes made by other sessions are picked up eventually by default."""
+    from pgspecial.catalogcache import CatalogCache
+
+    assert 0 < CatalogCache().max_age < float("inf")
+    assert CatalogCache(max_age=None).max_age is None
+
+
+@pytest.mark.parametrize(
+    "nbytes,seconds,expected",
+    [
+        (0, 0, "0 bytes in 0.00 s, 0 bytes/s"),
+        (1000, 2, "1000 bytes in 2.00 s, 500 bytes/s"),
+        (3 * 1024 * 1024, 0.5, "3.0 MB in 0.50 s, 6.0 MB/s"),
+        (5 * 1024**4, 100, "5120.0 GB in 100.00 s, 51.2 GB/s"),
+    ],
+)
+def test_format_throughput(nbytes, seconds, expected):
+    assert iocommands._format_throughput(nbytes, seconds) == expected
+
+
+@pytest.mark.parametrize(
+    "options,remaining,value",
+    [
+        ("WITH (PARALLEL 8)", " ", "8"),
+        ("WITH (FORMAT csv, PARALLEL 8)", "WITH (FORMAT csv )", "8"),
+        ("WITH (PARALLEL 2, FORMAT csv)", "WITH ( FORMAT csv)", "2"),
+        ("WITH (FORMAT csv, parallel 4, HEADER)", "WITH (FORMAT csv, HEADER)", "4"),
+        ("WITH csv PARALLEL 3", "WITH csv ", "3"),
+        ("WITH (FORMAT csv)", "WITH (FORMAT csv)", None),
+    ],
+)
+def test_pop_copy_option(options, remaining, value):
+    options, match = iocommands._pop_copy_option(options, r"PARALLEL\s+(\d+)")
+    assert options == remaining
+    assert (match and match.group(1)) == value
+
+
+@pytest.mark.parametrize(
+    "options,remaining,found",
+    [
+        ("WITH (FORMAT csv, HEADER)", "WITH (FORMAT csv )", True),
+        ("WITH (FORMAT csv, HEADER true, DELIMITER ';')", "WITH (FORMAT csv, DELIMITER ';')", True),
+        ("WITH csv HEADER", "WITH csv ", True),
+        ("WITH (FORMAT csv, FORCE_NOT_NULL (header), HEADER)", "WITH (FORMAT csv, FORCE_NOT_NULL (header) )", True),
+        ("WITH (FORMAT csv, FORCE_NOT_NULL (a, header))", "WITH (FORMAT csv, FORCE_NOT_NULL (a, header))", False),
+        ("WITH (FORMAT csv, FORCE_QUOTE (header))", "WITH (FORMAT csv, FORCE_QUOTE (header))", False),
+        ("WITH (FORMAT csv, NULL 'header')", "WITH (FORMAT csv, NULL 'header')", False),
+    ],
+)
+def test_pop_copy_option_header(options, remaining, found):
+    """Only the HEADER option is removed, not a column named header."""
+    options, match = iocommands._pop_copy_option(options, r"HEADER(\s+(TRUE|ON|1|MATCH|FALSE|OFF|0))?")
+    assert options == remaining
+    assert bool(match) == found
+
+
+def test_compressed_file_unknown_compression():
+    with pytest.raises(Exception, match="Unknown compression rar"):
+        iocommands._compressed_file("rar", None, "rb")
+
+
+@pytest.mark.parametrize("parallel", [2, 3, 7])
+def test_slice_bounds_csv(parallel):
+    import csv
+    import io
+
+    records = [[str(i), "line one\nline two" if i % 3 else 'say ""hi""\n'] for i in range(50)]
+    text = io.StringIO()
+    csv.writer(text, lineterminator="\n").writerows(records)
+    data = text.getvalue().encode()
+
+    bounds = iocommands._slice_bounds(data, len(data), parallel, b'"')
+    assert bounds[0] == 0 and bounds[-1] == len(data) and len(bounds) > 2
+    sliced = [row for a, b in zip(bounds, bounds[1:]) for row in csv.reader(io.StringIO(data[a:b].decode()))]
+    assert sliced == list(csv.reader(io.StringIO(text.getvalue())))
+
+
+@pytest.mark.parametrize(
+    "options,quote",
+    [
+        ("WITH (FORMAT csv)", b'"'),
+        ("WITH (FORMAT csv, QUOTE '''', ESCAPE '''')", b"'"),
+        ("WITH csv QUOTE AS '|'", b"|"),
+        ("WITH (FORMAT csv, ESCAPE '\\')", None),
+    ],
+)
+def test_csv_quote(options, quote):
+    if quote is None:
+        with pytest.raises(Exception, match="ESCAPE"):
+            iocommands._csv_quote(options)
+    else:
+        assert iocommands._csv_quote(options) == quote
+
+
+def test_parallel_copy_to_needs_tid_range_scans(tmp_path):
+    from types import SimpleNamespace
+
+    cur = SimpleNamespace(connection=SimpleNamespace(info=SimpleNamespace(server_version=130000)))
+    path = tmp_path / "out.csv"
+    with pytest.raises(Exception, match="PostgreSQL 14 or later"):
+        iocommands._parallel_copy_to(cur, "tbl1 TO", "", str(path), 4)
+    assert not path.exists()
+
+
+def test_writev_short_writes(monkeypatch, tmp_path):
+    import os
+
+    if not hasattr(os, "writev"):
+        pytest.skip("os.writev is not available")
+    real_writev = os.writev
+
+    def short_writev(fd, buffers):
+        # Never write more than 3 bytes at a time.
+        return real_writev(fd, [bytes(memoryview(b"".join(bytes(b) for b in buffers))[:3])])
+
+    monkeypatch.setattr(os, "writev", short_writev)
+    path = tmp_path / "out"
+    with open(path, "wb", buffering=0) as f:
+        iocommands._writev(f.fileno(), [b"hello", memoryview(b" world"), b"", b"!"])
+    assert path.read_bytes() == b"hello world!"
+
+
+@pytest.mark.parametrize("width", [10, iocommands._WRITEV_MIN_ROW * 2])
+def test_copy_to_file_batches(monkeypatch, tmp_path, width):
+    import contextlib
+    import os
+
+    if not hasattr(os, "writev"):
+        pytest.skip("os.writev is not available")
+    calls = []
+    real_writev = os.writev
+
+    def counting_writev(fd, buffers):
+        calls.append(len(buffers))
+        return real_writev(fd, buffers)
+
+    monkeypatch.setattr(os, "writev", counting_writev)
+    rows = [b"%0*d\n" % (width - 1, i) for i in range(3000)]
+
+    class Cursor(object):
+        @contextlib.contextmanager
+        def copy(self, statement):
+            yield iter(rows)
+
+    path = tmp_path / "out"
+    with open(path, "wb", buffering=0) as f:
+        assert iocommands._copy_to_file(Cursor(), "copy t TO STDOUT", f) == len(rows) * width
+    assert path.read_bytes() == b"".join(rows)
+    if width < iocommands._WRITEV_MIN_ROW:
+        # Narrow rows are joined, one buffer per writev().
+        assert set(calls) == {1}
+    else:
+        assert sum(calls) == len(rows)
+
+
+def test_help_commands_loaded_lazily():
+    import subprocess
+    import sys
+
+    code = (
+        "import pgspecial.main\n"
+        "from pgspecial.help import commands\n"
+        "assert 'helpcommands' not in vars(commands)\n"
+        "assert 'synopsis' in commands.helpcommands['SELECT']\n"
+        "assert 'helpcommands' in vars(commands)\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_help_index_search():
+    from pgspecial.help.index import HelpIndex
+
+    index = HelpIndex(
+        {
+            "ALTER TABLE": {"description": "Description\nALTER TABLE changes the definition of a table.", "synopsis": "ALTER TABLE name"},
+            "ALTER TABLESPACE": {"description": "Description\nALTER TABLESPACE changes a tablespace.", "synopsis": "ALTER TABLESPACE name"},
+            "ALTER INDEX": {"description": "Description\nALTER INDEX changes an index.", "synopsis": "ALTER INDEX name SET TABLESPACE t"},
+            "CREATE TABLE": {"description": "Description\nCREATE TABLE defines a table.", "synopsis": "CREATE TABLE name"},
+        }
+    )
+    assert index.topics == ["ALTER INDEX", "ALTER TABLE", "ALTER TABLESPACE", "CREATE TABLE"]
+    assert index.search("alter tab") == ["ALTER TABLE", "ALTER TABLESPACE", "ALTER INDEX"]
+    assert index.search("tab") == ["ALTER TABLE", "ALTER TABLESPACE", "CREATE TABLE", "ALTER INDEX"]
+    assert index.search("defines") == ["CREATE TABLE"]
+    assert index.search("drop") == []
+    assert index.search("  ") == []
+    assert index.summary("CREATE TABLE") == "CREATE TABLE defines a table."
+
+
+# Loaded by the commands that need them rather than by `import pgspecial`.
+# test_import_time only bounds how long the import takes, it is measured by
+# scripts/bench_import.py.
+LAZY_MODULES = (
+    "psycopg",
+    "psycopg.sql",
+    "sqlparse",
+    "click",
+    "asyncio",
+    "subprocess",
+    "importlib.metadata",
+    "json",
+    "gzip",
+    "bz2",
+    "tempfile",
+    "shutil",
+    "pgspecial.aio",
+)
+
+
+def test_import_is_lazy():
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, pgspecial\n"
+        "lazy = {!r}\n"
+        "print(','.join(m for m in lazy if m in sys.modules))\n"
+        "print('helpcommands' in vars(sys.modules['pgspecial.help.commands']))"
+    ).format(LAZY_MODULES)
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    imported, help_loaded = result.stdout.splitlines()
+    assert imported == "", "imported eagerly: " + imported
+    assert help_loaded == "False"
+
+
+def _cumulative_import_time(module):
+    """Best of 3 cumulative -X importtime of `module` in fresh interpreters,
+    in microseconds."""
+    import subprocess
+    import sys
+
+    times = []
+    for _ in range(3):
+        result = subprocess.run([sys.executable, "-X", "importtime", "-c", "import " + module], capture_output=True, text=True, check=True)
+        line = next(line for line in result.stderr.splitlines() if line.rstrip().endswith("| " + module))
+        times.append(int(line.split("|")[1]))
+    return min(times)
+
+
+def test_import_time():
+    # A loose bound that doesn't depend on the speed of the machine. The cold
+    # import took about 270 ms while psycopg, sqlparse and click were
+    # imported eagerly, more than psycopg alone.
+    assert _cumulative_import_time("pgspecial") < _cumulative_import_time("psycopg")
+
+
+@pytest.mark.parametrize(
+    "sql,expected",
+    [
+        ("\\dt", ("\\dt", False, "")),
+        ("\\dt+ foo ", ("\\dt", True, "foo")),
+        ("+\\dt", ("\\dt", True, "")),
+        ("\\dt\n", ("\\dt", False, "")),
+        ("\n\\dt", ("\\dt", False, "")),
+        ("\t\n\\d+ foo", ("\\d", True, "foo")),
+        ("\nselect 1", None),
+        ("describe foo", ("describe", False, "foo")),
+        ("DESCRIBE foo", ("describe", False, "foo")),
+        ("\\COPY foo TO 'f'", ("\\copy", False, "foo TO 'f'")),
+        ("\\Custom", ("\\custom", False, "")),
+        ("\\DT", None),
+        ("select 1", None),
+        ("  \\dt", None),
+        ("", None),
+    ],
+)
+def test_find_command(sql, expected):
+    from pgspecial.main import CommandNotFound, PGSpecial
+
+    pgspecial = PGSpecial()
+    pgspecial._find_command("\\dt")
+    # Registered after the dispatch tables were built.
+    pgspecial.register(lambda: None, "\\custom", "\\custom", "", case_sensitive=False)
+    if expected is None:
+        with pytest.raises(CommandNotFound):
+            pgspecial._find_command(sql)
+    else:
+        special_cmd, command, verbose, pattern = pgspecial._find_command(sql)
+        assert special_cmd is pgspecial.commands[command]
+        assert (command, verbose, pattern) == expected
+
+
+def test_find_command_reregistered():
+    from pgspecial.main import PGSpecial
+
+    def describe(cur, pattern, verbose):
+        pass
+
+    pgspecial = PGSpecial()
+    pgspecial._find_command("DESCRIBE tbl1")
+    pgspecial.register(describe, "describe", "DESCRIBE [pattern]", "", case_sensitive=False)
+    special_cmd, command, _, _ = pgspecial._find_command("DESCRIBE tbl1")
+    assert (special_cmd.handler, command) == (describe, "describe")
+
+
+def test_timed_commands():
+    """command_timeout leaves out the built-in commands that run the user's
+    own statements or don't query the server."""
+    from pgspecial.main import PGSpecial
+
+    commands = PGSpecial().commands
+    untimed = ["\\copy", "\\n", "\\ns", "\\nd", "\\np", "\\!", "\\?", "\\h", "\\x", "\\pset", "\\pager"]
+    assert [command for command in untimed if commands[command].timed] == []
+    assert all(commands[command].timed for command in ["\\dt", "\\d", "\\l", "\\dF", "\\sf"])
+
+
+@pytest.mark.parametrize(
+    "pattern,expected",
+    [
+        ("foo", (None, "^(foo)$", None, "foo", None, None)),
+        ("Foo", (None, "^(foo)$", None, "foo", None, None)),
+        ('"Foo"', (None, "^(Foo)$", None, "Foo", None, None)),
+        ("s.t", ("^(s)$", "^(t)$", "s", "t", None, None)),
+        ("s*.t", ("^(s.*)$", "^(t)$", None, "t", "s", None)),
+        ("foo*", (None, "^(foo.*)$", None, None, None, "foo")),
+        ('"Foo"**', (None, "^(Foo.*.*)$", None, None, None, "Foo")),
+        ("foo*bar", (None, "^(foo.*bar)$", None, None, None, None)),
+        ('foo*"bar"', (None, "^(foo.*bar)$", None, None, None, None)),
+        ("*", (None, "^(.*)$", None, None, None, None)),
+        ("a+b", (None, "^(a+b)$", None, None, None, None)),
+        ('"a+b"', (None, "^(a\\+b)$", None, "a+b", None, None)),
+        ("a$b", (None, "^(a\\$b)$", None, "a$b", None, None)),
+        ('"a""b"', (None, '^(a"b)$', None, 'a"b', None, None)),
+        ("foo.", ("^(foo)$", "", "foo", None, None, None)),
+        ("", (None, "", None, None, None, None)),
+    ],
+)
+def test_parse_name_pattern(pattern, expected):
+    from pgspecial.dbcommands import parse_name_pattern, sql_name_pattern
+
+    assert parse_name_pattern(pattern) == expected
+    assert sql_name_pattern(pattern) == expected[:2]
+
+
+@pytest.mark.parametrize(
+    "regex,literal,prefix,match,params",
+    [
+        ("^(foo)$", "foo", None, "=", {"k": "foo"}),
+        ("^(foo.*)$", None, "foo", "prefix", {"k": "foo", "k_end": "fop"}),
+        ("^(f.*)$", None, "f~", "prefix", {"k": "f~", "k_end": "f\x7f"}),
+        # Non-ASCII last characters and over-long names fall back to regexes.
+        ("^(fé.*)$", None, "fé", "~", {"k": "^(fé.*)$"}),
+        ("^(" + "x" * 64 + ")$", "x" * 64, None, "~", {"k": "^(" + "x" * 64 + ")$"}),
+        ("^(fo+)$", None, None, "~", {"k": "^(fo+)$"}),
+        ("", None, None, None, {}),
+    ],
+)
+def test_name_match(regex, literal, prefix, match, params):
+    from pgspecial.dbcommands import _name_match
+
+    values = {}
+    assert _name_match(values, "k", regex, literal, prefix) == match
+    assert values == params
+
+
+def test_command_histogram():
+    from pgspecial.instrumentation import CommandHistogram, CommandStats
+
+    histogram = CommandHistogram(bounds=(1, 10, 100))
+    for command, elapsed_ms in [("\\dt", 0.5), ("\\dt", 5), ("\\dt", 7), ("\\dt", 500), ("\\l", 50)]:
+        histogram(CommandStats(command, "", False, elapsed_ms, 1, 2, 3, "db1", 160000))
+
+    key = ("\\dt", "db1", 160000)
+    assert histogram.timings[key].buckets == [1, 2, 0, 1]
+    assert histogram.quantile(key, 0.25) == 1
+    assert histogram.quantile(key, 0.5) == 10
+    assert histogram.quantile(key, 0.95) == 500
+    assert histogram.quantile(("\\l", "db1", 160000), 0.5) == 50
+
+    ((title, rows, headers, status),) = histogram.report()
+    assert [row[:4] for row in rows] == [("\\dt", "db1", 160000, 4), ("\\l", "db1", 160000, 1)]
+    assert rows[0][headers.index("Mean ms")] == 128.125
+    assert rows[0][-3:] == (4, 8, 12)
+    assert status == "2 commands"
@@ -2,10 +2,12 @@
 # -*- coding: utf-8 -*-
 
 import pytest
-from dbutils import dbtest, POSTGRES_USER, SERVER_VERSION, foreign_db_environ, fdw_test
+from dbutils import dbtest, db_connection, POSTGRES_USER, SERVER_VERSION, TEST_DB_NAME, foreign_db_environ, fdw_test
 import itertools
 import locale
 
+from pgspecial import dbcommands
+
 objects_listing_headers = ["Schema", "Name", "Type", "Owner", "Size", "Description"]
 
 # note: technically, this is the database encoding, not the client
@@ -309,6 +311,69 @@ def test_slash_d_table_2_in_schema(executor):
     assert results == expected
 
 
+@dbtest
+@pytest.mark.skipif(SERVER_VERSION < dbcommands.COMPOSITE_DESCRIBE_MIN_VERSION, reason="Composite describe not supported.")
+def test_slash_d_composite_matches_sequential(connection):
+    """The single round-trip describe agrees with the query-per-footer one."""
+    cur = connection.cursor()
+    cur.execute(
+        """SELECT c.oid, n.nspname FROM pg_catalog.pg_class c
+           JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+           WHERE n.nspname IN ('public', 'schema1', 'schema2', 'schema3')"""
+    )
+    for oid, nspname in cur.fetchall():
+        for verbose in (False, True):
+            composite = dbcommands._fetch_table_details(cur, oid, verbose)
+            sequential = dbcommands._fetch_table_details_sequential(cur, oid, verbose)
+            composite["seq_values"] = sequential["seq_values"] = (1, 0, False)
+            assert dbcommands._format_table_details(nspname, composite, verbose) == dbcommands._format_table_details(
+                nspname, sequential, verbose
+            )
+
+
+@dbtest
+@pytest.mark.parametrize("prepare_threshold,prepared", [(5, True), (None, False)])
+def test_slash_d_prepared_statements(connection, prepare_threshold, prepared):
+    """Catalog queries are prepared server-side unless the connection opts out."""
+    conn = db_connection(TEST_DB_NAME)
+    conn.prepare_threshold = prepare_threshold
+    try:
+        with conn.cursor() as cur:
+            dbcommands.describe_table_details(cur, "tbl1", False)
+            cur.execute("SELECT count(*) FROM pg_catalog.pg_prepared_statements")
+            assert (cur.fetchone()[0] > 0) == prepared
+    finally:
+        conn.close()
+
+
+@dbtest
+@pytest.mark.skipif(SERVER_VERSION < dbcommands.COMPOSITE_DESCRIBE_MIN_VERSION, reason="One query per footer before PostgreSQL 12")
+@pytest.mark.parametrize("command", ["\\d tbl1", "\\d+ tbl1", "\\d+ schema1.s1_*"])
+def test_slash_d_round_trips(connection, command):
+    """\\d finds the relations with one query and describes them with one more."""
+    from pgspecial.main import PGSpecial
+
+    stats = []
+    pgspecial = PGSpecial()
+    pgspecial.command_hook = stats.append
+    pgspecial.execute(connection.cursor(), command)
+    assert stats[-1].n_queries == 2
+
+
+@dbtest
+def test_slash_d_wildcard_batched(connection, monkeypatch):
+    """Describing many relations at once matches describing them one by one."""
+    monkeypatch.setattr(dbcommands, "DESCRIBE_BATCH_SIZE", 2)
+    cur = connection.cursor()
+    cur.execute("SELECT c.oid, c.relname FROM pg_catalog.pg_class c WHERE c.relnamespace = 'schema1'::regnamespace ORDER BY 2")
+    relations = cur.fetchall()
+    expected = [dbcommands.describe_one_table_details(cur, "schema1", relname, oid, True) for oid, relname in relations]
+
+    results = dbcommands.describe_table_details(cur, "schema1.*", True)
+    assert len(results) > 2
+    assert results == expected
+
+
 @dbtest
 def test_slash_dn(executor):
     """List all schemas."""
@@ -480,6 +545,257 @@ def test_slash_dt(executor):
     assert results == expected
 
 
+@dbtest
+def test_slash_dt_reuses_query_template(executor):
+    from pgspecial.templates import query_templates
+
+    first = executor(r"\dt")
+    hits = query_templates.hits
+    assert executor(r"\dt") == first
+    assert query_templates.hits == hits + 1
+
+
+@dbtest
+@pytest.mark.parametrize(
+    "pattern,rows,schema_match",
+    [
+        ('"Inh1"', [("public", "Inh1", "table", POSTGRES_USER)], None),
+        ("inh1", [], None),
+        ("schema1.tbl2", [("schema1", "tbl2", "table", POSTGRES_USER)], "="),
+        ("SCHEMA1.s1_tbl1", [("schema1", "s1_tbl1", "table", POSTGRES_USER)], "="),
+        ("schema*.tbl2", [("schema1", "tbl2", "table", POSTGRES_USER), ("schema2", "tbl2", "table", POSTGRES_USER)], "prefix"),
+    ],
+)
+def test_slash_dt_literal_pattern(executor, pattern, rows, schema_match):
+    from pgspecial.templates import query_templates
+
+    results = executor(r"\dt " + pattern)
+    assert results[1] == rows
+    assert ("list_objects", SERVER_VERSION, False, False, schema_match, "=") in query_templates.templates
+
+
+class ExplainCursor(object):
+    """Runs EXPLAIN for the statements a handler executes."""
+
+    def __init__(self, cur):
+        self._cur = cur
+
+    def __getattr__(self, name):
+        return getattr(self._cur, name)
+
+    def __iter__(self):
+        return iter(self._cur)
+
+    def execute(self, query, params=None, **kwargs):
+        from psycopg.sql import SQL, Composable
+
+        query = SQL("EXPLAIN ") + query if isinstance(query, Composable) else "EXPLAIN " + query
+        self._cur.execute(query, params)
+        return self
+
+
+@dbtest
+@pytest.mark.parametrize(
+    "command,condition",
+    [
+        (r"\dt tbl1", "relname = 'tbl1'::name"),
+        (r"\dt tbl*", "(relname >= 'tbl'::name) AND (relname < 'tbm'::name)"),
+        (r"\dv schema1.s1_vw1", "relname = 's1_vw1'::name"),
+        (r"\df func1", "proname = 'func1'::name"),
+        (r"\df schema1.s1_func*", "(proname >= 's1_func'::name) AND (proname < 's1_fund'::name)"),
+        (r"\dn schema1", "nspname = 'schema1'::name"),
+        (r"\dD gender_t", "typname = 'gender_t'::name"),
+        (r"\dp tbl*", "(relname >= 'tbl'::name) AND (relname < 'tbm'::name)"),
+    ],
+)
+def test_name_pattern_uses_index(connection, command, condition):
+    from pgspecial.main import PGSpecial
+
+    cur = connection.cursor()
+    cur.execute("SET enable_seqscan = off")
+    try:
+        ((_, rows, _, _),) = PGSpecial().execute(ExplainCursor(cur), command)
+        plan = "\n".join(row[0] for row in rows)
+    finally:
+        cur.execute("RESET enable_seqscan")
+    assert "Index Cond: (" + condition in plan or "Index Cond: ((" + condition in plan, plan
+
+
+@dbtest
+def test_slash_dt_catalog_cache(connection):
+    from pgspecial.catalogcache import CatalogCache
+    from pgspecial.main import CommandNotFound, PGSpecial
+
+    pgspecial = PGSpecial()
+    pgspecial.catalog_cache = cache = CatalogCache()
+    cur = connection.cursor()
+
+    first = pgspecial.execute(cur, "\\dt")
+    assert pgspecial.execute(cur, "\\dt") == first
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    with pytest.raises(CommandNotFound):
+        pgspecial.execute(cur, "create table cached_tbl (a int)")
+    cur.execute("create table cached_tbl (a int)")
+    try:
+        assert len(pgspecial.execute(cur, "\\dt")[0][1]) == len(first[0][1]) + 1
+        assert cache.misses == 2
+
+        # Hits aren't checked with the server: changes made outside
+        # PGSpecial.execute are only seen after clear().
+        cur.execute("drop table cached_tbl")
+        assert len(pgspecial.execute(cur, "\\dt")[0][1]) == len(first[0][1]) + 1
+        cache.clear()
+        assert pgspecial.execute(cur, "\\dt") == first
+        assert cache.misses == 3
+    finally:
+        cur.execute("drop table if exists cached_tbl")
+
+
+@dbtest
+def test_catalog_cache_comment(connection):
+    """COMMENT ON changes the descriptions shown by the cached listings."""
+    from pgspecial.catalogcache import CatalogCache
+    from pgspecial.main import CommandNotFound, PGSpecial
+
+    pgspecial = PGSpecial()
+    pgspecial.catalog_cache = cache = CatalogCache()
+    cur = connection.cursor()
+    cur.execute("create type cached_type as (a int)")
+    try:
+        ((_, rows, _, _),) = pgspecial.execute(cur, "\\dT cached_type")
+        assert rows[0][2] is None
+        for sql in ("comment on type cached_type is 'first'", "comment on type cached_type is 'second'"):
+            with pytest.raises(CommandNotFound):
+                pgspecial.execute(cur, sql)
+            cur.execute(sql)
+            ((_, rows, _, _),) = pgspecial.execute(cur, "\\dT cached_type")
+            assert rows[0][2] == sql.split("'")[1]
+        assert cache.hits == 0
+    finally:
+        cur.execute("drop type cached_type")
+
+
+@dbtest
+def test_catalog_cache_search_path(connection):
+    from pgspecial.catalogcache import CatalogCache
+    from pgspecial.main import CommandNotFound, PGSpecial
+
+    pgspecial = PGSpecial()
+    pgspecial.catalog_cache = CatalogCache()
+    cur = connection.cursor()
+    first = pgspecial.execute(cur, "\\dt")
+    try:
+        with pytest.raises(CommandNotFound):
+            pgspecial.execute(cur, "set search_path to schema1")
+        cur.execute("set search_path to schema1")
+        assert pgspecial.execute(cur, "\\dt") != first
+    finally:
+        cur.execute("reset search_path")
+
+
+@dbtest
+def test_catalog_cache_max_age(connection, monkeypatch):
+    import time
+    from pgspecial.catalogcache import CatalogCache
+    from pgspecial.main import PGSpecial
+
+    pgspecial = PGSpecial()
+    pgspecial.catalog_cache = cache = CatalogCache(max_age=60)
+    cur = connection.cursor()
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now)
+    pgspecial.execute(cur, "\\dn")
+    pgspecial.execute(cur, "\\dn")
+    now += 61
+    pgspecial.execute(cur, "\\dn")
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+@dbtest
+def test_catalog_cache_skips_data(connection):
+    """Sequence values and sizes aren't served from the cache."""
+    from pgspecial.catalogcache import CatalogCache
+    from pgspecial.main import PGSpecial
+
+    pgspecial = PGSpecial()
+    pgspecial.catalog_cache = cache = CatalogCache()
+    cur = connection.cursor()
+    cur.execute("create sequence cached_seq")
+    try:
+        ((_, rows, _, _),) = pgspecial.execute(cur, "\\d cached_seq")
+        assert rows[0][2] == 1
+        cur.execute("select nextval('cached_seq'), nextval('cached_seq')")
+        ((_, rows, _, _),) = pgspecial.execute(cur, "\\d cached_seq")
+        assert rows[0][2] == 2
+        assert (cache.hits, cache.misses) == (0, 2)
+
+        pgspecial.execute(cur, "\\dt+")
+        pgspecial.execute(cur, "\\dt+")
+        assert (cache.hits, cache.misses) == (0, 2)
+    finally:
+        cur.execute("drop sequence cached_seq")
+
+
+@dbtest
+@pytest.mark.parametrize("page_size", [1, 2, 5, 100])
+def test_slash_dt_paginated(connection, page_size):
+    from pgspecial.main import PGSpecial
+
+    pgspecial = PGSpecial()
+    cur = connection.cursor()
+    ((_, rows, headers, _),) = pgspecial.execute(cur, "\\dt+")
+    expected = list(rows)
+
+    pgspecial.listing_page_size = page_size
+    ((title, rows, paged_headers, status),) = pgspecial.execute(cur, "\\dt+")
+    assert list(rows) == expected
+    assert paged_headers == headers
+    assert status is None
+    # The listing was read from a cursor, closed at the end.
+    cur.execute("select count(*) from pg_catalog.pg_cursors where name like 'pgspecial_listing_%'")
+    assert cur.fetchone() == (0,)
+
+
+@dbtest
+def test_slash_dt_paginated_runs_once(connection):
+    """The pages are fetched from one cursor instead of running the listing
+    again for each of them."""
+    from pgspecial.main import PGSpecial
+
+    class RecordingCursor(object):
+        def __init__(self, cur):
+            self.cur = cur
+            self.queries = []
+
+        def __getattr__(self, name):
+            return getattr(self.cur, name)
+
+        def execute(self, query, params=None, **kwargs):
+            self.queries.append(query if isinstance(query, str) else query.as_string(self.cur))
+            return self.cur.execute(query, params, **kwargs)
+
+    pgspecial = PGSpecial()
+    pgspecial.listing_page_size = 2
+    cur = RecordingCursor(connection.cursor())
+    ((title, rows, headers, status),) = pgspecial.execute(cur, "\\dt")
+    rows = iter(rows)
+    assert next(rows)[1] == "Inh1"
+    assert [query.split()[0] for query in cur.queries] == ["DECLARE", "FETCH"]
+    queries = cur.queries = []
+    assert [row[1] for row in rows] == ["inh2", "tbl1", "tbl2", "tbl3"]
+    assert all(query.startswith("FETCH FORWARD 2 FROM ") for query in queries[:-1])
+    assert queries[-1].startswith("CLOSE ")
+
+    # A listing that isn't read to the end closes its cursor too.
+    ((title, rows, headers, status),) = pgspecial.execute(cur, "\\dt")
+    rows = iter(rows)
+    next(rows)
+    rows.close()
+    cur.execute("select count(*) from pg_catalog.pg_cursors where name like 'pgspecial_listing_%'")
+    assert cur.fetchone() == (0,)
+
+
 @dbtest
 def test_slash_dt_verbose(executor):
     """List all tables in public schema in verbose mode."""
@@ -498,6 +814,126 @@ def test_slash_dt_verbose(executor):
     assert results == expected
 
 
+@dbtest
+def test_slash_dt_verbose_approximate(connection):
+    from pgspecial.main import PGSpecial
+
+    pgspecial = PGSpecial()
+    pgspecial.approximate_sizes = True
+    cur = connection.cursor()
+    cur.execute("create table never_analyzed(a int)")
+    try:
+        cur.execute('analyze tbl1, tbl2, tbl3, "Inh1", inh2')
+        ((title, rows, headers, status),) = pgspecial.execute(cur, "\\dt+")
+        assert [row[:2] + row[4:] for row in rows] == [
+            ("public", "Inh1", "8192 bytes", None),
+            ("public", "inh2", "8192 bytes", None),
+            ("public", "never_analyzed", None if SERVER_VERSION >= 140000 else "0 bytes", None),
+            ("public", "tbl1", "8192 bytes", None),
+            ("public", "tbl2", "8192 bytes", None),
+            ("public", "tbl3", "0 bytes", None),
+        ]
+        assert headers == objects_listing_headers
+        assert status == "SELECT 6 (sizes are estimates)"
+    finally:
+        cur.execute("drop table never_analyzed")
+
+
+@dbtest
+@pytest.mark.parametrize("autocommit", [True, False])
+@pytest.mark.parametrize("page_size", [None, 5])
+def test_slash_dt_size_timeout(connection, autocommit, page_size):
+    from pgspecial.main import PGSpecial
+
+    pgspecial = PGSpecial()
+    pgspecial.size_timeout = 0.2
+    # The first page is fetched within the timeout.
+    pgspecial.listing_page_size = page_size
+    # pg_table_size waits for the lock held by the other session, the
+    # estimates only read pg_class.
+    with db_connection(TEST_DB_NAME) as locker:
+        locker.autocommit = False
+        locker.execute("lock table tbl2 in access exclusive mode")
+        connection.autocommit = autocommit
+        cur = connection.cursor()
+        try:
+            ((title, rows, headers, status),) = pgspecial.execute(cur, "\\dt+ tbl*")
+            assert [row[1] for row in rows] == ["tbl1", "tbl2", "tbl3"]
+            assert status == ("Sizes are estimates." if page_size else "SELECT 3 (sizes are estimates)")
+            cur.execute("select 1")
+            assert cur.fetchall() == [(1,)]
+        finally:
+            connection.rollback()
+            connection.autocommit = True
+        locker.rollback()
+
+    ((title, rows, headers, status),) = pgspecial.execute(cur, "\\dt+ tbl*")
+    assert [row[1] for row in rows] == ["tbl1", "tbl2", "tbl3"]
+    assert status == (None if page_size else "SELECT 3")
+
+
+@dbtest
+@pytest.mark.parametrize("autocommit", [True, False])
+def test_command_timeout(connection, autocommit):
+    from pgspecial.main import PGSpecial
+
+    pgspecial = PGSpecial()
+    pgspecial.command_timeout = 0.2
+    with db_connection(TEST_DB_NAME) as locker:
+        locker.autocommit = False
+        locker.execute("lock table tbl2 in access exclusive mode")
+        connection.autocommit = autocommit
+        cur = connection.cursor()
+        try:
+            assert pgspecial.execute(cur, "\\dt+ tbl2") == [(None, None, None, "\\dt timed out after 0.2 s.")]
+            cur.execute("select 1")
+            assert cur.fetchall() == [(1,)]
+        finally:
+            connection.rollback()
+            connection.autocommit = True
+        locker.rollback()
+
+    ((title, rows, headers, status),) = pgspecial.execute(cur, "\\dt+ tbl2")
+    assert [row[1] for row in rows] == ["tbl2"]
+    assert status == "SELECT 1"
+
+
+@dbtest
+def test_command_timeout_registered_commands(connection):
+    """Registered commands only run under command_timeout if they opt in."""
+    from pgspecial.main import PGSpecial
+
+    def vacuum(cur, pattern, verbose):
+        # Can't run in a transaction block.
+        cur.execute("VACUUM tbl1")
+        return [(None, None, None, cur.statusmessage)]
+
+    def sleep(cur, pattern, verbose):
+        cur.execute("SELECT pg_catalog.pg_sleep(5)")
+        return [(None, None, None, cur.statusmessage)]
+
+    pgspecial = PGSpecial()
+    pgspecial.command_timeout = 0.2
+    pgspecial.register(vacuum, "\\vacuum", "\\vacuum", "Vacuum tbl1.")
+    pgspecial.register(sleep, "\\sleep", "\\sleep", "Sleep.", timed=True)
+    cur = connection.cursor()
+    assert pgspecial.execute(cur, "\\vacuum") == [(None, None, None, "VACUUM")]
+    assert pgspecial.execute(cur, "\\sleep") == [(None, None, None, "\\sleep timed out after 0.2 s.")]
+
+
+@dbtest
+def test_slash_l_verbose_approximate(connection):
+    from pgspecial.main import PGSpecial
+
+    pgspecial = PGSpecial()
+    pgspecial.approximate_sizes = True
+    ((title, rows, headers, status),) = pgspecial.execute(connection.cursor(), "\\l+")
+    sizes = {row[0]: row[6] for row in rows}
+    assert sizes[TEST_DB_NAME].endswith(("kB", "MB"))
+    assert sizes["postgres"] is None
+    assert status.endswith("(sizes are estimates)")
+
+
 @dbtest
 def test_slash_dv(executor):
     """List all views in public schema."""
@@ -737,6 +1173,19 @@ def test_slash_dF_verbose(executor):
     assert results == [None, None, None, 'Did not find any results for pattern "jap".']
 
 
+@dbtest
+def test_slash_dF_verbose_command_timeout(connection):
+    from pgspecial.main import PGSpecial
+
+    pgspecial = PGSpecial()
+    cur = connection.cursor()
+    expected = [(title, list(rows), headers, status) for title, rows, headers, status in pgspecial.execute(cur, "\\dF+ english|simple")]
+    assert [rows[0] for _, rows, _, _ in expected] == [("asciihword", "simple"), ("asciihword", "english_stem")]
+
+    pgspecial.command_timeout = 5
+    assert pgspecial.execute(cur, "\\dF+ english|simple") == expected
+
+
 @dbtest
 def test_slash_db(executor):
     """List all tablespaces."""
@@ -971,6 +1420,20 @@ def test_slash_h_alias(executor):
     assert results[3] == h_results[3]
 
 
+@dbtest
+def test_slash_h_partial(executor):
+    title, rows, headers, status = executor(r"\h alter tab")
+    assert [topic for topic, _ in rows[:3]] == ["ALTER TABLE", "ALTER TABLESPACE", "ALTER FOREIGN TABLE"]
+    assert headers == ["Command", "Description"]
+
+    results = executor(r"\h create mat")
+    assert results[1][0][0] == "CREATE MATERIALIZED VIEW"
+
+    # A single match shows its help.
+    assert executor(r"\h start transact")[3] == executor(r"\h START TRANSACTION")[3]
+    assert executor(r"\h zzz")[3].startswith('No help available for "zzz"')
+
+
 @dbtest
 def test_slash_copy_to_tsv(executor, tmpdir):
     filepath = tmpdir.join("pycons.tsv")
@@ -1006,6 +1469,29 @@ def test_slash_copy_to_csv(executor, tmpdir):
     assert "," in contents
 
 
+@dbtest
+def test_slash_copy_file_with_redirected_stdio(executor, connection, tmpdir, monkeypatch):
+    """Copies to and from files don't touch stdin and stdout."""
+    import contextlib
+    import io
+    import sys
+
+    filepath = tmpdir.join("redirected.csv")
+    cur = connection.cursor()
+    cur.execute("CREATE TABLE copy_redirected (id int, city text)")
+    monkeypatch.setattr(sys, "stdin", io.StringIO())
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            executor(r"\copy (SELECT 1, 'Montréal') TO '{0}' WITH csv".format(filepath))
+            assert filepath.read_text("utf-8") == "1,Montréal\n"
+            result = executor(r"\copy copy_redirected FROM '{0}' WITH csv".format(filepath))
+            assert result[3].startswith("COPY 1 (")
+        cur.execute("SELECT id, city FROM copy_redirected")
+        assert cur.fetchall() == [(1, "Montréal")]
+    finally:
+        cur.execute("DROP TABLE copy_redirected")
+
+
 @dbtest
 def test_slash_copy_from_csv(executor, connection, tmpdir):
     filepath = tmpdir.join("tbl1.csv")
@@ -1017,6 +1503,332 @@ def test_slash_copy_from_csv(executor, connection, tmpdir):
     assert row[1] == "elephant"
 
 
+@dbtest
+@pytest.mark.parametrize("buffer_size", [None, 7])
+def test_slash_copy_from_buffered(connection, tmpdir, buffer_size):
+    from pgspecial.main import PGSpecial
+
+    pgspecial = PGSpecial()
+    pgspecial.copy_buffer_size = buffer_size
+    cur = connection.cursor()
+    filepath = tmpdir.join("buffered.csv")
+    lines = ["{},Montréal {}\n".format(i, i) for i in range(100, 150)]
+    filepath.write_text("".join(lines), "utf-8")
+
+    cur.execute("CREATE TEMP TABLE copy_buffered (id int, city text)")
+    try:
+        ((_, _, _, status),) = pgspecial.execute(cur, r"\copy copy_buffered FROM '{0}' WITH csv".format(filepath))
+        assert status.startswith("COPY 50 (")
+        assert "{} bytes in ".format(len("".join(lines).encode("utf-8"))) in status
+        cur.execute("SELECT id, city FROM copy_buffered ORDER BY id")
+        assert cur.fetchall() == [(i, "Montréal {}".format(i)) for i in range(100, 150)]
+    finally:
+        cur.execute("DROP TABLE copy_buffered")
+
+
+@dbtest
+@pytest.mark.parametrize("rows", [0, 50])
+def test_slash_copy_from_mapped_file(executor, connection, tmpdir, monkeypatch, rows):
+    from pgspecial import iocommands
+
+    if rows:
+
+        def read_loop(*args):
+            raise AssertionError("non-empty regular files are memory-mapped")
+
+        monkeypatch.setattr(iocommands, "_copy_from_file", read_loop)
+    filepath = tmpdir.join("mapped.csv")
+    filepath.write_text("".join("{},Montréal {}\n".format(i, i) for i in range(rows)), "utf-8")
+
+    cur = connection.cursor()
+    cur.execute("CREATE TABLE copy_mapped (id int, city text)")
+    try:
+        result = executor(r"\copy copy_mapped FROM '{0}' WITH csv".format(filepath))
+        assert result[3].startswith("COPY {} (".format(rows))
+        cur.execute("SELECT id, city FROM copy_mapped ORDER BY id")
+        assert cur.fetchall() == [(i, "Montréal {}".format(i)) for i in range(rows)]
+    finally:
+        cur.execute("DROP TABLE copy_mapped")
+
+
+@dbtest
+@pytest.mark.parametrize(
+    "options",
+    ["WITH (FORMAT csv, HEADER, PARALLEL 3)", "WITH (PARALLEL 4, FORMAT csv, HEADER true)", "WITH csv header PARALLEL 8"],
+)
+def test_slash_copy_from_parallel(executor, connection, tmpdir, options):
+    filepath = tmpdir.join("parallel.csv")
+    lines = ["id,city\n"] + ["{},Montréal {}\n".format(i, i) for i in range(1000)]
+    filepath.write_text("".join(lines), "utf-8")
+
+    cur = connection.cursor()
+    cur.execute("CREATE TABLE copy_parallel (id int, city text)")
+    try:
+        result = executor(r"\copy copy_parallel FROM '{0}' {1}".format(filepath, options))
+        assert result[3].startswith("COPY 1000 (")
+        cur.execute("SELECT id, city FROM copy_parallel ORDER BY id")
+        assert cur.fetchall() == [(i, "Montréal {}".format(i)) for i in range(1000)]
+    finally:
+        cur.execute("DROP TABLE copy_parallel")
+
+
+@dbtest
+def test_slash_copy_from_parallel_csv_multiline(executor, connection, tmpdir):
+    filepath = tmpdir.join("multiline.csv")
+    rows = [(i, "Montréal\n{}".format(i) if i % 2 else 'say "hi" {}'.format(i)) for i in range(1000)]
+    filepath.write_text("".join('{},"{}"\n'.format(i, city.replace('"', '""')) for i, city in rows), "utf-8")
+
+    cur = connection.cursor()
+    cur.execute("CREATE TABLE copy_parallel (id int, city text)")
+    try:
+        result = executor(r"\copy copy_parallel FROM '{0}' WITH (FORMAT csv, PARALLEL 4)".format(filepath))
+        assert result[3].startswith("COPY 1000 (")
+        cur.execute("SELECT id, city FROM copy_parallel ORDER BY id")
+        assert cur.fetchall() == rows
+    finally:
+        cur.execute("DROP TABLE copy_parallel")
+
+
+@dbtest
+def test_slash_copy_from_parallel_partial_failure(executor, connection, tmpdir):
+    filepath = tmpdir.join("partial.csv")
+    filepath.write_text("".join("{}\n".format(i) for i in range(1000)), "utf-8")
+
+    cur = connection.cursor()
+    cur.execute("CREATE TABLE copy_parallel (id int CHECK (id < 900))")
+    try:
+        with pytest.raises(Exception) as error:
+            executor(r"\copy copy_parallel FROM '{0}' WITH (FORMAT csv, PARALLEL 2)".format(filepath))
+        message = str(error.value)
+        assert "failed for 1 of 2 slices" in message
+        assert "copy_parallel_id_check" in message
+        assert "These slices were committed and are in the table: bytes 0-" in message
+        cur.execute("SELECT count(*) FROM copy_parallel")
+        assert "({} rows)".format(cur.fetchone()[0]) in message
+    finally:
+        cur.execute("DROP TABLE copy_parallel")
+
+
+@dbtest
+def test_slash_copy_from_parallel_session_settings(executor, connection, tmpdir):
+    """The slices are loaded with the session's search_path and encoding."""
+    filepath = tmpdir.join("latin1.csv")
+    filepath.write_binary("".join("{},Montréal {}\n".format(i, i) for i in range(1000)).encode("latin-1"))
+
+    cur = connection.cursor()
+    cur.execute("CREATE TABLE copy_parallel (id int, city text)")
+    cur.execute("CREATE TABLE schema1.copy_parallel (id int, city text)")
+    try:
+        cur.execute("SET search_path TO schema1, public")
+        cur.execute("SET client_encoding TO 'LATIN1'")
+        result = executor(r"\copy copy_parallel FROM '{0}' WITH (FORMAT csv, PARALLEL 4)".format(filepath))
+        assert result[3].startswith("COPY 1000 (")
+        cur.execute("RESET client_encoding")
+        cur.execute("SELECT id, city FROM schema1.copy_parallel ORDER BY id")
+        assert cur.fetchall() == [(i, "Montréal {}".format(i)) for i in range(1000)]
+        cur.execute("SELECT count(*) FROM public.copy_parallel")
+        assert cur.fetchone()[0] == 0
+    finally:
+        cur.execute("RESET client_encoding")
+        cur.execute("RESET search_path")
+        cur.execute("DROP TABLE public.copy_parallel, schema1.copy_parallel")
+
+
+@dbtest
+@pytest.mark.parametrize("direction", ["FROM", "TO"])
+def test_slash_copy_parallel_temp_table(executor, connection, tmpdir, direction):
+    filepath = tmpdir.join("temp.csv")
+    filepath.write_text("1\n2\n", "utf-8")
+
+    cur = connection.cursor()
+    cur.execute("CREATE TEMP TABLE copy_parallel (id int)")
+    try:
+        with pytest.raises(Exception, match="temporary tables"):
+            executor(r"\copy copy_parallel {0} '{1}' WITH (PARALLEL 2)".format(direction, filepath))
+    finally:
+        cur.execute("DROP TABLE copy_parallel")
+
+
+@dbtest
+@pytest.mark.parametrize(
+    "serial_options,parallel_options",
+    [
+        ("WITH (FORMAT csv, HEADER)", "WITH (FORMAT csv, HEADER, PARALLEL 4)"),
+        ("", "PARALLEL 3"),
+        ("", "WITH (PARALLEL 2)"),
+    ],
+)
+def test_slash_copy_to_parallel(executor, connection, tmpdir, serial_options, parallel_options):
+    cur = connection.cursor()
+    cur.execute("CREATE TABLE copy_parallel_to AS SELECT i AS id, 'Montréal ' || i AS city FROM generate_series(1, 5000) i")
+    try:
+        serial = tmpdir.join("serial.out")
+        parallel = tmpdir.join("parallel.out")
+        executor(r"\copy copy_parallel_to (city, id) TO '{0}' {1}".format(serial, serial_options))
+        result = executor(r"\copy copy_parallel_to (city, id) TO '{0}' {1}".format(parallel, parallel_options))
+        assert result[3].startswith("COPY 5000 (")
+        assert parallel.read_binary() == serial.read_binary()
+    finally:
+        cur.execute("DROP TABLE copy_parallel_to")
+
+
+@dbtest
+def test_slash_copy_to_parallel_search_path(executor, connection, tmpdir):
+    cur = connection.cursor()
+    cur.execute("CREATE TABLE copy_parallel_to (id int)")
+    cur.execute("CREATE TABLE schema1.copy_parallel_to AS SELECT i AS id FROM generate_series(1, 5000) i")
+    try:
+        cur.execute("SET search_path TO schema1, public")
+        parallel = tmpdir.join("parallel.out")
+        result = executor(r"\copy copy_parallel_to TO '{0}' WITH (PARALLEL 4)".format(parallel))
+        assert result[3].startswith("COPY 5000 (")
+        assert parallel.read_text("utf-8") == "".join("{}\n".format(i) for i in range(1, 5001))
+    finally:
+        cur.execute("RESET search_path")
+        cur.execute("DROP TABLE public.copy_parallel_to, schema1.copy_parallel_to")
+
+
+@dbtest
+@pytest.mark.parametrize(
+    "file_name,options,opener",
+    [
+        ("cities.csv.gz", "WITH csv", "gzip"),
+        ("cities.csv.bz2", "WITH csv", "bz2"),
+        ("cities.csv", "WITH (FORMAT csv, COMPRESSION gzip)", "gzip"),
+        ("cities.csv.gz", "WITH (FORMAT csv, COMPRESSION none)", None),
+        ("cities.csv.gz", "WITH (FORMAT csv, PARALLEL 3)", "gzip"),
+    ],
+)
+def test_slash_copy_compressed(executor, connection, tmpdir, file_name, options, opener):
+    import bz2
+    import gzip
+
+    cur = connection.cursor()
+    cur.execute("CREATE TABLE copy_compressed AS SELECT i AS id, 'Montréal ' || i AS city FROM generate_series(1, 3000) i")
+    try:
+        filepath = tmpdir.join(file_name)
+        executor(r"\copy copy_compressed TO '{0}' {1}".format(filepath, options))
+        data = filepath.read_binary()
+        if opener:
+            data = {"gzip": gzip, "bz2": bz2}[opener].decompress(data)
+        assert data.decode("utf-8").splitlines()[:2] == ["1,Montréal 1", "2,Montréal 2"]
+
+        cur.execute("TRUNCATE copy_compressed")
+        result = executor(r"\copy copy_compressed FROM '{0}' {1}".format(filepath, options.replace(", PARALLEL 3", "")))
+        assert result[3].startswith("COPY 3000 (")
+    finally:
+        cur.execute("DROP TABLE copy_compressed")
+
+
+@dbtest
+@pytest.mark.parametrize(
+    "file_name,options", [("progress.csv", "WITH csv"), ("progress.csv.gz", "WITH csv"), ("progress.csv", "PARALLEL 3")]
+)
+def test_slash_copy_progress(connection, tmpdir, monkeypatch, file_name, options):
+    from pgspecial import iocommands
+    from pgspecial.main import PGSpecial
+
+    monkeypatch.setattr(iocommands, "COPY_PROGRESS_INTERVAL", 0)
+    reports = []
+    pgspecial = PGSpecial()
+    pgspecial.copy_buffer_size = 4096
+    pgspecial.copy_progress = reports.append
+    pgspecial.copy_progress_poll = True
+    cur = connection.cursor()
+    cur.execute("CREATE TABLE copy_progress AS SELECT i AS id, 'Montréal ' || i AS city FROM generate_series(1, 2000) i")
+    try:
+        filepath = tmpdir.join(file_name)
+        pgspecial.execute(cur, r"\copy copy_progress TO '{0}' {1}".format(filepath, options))
+        assert reports[-1].done and reports[-1].rows == 2000 and reports[-1].percent is None
+        assert len(reports) > 2
+        assert [r.bytes for r in reports] == sorted(r.bytes for r in reports)
+
+        del reports[:]
+        pgspecial.execute(cur, r"\copy copy_progress FROM '{0}' {1}".format(filepath, options))
+        assert reports[-1].done and reports[-1].rows == 2000 and reports[-1].percent == 100
+        assert reports[-1].rate > 0
+        assert len(reports) > 2
+        assert [r.percent for r in reports] == sorted(r.percent for r in reports)
+    finally:
+        cur.execute("DROP TABLE copy_progress")
+
+
+@dbtest
+@pytest.mark.parametrize("file_name", ["binary.dat", "binary.dat.gz"])
+def test_slash_copy_binary_roundtrip(executor, connection, tmpdir, file_name):
+    cur = connection.cursor()
+    cur.execute(
+        """CREATE TABLE copy_binary AS
+           SELECT i AS id, 'Montréal ' || i AS city, i * 1.5 AS score, now() AS ts
+           FROM generate_series(1, 3000) i"""
+    )
+    try:
+        filepath = tmpdir.join(file_name)
+        executor(r"\copy copy_binary TO '{0}' WITH (FORMAT binary)".format(filepath))
+        cur.execute("CREATE TABLE copy_binary_target (LIKE copy_binary)")
+        result = executor(r"\copy copy_binary_target FROM '{0}' WITH (FORMAT binary)".format(filepath))
+        assert result[3].startswith("COPY 3000 (")
+        cur.execute("SELECT count(*) FROM (TABLE copy_binary EXCEPT TABLE copy_binary_target) d")
+        assert cur.fetchone()[0] == 0
+    finally:
+        cur.execute("DROP TABLE IF EXISTS copy_binary, copy_binary_target")
+
+
+@dbtest
+@pytest.mark.parametrize(
+    "source,target,options",
+    [
+        ("copy_source", "copy_target", ""),
+        ("copy_source (city, id)", "copy_target (city, id)", "WITH (FORMAT binary)"),
+        ("(SELECT * FROM copy_source WHERE id <= 100)", "copy_target", "WITH (FORMAT csv, HEADER)"),
+    ],
+)
+def test_slash_copy_to_connection(executor, connection, source, target, options):
+    from dbutils import POSTGRES_HOST, POSTGRES_PASSWORD, POSTGRES_PORT
+
+    cur = connection.cursor()
+    cur.execute("CREATE TABLE copy_source AS SELECT i AS id, 'Montréal ' || i AS city FROM generate_series(1, 5000) i")
+    cur.execute("CREATE TABLE copy_target (LIKE copy_source)")
+    try:
+        dsn = f"host={POSTGRES_HOST} port={POSTGRES_PORT} user={POSTGRES_USER} password={POSTGRES_PASSWORD} dbname={TEST_DB_NAME}"
+        result = executor(r"\copy {0} TO CONNECTION '{1}' {2} {3}".format(source, dsn, target, options))
+        cur.execute("SELECT count(*) FROM copy_target")
+        (count,) = cur.fetchone()
+        assert result[3].startswith("COPY {} (".format(count))
+        assert count == (100 if "WHERE" in source else 5000)
+        cur.execute("SELECT count(*) FROM (TABLE copy_target EXCEPT TABLE copy_source) d")
+        assert cur.fetchone()[0] == 0
+    finally:
+        cur.execute("DROP TABLE copy_source, copy_target")
+
+
+@dbtest
+def test_slash_copy_to_connection_target_error(executor, connection):
+    import psycopg
+    from dbutils import POSTGRES_HOST, POSTGRES_PASSWORD, POSTGRES_PORT
+
+    dsn = f"host={POSTGRES_HOST} port={POSTGRES_PORT} user={POSTGRES_USER} password={POSTGRES_PASSWORD} dbname={TEST_DB_NAME}"
+    with pytest.raises(psycopg.errors.UndefinedTable):
+        executor(r"\copy (SELECT generate_series(1, 100000)) TO CONNECTION '{0}' no_such_table".format(dsn))
+    # The session is still usable.
+    assert executor("\\dt tbl1")[1] is not None
+
+
+@dbtest
+def test_slash_copy_to_connection_target_error_cancels_source(executor):
+    """A failed target stops the source instead of reading it to the end."""
+    import psycopg
+    import time
+    from dbutils import POSTGRES_HOST, POSTGRES_PASSWORD, POSTGRES_PORT
+
+    dsn = f"host={POSTGRES_HOST} port={POSTGRES_PORT} user={POSTGRES_USER} password={POSTGRES_PASSWORD} dbname={TEST_DB_NAME}"
+    start = time.perf_counter()
+    with pytest.raises(psycopg.errors.UndefinedTable):
+        executor(r"\copy (SELECT generate_series(1, 1000000000)) TO CONNECTION '{0}' no_such_table".format(dsn))
+    assert time.perf_counter() - start < 10
+    assert executor("\\dt tbl1")[1] is not None
+
+
 @dbtest
 def test_slash_copy_case_insensitive(executor, tmpdir):
     filepath = tmpdir.join("pycons.tsv")
@@ -1124,3 +1936,154 @@ def test_slash_dE_verbose(executor):
         status = "SELECT 1"
         expected = [title, rows, headers, status]
         assert results == expected
+
+
+@dbtest
+def test_async_pgspecial(executor, tmpdir):
+    import asyncio
+    from dbutils import async_db_connection
+    from pgspecial.aio import AsyncPGSpecial
+
+    async def list_nothing(cur, pattern, verbose):
+        await cur.execute("SELECT 1 AS one WHERE false")
+        return [(None, await cur.fetchall(), ["one"], cur.statusmessage)]
+
+    filepath = tmpdir.join("cities.tsv")
+
+    async def run():
+        pgspecial = AsyncPGSpecial()
+        pgspecial.register(list_nothing, "\\nothing", "\\nothing", "List nothing.")
+        async with await async_db_connection(TEST_DB_NAME) as conn:
+            cur = conn.cursor()
+            listings = [await pgspecial.execute(cur, sql) for sql in (r"\dt", r"\d tbl1", r"\df+", r"\d schema1.*")]
+            nothing = await pgspecial.execute(cur, r"\nothing")
+            await pgspecial.execute(cur, r"\copy (SELECT 'Montréal', 'Portland') TO '{0}'".format(filepath))
+            return listings, nothing
+
+    listings, nothing = asyncio.run(run())
+
+    for sql, result in zip((r"\dt", r"\d tbl1", r"\df+", r"\d schema1.*"), listings):
+        expected = executor(sql)
+        assert [tuple(r) for r in result] == [tuple(expected[i : i + 4]) for i in range(0, len(expected), 4)]
+    assert nothing == [(None, [], ["one"], "SELECT 0")]
+    assert filepath.read_text("utf-8") == "Montréal\tPortland\n"
+
+
+@dbtest
+def test_async_pgspecial_size_timeout(connection):
+    import asyncio
+    from dbutils import async_db_connection
+    from pgspecial.aio import AsyncPGSpecial
+
+    async def run():
+        pgspecial = AsyncPGSpecial()
+        pgspecial.size_timeout = 0.2
+        async with await async_db_connection(TEST_DB_NAME) as conn:
+            return await pgspecial.execute(conn.cursor(), r"\dt+ tbl*")
+
+    connection.autocommit = False
+    connection.execute("lock table tbl2 in access exclusive mode")
+    try:
+        ((title, rows, headers, status),) = asyncio.run(run())
+    finally:
+        connection.rollback()
+        connection.autocommit = True
+    assert [row[1] for row in rows] == ["tbl1", "tbl2", "tbl3"]
+    assert status == "SELECT 3 (sizes are estimates)"
+
+
+@dbtest
+def test_command_hook(executor, connection):
+    from pgspecial.main import PGSpecial
+
+    stats = []
+    pgspecial = PGSpecial()
+    pgspecial.command_hook = stats.append
+    cur = connection.cursor()
+    ((title, rows, headers, status),) = pgspecial.execute(cur, "\\dt")
+    assert [tuple(row) for row in rows] == executor("\\dt")[1]
+    pgspecial.execute(cur, "\\x")
+    with pytest.raises(Exception):
+        pgspecial.execute(cur, "\\copy nosuchtable TO STDOUT")
+
+    dt, x, copy = stats
+    assert dt[:3] == ("\\dt", "", False)
+    assert (dt.n_queries, dt.rows, dt.host, dt.server_version) == (1, 5, connection.info.host, SERVER_VERSION)
+    assert dt.bytes_fetched > len("publictbl1table" + POSTGRES_USER)
+    assert dt.elapsed_ms > 0
+    assert isinstance(rows, list)
+    assert (x.command, x.n_queries, x.rows, x.bytes_fetched) == ("\\x", 0, 0, 0)
+    assert (copy.command, copy.n_queries) == ("\\copy", 1)
+
+    # Each result of a generator handler keeps its own rows, and setting
+    # the statement timeout isn't counted as a query.
+    expected = [(title, list(rows), headers, status) for title, rows, headers, status in PGSpecial().execute(cur, "\\dF+ english|simple")]
+    pgspecial.command_timeout = 5
+    assert pgspecial.execute(cur, "\\dF+ english|simple") == expected
+    assert stats[-1].n_queries == 3
+    assert stats[-1].rows == 2 + sum(len(rows) for _, rows, _, _ in expected)
+
+
+@dbtest
+def test_command_hook_paginated(connection):
+    """A paginated listing is still read page by page with a command_hook,
+    which only counts the queries run before its rows are read."""
+    from pgspecial.main import PGSpecial
+
+    stats = []
+    pgspecial = PGSpecial()
+    pgspecial.command_hook = stats.append
+    pgspecial.listing_page_size = 2
+    ((title, rows, headers, status),) = pgspecial.execute(connection.cursor(), "\\dt")
+    # Declaring the cursor and fetching the first page.
+    assert (stats[-1].n_queries, stats[-1].rows) == (2, 2)
+    assert not isinstance(rows, list)
+    assert [row[1] for row in rows] == ["Inh1", "inh2", "tbl1", "tbl2", "tbl3"]
+    assert len(stats) == 1
+
+
+@dbtest
+def test_async_command_hook():
+    import asyncio
+    from dbutils import async_db_connection
+    from pgspecial.aio import AsyncPGSpecial
+    from pgspecial.instrumentation import CommandHistogram
+
+    async def list_one(cur, pattern, verbose):
+        await cur.execute("SELECT 1 AS one")
+        return [(None, await cur.fetchall(), ["one"], cur.statusmessage)]
+
+    async def run():
+        pgspecial = AsyncPGSpecial()
+        pgspecial.register(list_one, "\\one", "\\one", "List one.")
+        pgspecial.command_hook = histogram = CommandHistogram()
+        async with await async_db_connection(TEST_DB_NAME) as conn:
+            cur = conn.cursor()
+            for sql in ("\\one", "\\one", "\\dt tbl1"):
+                await pgspecial.execute(cur, sql)
+        return histogram
+
+    histogram = asyncio.run(run())
+    ((title, rows, headers, status),) = histogram.report()
+    assert {row[0]: row[3:4] + row[9:] for row in rows} == {
+        "\\one": (2, 2, 2, 2),
+        "\\dt": (1, 1, 1, len("publictbl1table" + POSTGRES_USER)),
+    }
+    assert {row[2] for row in rows} == {SERVER_VERSION}
+
+
+def test_async_command_hook_without_cursor():
+    """Commands that don't need a cursor are reported with cur=None."""
+    import asyncio
+    from pgspecial.aio import AsyncPGSpecial
+
+    async def run():
+        stats = []
+        pgspecial = AsyncPGSpecial()
+        pgspecial.command_hook = stats.append
+        ((title, rows, headers, status),) = await pgspecial.execute(None, "\\?")
+        assert rows
+        return stats
+
+    (stats,) = asyncio.run(run())
+    assert (stats.command, stats.pattern, stats.n_queries, stats.rows, stats.host, stats.server_version) == ("\\?", "", 0, 0, None, None)